@@ -0,0 +1,109 @@
+# board_cache.py
+import os
+import threading
+
+from board_journal import apply_record
+
+
+def file_signature(path):
+    """Return (mtime_ns, size) for `path`, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class BoardStateCache:
+    """Read-through cache of the parsed board file.
+
+    The cached state is keyed by the mtime/size of the board file (and of any
+    sidecar files such as the journal). Between invalidations ``get`` returns
+    the cached state without touching the disk; after ``invalidate`` (called
+    by the file watcher) the next ``get`` checks the files and only re-parses
+    them if they actually changed.
+
+    Our own saves prime the cache with ``store`` and confirm it with ``stamp``
+    once the background writer has put the data on disk, so the file watcher
+    seeing our own write does not cause a re-parse.
+
+    When a re-parse picks up someone else's change, the state the board was
+    showing before it is kept until ``take_changes`` hands both states over
+    for diffing (see board_sync.py), or ``mark_synced`` says the board was
+    rebuilt from the file anyway.
+    """
+
+    def __init__(self, path, loader, extra_paths=()):
+        self.path = path
+        self.loader = loader
+        self.paths = [path] + list(extra_paths)
+        self._lock = threading.Lock()
+        self._state = None
+        self._key = None
+        self._stale = True
+        self._synced = None  # State the board last showed, while it is behind the file
+
+    def signature(self):
+        return tuple(file_signature(path) for path in self.paths)
+
+    def get(self):
+        """Return the parsed board, reading the file only if it changed."""
+        with self._lock:
+            # While our own write is in flight (no key yet) the cached state is the newest there is
+            if self._state is not None and (not self._stale or self._key is None):
+                return self._state
+            self._refresh()
+            return self._state
+
+    def _refresh(self):
+        key = self.signature()
+        if self._state is None or key != self._key:
+            if self._state is not None and self._synced is None:
+                self._synced = self._state
+            self._state = self.loader()
+            self._key = key
+            print(f"Board cache refreshed from {self.path}")
+        self._stale = False
+
+    def take_changes(self):
+        """Return (shown state, file state) if the file changed since the board last matched it, else None."""
+        with self._lock:
+            if self._state is not None and self._key is None:
+                return None  # Our own write is still in flight
+            self._refresh()
+            if self._synced is None:
+                return None
+            previous, self._synced = self._synced, None
+            return previous, self._state
+
+    def mark_synced(self):
+        """The board was rebuilt from the cached state; there is nothing left to diff."""
+        with self._lock:
+            self._synced = None
+
+    def store(self, state):
+        """Prime the cache with a state we are about to write ourselves."""
+        with self._lock:
+            # Own the top-level lists so journal records can be applied without touching `state`
+            self._state = dict(state, employees=list(state["employees"]), job_sites=list(state["job_sites"]))
+            self._key = None
+            self._stale = False
+            self._synced = None  # The snapshot we are writing is what the board shows
+
+    def apply(self, record):
+        """Apply a journal record we just appended to the cached state."""
+        with self._lock:
+            if self._state is not None:
+                apply_record(self._state, record)
+                self._key = None
+
+    def stamp(self):
+        """Record the on-disk signature of the state we wrote. Called from the writer thread."""
+        with self._lock:
+            if self._state is not None and self._key is None:
+                self._key = self.signature()
+
+    def invalidate(self):
+        """Mark the cache as possibly out of date, e.g. when the file watcher fires."""
+        with self._lock:
+            self._stale = True
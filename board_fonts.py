@@ -0,0 +1,46 @@
+# board_fonts.py
+import tkinter.font as tkfont
+
+MIN_FONT_SIZE = 8  # Smallest size a zoomed font is shrunk to
+
+# name: (family, size at zoom 1, weight, follows zoom)
+FONT_SPECS = {
+    "employee": ("Helvetica", 14, "bold", True),
+    "hub_title": ("Helvetica", 12, "bold", False),
+    "hub_button": ("Helvetica", 12, "bold", False),
+    "hub_summary": ("Helvetica", 9, "bold", False),
+}
+
+
+class FontRegistry:
+    """Named tkinter Font objects shared by every canvas item of one kind.
+
+    Items are created with ``font=fonts.get(name)``. Tk then refers to the
+    named font, so ``set_scale`` reconfigures a few Font objects and every
+    item using them is redrawn at the new size.
+    """
+
+    def __init__(self, root):
+        self.scale = None
+        self.fonts = {
+            name: tkfont.Font(root=root, family=family, size=size, weight=weight)
+            for name, (family, size, weight, _) in FONT_SPECS.items()
+        }
+
+    def get(self, name):
+        return self.fonts[name]
+
+    def set_scale(self, scale):
+        """Resize the fonts that follow the zoom; returns how many were reconfigured."""
+        if scale == self.scale:
+            return 0
+        self.scale = scale
+        changed = 0
+        for name, (_, size, _, zooms) in FONT_SPECS.items():
+            if not zooms:
+                continue
+            new_size = max(MIN_FONT_SIZE, int(size * scale))
+            if self.fonts[name].cget("size") != new_size:
+                self.fonts[name].configure(size=new_size)
+                changed += 1
+        return changed
@@ -0,0 +1,392 @@
+# board_history.py
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timedelta
+
+from board_sqlite import load_board
+from board_sync import same_value
+from board_serializer import COORD_KEYS
+from board_view import with_legacy_coordinates
+from constants import HISTORY_KEEP_ALL_DAYS, HISTORY_KEEP_DAYS
+
+# Board history is a content-addressed store: every employee and hub record
+# is stored once under the hash of its contents, lists of records are split
+# into blocks that are stored the same way, and a version is just a pointer
+# to a root object naming its blocks. A save that moves one employee adds
+# one employee record, one block and one root; everything else is shared.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY,
+    saved_at TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    root TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS versions_saved_at ON versions(saved_at);
+"""
+
+BLOCK_SIZE = 128  # Records per block; a change rewrites only the block holding it
+POSITION_PRECISION = 2  # Decimals kept of board positions, which pick up float noise from zooming the canvas
+DATE_FORMATS = ("%Y-%m-%d", "%m.%d.%Y", "%m/%d/%Y", "%m-%d-%Y")
+TIME_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+VIEW_KEYS = ("employees", "job_sites", "view", "scale", "canvas_transform", "scroll_x", "scroll_y",
+             "journal_seq")  # Top-level keys that are not stored in a version's meta
+
+
+def history_path_for(board_path):
+    """Return the history store for a board, e.g. output.json -> output.history.db."""
+    return os.path.splitext(board_path)[0] + ".history.db"
+
+
+def parse_when(text, end_of_day=True):
+    """Parse a date or date/time. A bare date means the end of that day (or its start)."""
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            pass
+    for fmt in DATE_FORMATS:
+        try:
+            day = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        return day.replace(hour=23, minute=59, second=59) if end_of_day else day
+    raise ValueError(f"Unrecognized date '{text}', expected e.g. 2025-03-21, 3.21.2025 or '2025-03-21 14:30'")
+
+
+def encode(obj):
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def rounded_position(record):
+    record = dict(record)
+    for key in ("x", "y"):
+        if isinstance(record.get(key), float):
+            record[key] = round(record[key], POSITION_PRECISION)
+    return record
+
+
+def hub_content(job):
+    """A hub record without its canvas data: snap box coords and the canvas ids of its electricians."""
+    job = rounded_position(job)
+    if isinstance(job.get("status"), dict):
+        job["status"] = {key: value for key, value in job["status"].items()
+                         if key != "Electrician" and key not in COORD_KEYS}
+    return job
+
+
+def placement(emp):
+    return emp.get("job_site"), emp.get("box")
+
+
+class BoardHistory:
+    """Deduplicated history of board states in a single SQLite file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._known = set()  # Hashes already stored by this process
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    # -----------------------------------------------------------
+    # Objects
+    # -----------------------------------------------------------
+    def put(self, obj):
+        data = encode(obj)
+        key = hashlib.sha1(data).hexdigest()
+        if key not in self._known:
+            self.conn.execute("INSERT OR IGNORE INTO objects (hash, data) VALUES (?, ?)", (key, zlib.compress(data)))
+            self._known.add(key)
+        return key
+
+    def get(self, key):
+        row = self.conn.execute("SELECT data FROM objects WHERE hash = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(f"History object {key} is missing")
+        return json.loads(zlib.decompress(row[0]))
+
+    def put_list(self, records):
+        hashes = [self.put(record) for record in records]
+        return [self.put(hashes[i:i + BLOCK_SIZE]) for i in range(0, len(hashes), BLOCK_SIZE)]
+
+    def record_hashes(self, blocks):
+        hashes = []
+        for block in blocks:
+            hashes.extend(self.get(block))
+        return hashes
+
+    # -----------------------------------------------------------
+    # Versions
+    # -----------------------------------------------------------
+    def record(self, state, kind="save", when=None):
+        """
+        Store `state` as a new version. Returns the version id, or None if nothing changed.
+
+        Only the board itself is kept: zoom, scroll and canvas coordinates and ids
+        are dropped, so a save that just changed the view is not a new version.
+        """
+        when = when or datetime.now()
+        with self._lock, self.conn:
+            root = self.put({
+                "employees": self.put_list([rounded_position(emp) for emp in state.get("employees", [])]),
+                "job_sites": self.put_list([hub_content(job) for job in state.get("job_sites", [])]),
+                "meta": {key: value for key, value in state.items() if key not in VIEW_KEYS},
+            })
+            latest = self.conn.execute(
+                "SELECT root, saved_at FROM versions WHERE saved_at <= ? ORDER BY saved_at DESC, id DESC LIMIT 1",
+                (when.isoformat(timespec="seconds"),)).fetchone()
+            if latest and latest[0] == root:
+                return None
+            first_today = not latest or latest[1][:10] != when.date().isoformat()
+            cur = self.conn.execute("INSERT INTO versions (saved_at, kind, root) VALUES (?, ?, ?)",
+                                    (when.isoformat(timespec="seconds"), kind, root))
+            version_id = cur.lastrowid
+        if first_today:
+            self.prune()
+        return version_id
+
+    def has_version_on(self, day):
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM versions WHERE substr(saved_at, 1, 10) = ? LIMIT 1",
+                                     (day.isoformat(),)).fetchone() is not None
+
+    def versions(self, start=None, end=None):
+        """Return [(id, saved_at, kind)] between two datetimes (inclusive), oldest first."""
+        start = start.isoformat(timespec="seconds") if start else ""
+        end = end.isoformat(timespec="seconds") if end else "9999"
+        with self._lock:
+            return self.conn.execute(
+                "SELECT id, saved_at, kind FROM versions WHERE saved_at BETWEEN ? AND ? ORDER BY saved_at, id",
+                (start, end)).fetchall()
+
+    def version_at(self, when):
+        """Return (id, saved_at, root) of the newest version saved at or before `when`, or None."""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT id, saved_at, root FROM versions WHERE saved_at <= ? ORDER BY saved_at DESC, id DESC LIMIT 1",
+                (when.isoformat(timespec="seconds"),)).fetchone()
+
+    def board_at(self, when):
+        """What the board looked like at `when` (a full state dict), or None if there is no history yet."""
+        version = self.version_at(when)
+        if version is None:
+            return None
+        with self._lock:
+            root = self.get(version[2])
+            state = {
+                "employees": [self.get(h) for h in self.record_hashes(root["employees"])],
+                "job_sites": [self.get(h) for h in self.record_hashes(root["job_sites"])],
+            }
+        state.update(root["meta"])
+        return state
+
+    def changes_between(self, start, end):
+        """
+        Compare the board at `start` with the board at `end`.
+
+        Only records whose hashes differ are loaded. Returns a dict with
+        "moved" (name, from, to), "changed" (name, fields), "added" and
+        "removed" (name, placement), where a placement is (job site, box).
+        """
+        old, new = self.version_at(start), self.version_at(end)
+        if old is None or new is None:
+            raise ValueError("No saved board at or before the requested date")
+
+        with self._lock:
+            old_root, new_root = self.get(old[2]), self.get(new[2])
+            old_hashes = self.changed_hashes(old_root["employees"], new_root["employees"])
+            new_hashes = self.changed_hashes(new_root["employees"], old_root["employees"])
+            gone = [self.get(h) for h in old_hashes]
+            came = [self.get(h) for h in new_hashes]
+
+        # Records that changed show up on both sides; pair them up by name
+        came_by_name = {}
+        for emp in came:
+            came_by_name.setdefault(emp["text"], []).append(emp)
+
+        changes = {"moved": [], "changed": [], "added": [], "removed": []}
+        for before in gone:
+            candidates = came_by_name.get(before["text"])
+            if not candidates:
+                changes["removed"].append((before["text"], placement(before)))
+                continue
+            after = candidates.pop(0)
+            if placement(before) != placement(after):
+                changes["moved"].append((before["text"], placement(before), placement(after)))
+            fields = sorted(key for key in set(before) | set(after)
+                            if key not in ("key", "x", "y", "job_site", "box")
+                            and not same_value(before.get(key), after.get(key)))
+            if fields:
+                changes["changed"].append((before["text"], fields))
+        for remaining in came_by_name.values():
+            for emp in remaining:
+                changes["added"].append((emp["text"], placement(emp)))
+        return changes
+
+    def changed_hashes(self, blocks, other_blocks):
+        """Record hashes in `blocks` that do not occur in `other_blocks`, skipping shared blocks."""
+        shared = set(blocks) & set(other_blocks)
+        other = set(self.record_hashes([b for b in other_blocks if b not in shared]))
+        mine = self.record_hashes([b for b in blocks if b not in shared])
+        return [h for h in mine if h not in other]
+
+    # -----------------------------------------------------------
+    # Retention
+    # -----------------------------------------------------------
+    def prune(self, keep_all_days=HISTORY_KEEP_ALL_DAYS, keep_days=HISTORY_KEEP_DAYS, now=None):
+        """
+        Keep every version from the last `keep_all_days`, the last version of each
+        day up to `keep_days` back, and nothing older; then drop unreferenced objects.
+        Archived boards added with the ``record`` command are kept until removed by hand.
+        """
+        now = now or datetime.now()
+        keep_all_since = (now - timedelta(days=keep_all_days)).isoformat(timespec="seconds")
+        keep_since = (now - timedelta(days=keep_days)).isoformat(timespec="seconds")
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM versions WHERE saved_at < ? AND kind != 'import'", (keep_since,))
+            self.conn.execute("""
+                DELETE FROM versions WHERE saved_at < ? AND kind != 'import' AND id NOT IN (
+                    SELECT id FROM versions v WHERE saved_at = (
+                        SELECT MAX(saved_at) FROM versions w
+                        WHERE substr(w.saved_at, 1, 10) = substr(v.saved_at, 1, 10)
+                    )
+                )
+            """, (keep_all_since,))
+
+            # Mark everything still reachable from a version, then sweep the rest
+            reachable = set()
+            for (root_hash,) in self.conn.execute("SELECT DISTINCT root FROM versions").fetchall():
+                if root_hash in reachable:
+                    continue
+                reachable.add(root_hash)
+                root = self.get(root_hash)
+                for block in root["employees"] + root["job_sites"]:
+                    if block not in reachable:
+                        reachable.add(block)
+                        reachable.update(self.get(block))
+            stored = [h for (h,) in self.conn.execute("SELECT hash FROM objects")]
+            garbage = [(h,) for h in stored if h not in reachable]
+            self.conn.executemany("DELETE FROM objects WHERE hash = ?", garbage)
+            self._known.clear()
+        if garbage:
+            print(f"[INFO] Board history pruned: {len(garbage)} unused objects removed")
+        return len(garbage)
+
+    def stats(self):
+        with self._lock:
+            versions = self.conn.execute("SELECT COUNT(*) FROM versions").fetchone()[0]
+            objects, size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM objects").fetchone()
+        return {"versions": versions, "objects": objects, "bytes": size}
+
+
+def folder_date(path):
+    """Date of an archived board from its folder name, e.g. 3.21.2025/output.json -> 2025-03-21 23:59."""
+    folder = os.path.basename(os.path.dirname(os.path.abspath(path)))
+    try:
+        return parse_when(folder)
+    except ValueError:
+        return None
+
+
+def format_placement(place):
+    job_site, box = place
+    return f"{job_site} ({box})" if job_site else "unassigned"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query and maintain the board history.")
+    parser.add_argument("--history", default=history_path_for("output.json"), help="History store to use")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_cmd = commands.add_parser("record", help="Add a board file (e.g. an archived 3.21.2025/output.json)")
+    record_cmd.add_argument("board_files", nargs="+")
+    record_cmd.add_argument("--date", help="When the board was saved (default: folder name, else now)")
+
+    list_cmd = commands.add_parser("list", help="List saved versions")
+    list_cmd.add_argument("--from", dest="start")
+    list_cmd.add_argument("--to", dest="end")
+
+    show_cmd = commands.add_parser("show", help="What the board looked like on a date")
+    show_cmd.add_argument("date")
+    show_cmd.add_argument("--out", help="Write the board to this JSON file")
+
+    moves_cmd = commands.add_parser("moves", help="Who moved between two dates")
+    moves_cmd.add_argument("start")
+    moves_cmd.add_argument("end")
+
+    commands.add_parser("prune", help="Apply the retention policy now")
+    args = parser.parse_args()
+
+    history = BoardHistory(args.history)
+    try:
+        run_command(history, args)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+    finally:
+        history.close()
+
+
+def run_command(history, args):
+    if args.command == "record":
+        for board_file in args.board_files:
+            when = parse_when(args.date) if args.date else folder_date(board_file) or datetime.now()
+            version = history.record(load_board(board_file), kind="import", when=when)
+            print(f"{board_file}: " + (f"version {version} at {when:%Y-%m-%d %H:%M}" if version else "unchanged"))
+        print(history.stats())
+
+    elif args.command == "list":
+        start = parse_when(args.start, end_of_day=False) if args.start else None
+        end = parse_when(args.end) if args.end else None
+        for version_id, saved_at, kind in history.versions(start, end):
+            print(f"{version_id:6d}  {saved_at}  {kind}")
+
+    elif args.command == "show":
+        state = history.board_at(parse_when(args.date))
+        if state is None:
+            print("No saved board at or before that date.")
+            return
+        assigned = sum(1 for emp in state["employees"] if emp.get("job_site"))
+        print(f"{len(state['employees'])} employees ({assigned} assigned), {len(state['job_sites'])} job sites")
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(with_legacy_coordinates(state), f, indent=4)
+            print(f"Board written to {args.out}")
+        else:
+            for job in state["job_sites"]:
+                crew = [emp["text"] for emp in state["employees"] if emp.get("job_site") == job["name"]]
+                print(f"{job['name']}: {', '.join(crew) if crew else '-'}")
+
+    elif args.command == "moves":
+        changes = history.changes_between(parse_when(args.start), parse_when(args.end))
+        for name, before, after in changes["moved"]:
+            print(f"moved    {name}: {format_placement(before)} -> {format_placement(after)}")
+        for name, place in changes["added"]:
+            print(f"added    {name}: {format_placement(place)}")
+        for name, place in changes["removed"]:
+            print(f"removed  {name}: {format_placement(place)}")
+        for name, fields in changes["changed"]:
+            print(f"changed  {name}: {', '.join(fields)}")
+        if not any(changes.values()):
+            print("No changes.")
+
+    elif args.command == "prune":
+        history.prune()
+        print(history.stats())
+
+
+if __name__ == "__main__":
+    main()
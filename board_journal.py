@@ -0,0 +1,200 @@
+# board_journal.py
+import json
+import os
+
+from board_serializer import get_serializer
+from board_sync import assign_employee_keys
+from board_view import upgrade_board_coordinates
+
+
+def journal_path_for(snapshot_path):
+    """Return the sidecar journal path for a board snapshot, e.g. output.json -> output.journal."""
+    return os.path.splitext(snapshot_path)[0] + ".journal"
+
+
+def find_job_site_index(state, name):
+    for i, job in enumerate(state["job_sites"]):
+        if job["name"] == name:
+            return i
+    return None
+
+
+def find_employee_index(state, record):
+    """Index of the employee a record is about: by key, or by list index for records written before keys."""
+    employees = state["employees"]
+    if "key" not in record:
+        return record["i"] if record["i"] < len(employees) else None
+    for i, emp in enumerate(employees):
+        if emp.get("key") == record["key"]:
+            return i
+    return None
+
+
+def put_employee(state, record):
+    employees = state["employees"]
+    index = find_employee_index(state, record)
+    if index is None:
+        employees.append(record["employee"])
+    else:
+        employees[index] = record["employee"]
+
+
+def put_job_site(state, data):
+    job_sites = state["job_sites"]
+    for i, job in enumerate(job_sites):
+        if job["name"] == data["name"]:
+            job_sites[i] = data
+            return
+    job_sites.append(data)
+
+
+def apply_record(state, record):
+    """Apply a single journal record to a board state dict in place.
+
+    Only the top-level lists are modified; employee and job site records are
+    replaced rather than edited, so dicts shared with other copies of the
+    state are never changed underneath them.
+    """
+    op = record["op"]
+
+    if op in ("move", "assign", "edit", "add_employee"):
+        put_employee(state, record)
+    elif op == "delete_employee":
+        index = find_employee_index(state, record)
+        if index is not None:
+            state["employees"].pop(index)
+    elif op == "hub_add":
+        pass  # The hub record itself is carried in record["hubs"]
+    elif op == "hub_rename":
+        index = find_job_site_index(state, record["old"])
+        if index is not None:
+            state["job_sites"][index] = dict(state["job_sites"][index], name=record["new"])
+        for i, emp in enumerate(state["employees"]):
+            if emp.get("job_site") == record["old"]:
+                state["employees"][i] = dict(emp, job_site=record["new"])
+    elif op == "hub_erase":
+        state["job_sites"] = [job for job in state["job_sites"] if job["name"] != record["name"]]
+    elif op == "note":
+        index = find_job_site_index(state, record["name"])
+        if index is not None:
+            state["job_sites"][index] = dict(state["job_sites"][index], note=record["note"])
+    else:
+        print(f"[WARNING] Unknown journal op '{op}', skipping.")
+
+    # Any hub whose occupation changed along with the record
+    for hub in record.get("hubs", []):
+        put_job_site(state, hub)
+    return state
+
+
+class BoardJournal:
+    """Append-only log of board changes stored next to the snapshot file.
+
+    Each line is one JSON record carrying a monotonically increasing ``seq``.
+    The snapshot remembers the last ``seq`` it contains as ``journal_seq``, so
+    records that were already compacted into it are skipped on replay.
+
+    When a BoardWriter is given, appends and truncation are queued on it
+    instead of touching the disk from the calling thread.
+    """
+
+    def __init__(self, snapshot_path, writer=None):
+        self.snapshot_path = snapshot_path
+        self.writer = writer
+        self.path = journal_path_for(snapshot_path)
+        self.seq = 0
+        self.record_count = 0
+        self.size = 0
+
+    def make_record(self, op, **fields):
+        self.seq += 1
+        record = {"seq": self.seq, "op": op}
+        record.update(fields)
+        return record
+
+    def append(self, op, **fields):
+        """Append a change record and return it."""
+        record = self.make_record(op, **fields)
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        if self.writer:
+            self.writer.append(self.path, line)
+        else:
+            with open(self.path, "a") as f:
+                f.write(line)
+        self.record_count += 1
+        self.size += len(line)
+        return record
+
+    def read_records(self):
+        if not os.path.isfile(self.path):
+            return []
+        records = []
+        with open(self.path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn last line from an interrupted append; everything before it is still valid
+                    print(f"[WARNING] Ignoring unreadable journal line in {self.path}")
+                    break
+        return records
+
+    def replay(self, state):
+        """Apply every record newer than the snapshot to ``state`` and sync the counters."""
+        assign_employee_keys(state)  # Records find their employee by key
+        base_seq = state.get("journal_seq", 0)
+        self.seq = base_seq
+        self.record_count = 0
+        self.size = os.path.getsize(self.path) if os.path.isfile(self.path) else 0
+        for record in self.read_records():
+            self.seq = max(self.seq, record.get("seq", 0))
+            if record.get("seq", 0) <= base_seq:
+                continue
+            apply_record(state, record)
+            self.record_count += 1
+        return state
+
+    def resume(self, state):
+        """Sync the counters with the file after loading `state` (a snapshot with this journal replayed on it).
+
+        Unlike ``replay`` this never moves ``seq`` backwards, so it is safe on
+        the journal that is being appended to; reloads on other threads replay
+        with a BoardJournal of their own instead.
+        """
+        base_seq = state.get("journal_seq", 0)
+        records = self.read_records()
+        self.seq = max([self.seq, base_seq] + [record.get("seq", 0) for record in records])
+        self.record_count = sum(1 for record in records if record.get("seq", 0) > base_seq)
+        self.size = os.path.getsize(self.path) if os.path.isfile(self.path) else 0
+
+    def truncate(self):
+        """Drop all records once they have been compacted into the snapshot."""
+        if self.writer:
+            self.writer.replace(self.path, "")
+        else:
+            with open(self.path, "w"):
+                pass
+        self.record_count = 0
+        self.size = 0
+
+    def needs_compaction(self, max_records, max_bytes):
+        return self.record_count >= max_records or self.size >= max_bytes
+
+
+def load_board_state(path):
+    """Read a board snapshot and replay its journal, if any, on top of it.
+
+    The state remembers the last record it contains as ``journal_seq``, so
+    writing it back (e.g. with board_sqlite.save_board) makes a snapshot that
+    later replays do not apply those records on top of again.
+    """
+    # Journal records are in board coordinates, so the snapshot is converted first
+    state = assign_employee_keys(upgrade_board_coordinates(get_serializer().load(path)))
+    journal = BoardJournal(path)
+    if os.path.isfile(journal.path):
+        journal.replay(state)
+        state["journal_seq"] = journal.seq
+    return state
@@ -0,0 +1,150 @@
+# board_listview.py
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+
+
+class VirtualListbox:
+    """A listbox over a Python list that only holds the rows currently in view.
+
+    ``set_items`` swaps in a new list (e.g. the unassigned employees). The Tk
+    listbox is given just the rows that fit in the window, and only rows
+    whose text changed are rewritten, so an update costs the same whether
+    the list has fifty entries or ten thousand. The selected item and the
+    first visible item are followed by identity, so the selection and the
+    scroll position survive updates as long as those items are still listed.
+    """
+
+    def __init__(self, master, label=str, **options):
+        self.frame = tk.Frame(master)
+        self.listbox = tk.Listbox(self.frame, exportselection=False, **options)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.label = label  # Item -> row text
+        self.items = []
+        self.top = 0  # Index in items of the first row shown
+        self.rows = 1  # Whole rows that fit in the listbox
+        self.shown = []  # Text of the rows currently in the listbox
+        self.selected = None
+
+        self.listbox.bind("<Configure>", self.on_configure)
+        self.listbox.bind("<<ListboxSelect>>", self.on_listbox_select)
+        self.listbox.bind("<MouseWheel>", lambda event: self.scroll(-3 if event.delta > 0 else 3))
+        self.listbox.bind("<Button-4>", lambda event: self.scroll(-3))
+        self.listbox.bind("<Button-5>", lambda event: self.scroll(3))
+        # The listbox only holds the visible rows, so its own key bindings would stop at the window's edge
+        self.listbox.bind("<Up>", lambda event: self.move_selection(-1))
+        self.listbox.bind("<Down>", lambda event: self.move_selection(1))
+        self.listbox.bind("<Prior>", lambda event: self.move_selection(-self.rows))
+        self.listbox.bind("<Next>", lambda event: self.move_selection(self.rows))
+        self.listbox.bind("<Home>", lambda event: self.select(0))
+        self.listbox.bind("<End>", lambda event: self.select(len(self.items) - 1))
+
+    def pack(self, **options):
+        self.frame.pack(**options)
+
+    def bind(self, sequence, func):
+        """Bind on the inner listbox, after the view's own handler (so selection() is already current)."""
+        self.listbox.bind(sequence, func, add="+")
+
+    def selection(self):
+        """The selected item, or None."""
+        return self.selected
+
+    def set_items(self, items):
+        """Show `items`, keeping the selection and the first visible item where they are still present."""
+        old = self.items
+        anchor = old[self.top] if self.top < len(old) else None
+        self.items = list(items)
+        if anchor is not None:
+            try:
+                self.top = self.items.index(anchor)
+            except ValueError:
+                pass  # The first visible item went away; stay at the same offset
+
+        if self.selected is not None and self.selected not in set(self.items):
+            self.selected = None
+        self.render()
+
+    def render(self):
+        self.top = max(0, min(self.top, len(self.items) - self.rows))
+        # One extra row fills the partly visible line at the bottom
+        visible = self.items[self.top:self.top + self.rows + 1]
+        rows = [self.label(item) for item in visible]
+        for i, text in enumerate(rows):
+            if i >= len(self.shown):
+                self.listbox.insert(tk.END, text)
+            elif self.shown[i] != text:
+                self.listbox.delete(i)
+                self.listbox.insert(i, text)
+        if len(self.shown) > len(rows):
+            self.listbox.delete(len(rows), tk.END)
+        self.shown = rows
+        self.listbox.yview_moveto(0)
+
+        self.listbox.selection_clear(0, tk.END)
+        for i, item in enumerate(visible):
+            if item is self.selected:
+                self.listbox.selection_set(i)
+                break
+
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def scroll(self, rows):
+        self.top += rows
+        self.render()
+        return "break"
+
+    def see(self, index):
+        """Scroll so that items[index] is in view, as tk.Listbox.see does."""
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + self.rows:
+            self.top = index - self.rows + 1
+        self.render()
+
+    def select(self, index):
+        """Select items[index], scroll it into view and report it like a click would."""
+        if not self.items:
+            return "break"
+        index = max(0, min(index, len(self.items) - 1))
+        self.selected = self.items[index]
+        self.see(index)
+        self.listbox.event_generate("<<ListboxSelect>>")
+        return "break"
+
+    def move_selection(self, rows):
+        """Arrow and page keys: move the selection, starting from the first visible row if there is none."""
+        index = next((i for i, item in enumerate(self.items) if item is self.selected), None)
+        return self.select(self.top if index is None else index + rows)
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", count, "units" | "pages")."""
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.items))
+            self.render()
+        elif args[0] == "scroll":
+            self.scroll(int(args[1]) * (self.rows if args[2] == "pages" else 1))
+
+    def on_configure(self, event):
+        font = tkfont.nametofont(self.listbox.cget("font"))
+        row_height = font.metrics("linespace") + 1 + 2 * self.pixels("selectborderwidth")
+        inner = event.height - 2 * (self.pixels("borderwidth") + self.pixels("highlightthickness"))
+        rows = max(1, inner // row_height)
+        if rows != self.rows:
+            self.rows = rows
+            self.render()
+
+    def pixels(self, option):
+        return int(float(str(self.listbox.cget(option))))
+
+    def on_listbox_select(self, event):
+        selection = self.listbox.curselection()
+        if selection and self.top + selection[0] < len(self.items):
+            self.selected = self.items[self.top + selection[0]]
@@ -0,0 +1,205 @@
+# board_loader.py
+import bisect
+import time
+from collections import deque
+
+from draggable_box import DraggableBox
+from job_site_hub import JobSiteHub
+from constants import LOAD_CHUNK_MS
+
+
+class ProgressiveBoardLoader:
+    """Builds the board from a parsed state a chunk at a time.
+
+    Hubs in the current viewport and the employees assigned to them are
+    created first, in one go, and the loading overlay is lifted as soon as
+    they are drawn. Everything else is created in chunks of about
+    LOAD_CHUNK_MS scheduled with ``root.after``, so the board can be
+    scrolled and searched while it fills in. Hubs and employees are inserted
+    at their position from the file, so ``hub_list`` and ``employee_boxes``
+    keep the saved order throughout.
+
+    Items are placed through the app's current BoardView, so anything created
+    after the board was zoomed lands exactly where it would have been had it
+    existed already.
+    """
+
+    def __init__(self, app, state):
+        self.app = app
+        self.state = state
+        self.hub_order = []  # File index of each hub in hub_list
+        self.employee_order = []  # File index of each box in employee_boxes
+        self.cancelled = False
+        self.started = None
+        self.chunks = 0
+
+        job_sites = state["job_sites"]
+        hub_index = {job["name"]: i for i, job in enumerate(job_sites)}
+        visible = {i for i in range(len(job_sites)) if self.hub_is_visible(i)}
+
+        first, rest = [], []
+        for i in range(len(job_sites)):
+            (first if i in visible else rest).append(("hub", i))
+        later_employees = []
+        for j, emp in enumerate(state["employees"]):
+            if hub_index.get(emp.get("job_site")) in visible and emp.get("box"):
+                first.append(("employee", j))
+            else:
+                later_employees.append(("employee", j))
+        self.first = first
+        self.queue = deque(rest + later_employees)  # All hubs exist before the remaining employees are placed
+
+    # -----------------------------------------------------------
+    # Viewport
+    # -----------------------------------------------------------
+    def viewport(self):
+        canvas = self.app.canvas
+        width, height = canvas.winfo_width(), canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            # Not mapped yet (first load at start-up): assume the window will fill the screen
+            width, height = canvas.winfo_screenwidth(), canvas.winfo_screenheight()
+        x, y = canvas.canvasx(0), canvas.canvasy(0)
+        return x, y, x + width, y + height
+
+    def hub_is_visible(self, i):
+        x1, y1, x2, y2 = self.app.hub_layout_rect(i)
+        vx1, vy1, vx2, vy2 = self.viewport()
+        return x1 < vx2 and x2 > vx1 and y1 < vy2 and y2 > vy1
+
+    # -----------------------------------------------------------
+    # Running
+    # -----------------------------------------------------------
+    def draw_visible(self):
+        """Create the hubs in view and their employees right away."""
+        self.started = time.perf_counter()
+        for kind, i in self.first:
+            self.create(kind, i)
+        self.app.bring_employee_names_to_front()
+        self.app.update_unassigned_employees()
+
+    def continue_in_background(self):
+        """Report time-to-first-interaction and schedule the rest of the board."""
+        elapsed = (time.perf_counter() - self.started) * 1000
+        print(f"Board interactive after {elapsed:.1f} ms "
+              f"({len(self.hub_order)}/{len(self.state['job_sites'])} hubs, "
+              f"{len(self.employee_order)}/{len(self.state['employees'])} employees drawn)")
+        self.schedule()
+
+    def schedule(self):
+        if self.queue:
+            self.app.root.after(1, self.run_chunk)
+        else:
+            self.finish()
+
+    def run_chunk(self):
+        if self.cancelled:
+            return
+        deadline = time.perf_counter() + LOAD_CHUNK_MS / 1000
+        while self.queue and time.perf_counter() < deadline:
+            kind, i = self.queue.popleft()
+            self.create(kind, i)
+        self.chunks += 1
+        self.app.update_unassigned_employees()
+        if self.app.summary_mode:
+            self.app.request_redraw("summary")  # Hide the new employees and count them into their hub's summary
+        self.schedule()
+
+    def finish(self):
+        app = self.app
+        app.loader = None
+        app.bring_employee_names_to_front()
+        app.update_scroll_region()
+        app.update_unassigned_employees()
+        # Saves the user made while the board filled in waited for the whole board
+        if app.save_pending:
+            app.write_snapshot()
+        if app.undo_pending:
+            app.push_undo_state()
+
+        elapsed = (time.perf_counter() - self.started) * 1000
+        print(f"Board fully loaded in {elapsed:.1f} ms ({self.chunks} background chunks)")
+
+    def cancel(self):
+        self.cancelled = True
+        if self.app.loader is self:
+            self.app.loader = None
+
+    # -----------------------------------------------------------
+    # Creating hubs and employees
+    # -----------------------------------------------------------
+    def create(self, kind, i):
+        self.app.is_filling = True  # Placing saved items is not a change to save
+        try:
+            if kind == "hub":
+                self.create_hub(i)
+            else:
+                self.create_employee(i)
+        except Exception as e:
+            print(f"Error loading {kind} {i}: {e}")
+        finally:
+            self.app.is_filling = False
+
+    def create_hub(self, i):
+        app = self.app
+        job = self.state["job_sites"][i]
+        print(f"Loading job site: {job['name']}")
+        # Ensure defaults if missing
+        status = dict(job.get("status") or {})
+        status.setdefault("PM", False)
+        status.setdefault("GM", False)
+        status.setdefault("Foreman", False)
+        status.setdefault("Super", False)
+        # Electrician slots hold canvas ids from whoever saved the file; they are refilled as employees are placed
+        status["Electrician"] = []
+
+        hub = JobSiteHub(app, app.canvas, job["name"], job["x"], job["y"])
+        hub.set_occupation_status(status)
+        pos = bisect.bisect(self.hub_order, i)
+        self.hub_order.insert(pos, i)
+        app.canvas.hub_list.insert(pos, hub)
+        app.registry.add_hub(hub, order=i)
+
+        app.layout_hub(hub, i)
+        hub.update_all_positions()
+        app.canvas.tag_raise(hub.text_id)
+        app.create_sticky_note(hub, job.get("note", ""))
+
+    def create_employee(self, j):
+        app = self.app
+        emp = self.state["employees"][j]
+        print(f"Loading employee: {emp['text']}")
+        job_site_name = emp.get("job_site")
+        box_type = emp.get("box")
+        x, y = app.employee_canvas_position(emp)
+
+        draggable_box = DraggableBox(
+            app=app,
+            canvas=app.canvas,
+            text=emp["text"],
+            role=emp.get("role", "PM"),
+            x=x,
+            y=y,
+            phone=emp.get("phone", ""),
+            job_site=job_site_name,
+            box=box_type,
+            skills=emp.get("skills", []),
+            sst_card=emp.get("sst_card", "No"),
+            nj_ny_certified=emp.get("nj_ny_certified", "NJ"),
+            electrician_rank=emp.get("electrician_rank", "0"),
+            certifications=emp.get("certifications", []),
+            worker_status=emp.get("worker_status", "Journeyman"),
+            current_status=emp.get("current_status", "On-site"),
+            key=emp.get("key")
+        )
+        pos = bisect.bisect(self.employee_order, j)
+        self.employee_order.insert(pos, j)
+        app.employee_boxes.insert(pos, draggable_box)
+        app.registry.add_box(draggable_box, order=j)
+        # Remember where each employee sits so journaled moves (also while the board fills in) know which hubs changed
+        app.journaled_hubs[draggable_box.id] = job_site_name if draggable_box.current_snap_box else None
+
+        app.scale_employee_box(draggable_box)
+        if draggable_box.current_snap_box and box_type in ("Electrician", "Fire Alarm"):
+            # The constructor snapped the box to the top of the electrician box; restack the column
+            draggable_box.current_snap_box["hub"].update_electrician_positions()
+        app.update_box_color_based_on_status(draggable_box)
@@ -0,0 +1,225 @@
+# board_query.py
+import argparse
+import shlex
+import time
+from collections import defaultdict
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from types import SimpleNamespace
+
+from board_search import CERT_FILTERS, phone_digits
+
+QUERY_CACHE_SIZE = 256  # Compiled queries (and each table's results) kept, by query text
+TEXT_FIELDS = ("name", "phone")  # Matched as substrings; every other field is a set of values looked up in an index
+SET_FIELDS = ("role", "cert", "skill", "status", "site", "assigned")
+FIELD_ALIASES = {"text": "name", "certificate": "cert", "skills": "skill", "job_site": "site", "current_status": "status"}
+DEFAULT_STATUS = "On-site"  # Employees saved without a status are on site (as in the employee dialog)
+EMPLOYEE_DEFAULTS = {"text": "", "role": None, "phone": "", "skills": [], "sst_card": None, "nj_ny_certified": None,
+                     "certifications": [], "worker_status": None, "current_status": None, "job_site": None, "box": None}
+
+
+class Query:
+    """A parsed employee filter such as ``role:Electrician skill:Mechanic status:!Sick site:"Job Site 4"``.
+
+    Each ``field:value`` term must hold; ``field:a,b`` matches either value,
+    ``field:!value`` or ``-field:value`` negates the term and ``*`` in a value
+    is a wildcard (``role:*electrician``). Values are case-insensitive. Words
+    without a field are kept as ``text`` for the name search.
+
+    Queries are compiled once per query text (see compile_query) into one
+    predicate per term. ``filter`` runs the predicates over employees;
+    ``EmployeeTable.select`` answers the set fields from its indexes first.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.clauses = []  # (field, values, negated)
+        words = []
+        lexer = shlex.shlex(source, posix=True)
+        lexer.whitespace_split = True
+        lexer.quotes = '"'  # Not ', which is part of names like O'Brien
+        lexer.escape = ""
+        for token in lexer:  # Raises ValueError on an unclosed quote
+            clause = parse_clause(token)
+            if clause:
+                self.clauses.append(clause)
+            else:
+                words.append(token)
+        self.text = " ".join(words)
+        self.predicates = [compile_clause(*clause) for clause in self.clauses]
+
+    def __repr__(self):
+        return f"Query({self.source!r})"
+
+    def matches(self, employee, text=True):
+        """Whether a DraggableBox or saved employee record passes every term (and contains `text` if asked to)."""
+        fields = employee_fields(employee)
+        if text and self.text and self.text.lower() not in fields["name"]:
+            return False
+        return all(predicate(fields) for predicate in self.predicates)
+
+    def filter(self, employees, text=True):
+        if not self.predicates and not (text and self.text):
+            return list(employees)
+        return [employee for employee in employees if self.matches(employee, text)]
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def compile_query(source):
+    """The Query for `source`, parsed once per distinct text. Raises ValueError for unknown fields or quotes left open."""
+    return Query(source)
+
+
+def parse_clause(token):
+    """(field, values, negated) for a field:value token, or None for a plain word."""
+    negated = token[:1] in ("-", "!") and ":" in token
+    name, sep, value = token[negated:].partition(":")
+    if not sep:
+        return None
+    field = FIELD_ALIASES.get(name.lower(), name.lower())
+    if field not in TEXT_FIELDS + SET_FIELDS:
+        raise ValueError(f"Unknown query field '{name}', expected one of {', '.join(TEXT_FIELDS + SET_FIELDS)}")
+    if value.startswith("!"):
+        negated, value = not negated, value[1:]
+    values = [v.strip().lower() for v in value.split(",")]
+    if field == "phone":
+        values = [phone_digits(v) for v in values]
+    return field, tuple(values), negated
+
+
+def compile_clause(field, values, negated):
+    if field in TEXT_FIELDS:
+        def test(fields):
+            return any(value in fields[field] for value in values)
+    else:
+        exact = {value for value in values if "*" not in value}
+        patterns = [value for value in values if "*" in value]
+
+        def test(fields):
+            found = fields[field]
+            return not exact.isdisjoint(found) or any(fnmatchcase(v, p) for p in patterns for v in found)
+    if negated:
+        return lambda fields: not test(fields)
+    return test
+
+
+def employee_fields(employee):
+    """Lower-cased query fields of a DraggableBox or a saved employee record (dict)."""
+    if isinstance(employee, dict):
+        record = SimpleNamespace(**{name: clean(employee.get(name), default)
+                                    for name, default in EMPLOYEE_DEFAULTS.items()})
+        assigned = bool(record.job_site and record.box)
+        site = record.job_site if assigned else ""
+    else:
+        record = SimpleNamespace(**{name: clean(getattr(employee, name, default), default)
+                                    for name, default in EMPLOYEE_DEFAULTS.items()})
+        assigned = bool(employee.current_snap_box)
+        site = employee.current_snap_box["hub"].text if assigned else ""
+    skills = record.skills if isinstance(record.skills, list) else [record.skills]
+    certs = {name for name, test in CERT_FILTERS.items() if test(record)}
+    certs.update(record.certifications if isinstance(record.certifications, list) else [])
+    return {
+        "name": str(record.text).lower(),
+        "phone": phone_digits(record.phone),
+        "role": {str(record.role or "").lower()},
+        "cert": {cert.lower() for cert in certs if isinstance(cert, str)},
+        "skill": {skill.lower() for skill in skills if isinstance(skill, str) and skill},
+        "status": {str(record.current_status or DEFAULT_STATUS).lower()},
+        "site": {str(site).lower()},
+        "assigned": {"yes" if assigned else "no"},
+    }
+
+
+def clean(value, default=None):
+    """`value`, or `default` for None and for the NaN pandas writes for empty cells (see board_sync.same_value)."""
+    if value is None or (isinstance(value, float) and value != value):
+        return default
+    return value
+
+
+class EmployeeTable:
+    """Saved employee records (e.g. a board's "employees" list) indexed by the query's set fields.
+
+    ``select`` looks each set-field term up in the index (one set per value)
+    and only runs the name and phone predicates on the rows left. Results
+    are kept per query text, so running a saved query again is a dict hit.
+    """
+
+    def __init__(self, employees):
+        self.employees = list(employees)
+        self.fields = [employee_fields(employee) for employee in self.employees]
+        self.index = defaultdict(lambda: defaultdict(set))  # Field -> value -> row numbers
+        for row, fields in enumerate(self.fields):
+            for field in SET_FIELDS:
+                for value in fields[field]:
+                    self.index[field][value].add(row)
+        self.results = {}  # Query text -> matching employees
+
+    def rows_with(self, field, values):
+        index = self.index[field]
+        rows = set()
+        for value in values:
+            if "*" in value:
+                for key in index:
+                    if fnmatchcase(key, value):
+                        rows |= index[key]
+            else:
+                rows |= index.get(value, set())
+        return rows
+
+    def select(self, query):
+        """Employees matching a Query or query text, in their saved order."""
+        if isinstance(query, str):
+            query = compile_query(query)
+        if query.source in self.results:
+            return self.results[query.source]
+
+        start = time.perf_counter()
+        rows = set(range(len(self.employees)))
+        predicates = []
+        for (field, values, negated), predicate in zip(query.clauses, query.predicates):
+            if field in TEXT_FIELDS:
+                predicates.append(predicate)
+            elif negated:
+                rows -= self.rows_with(field, values)
+            else:
+                rows &= self.rows_with(field, values)
+        text = query.text.lower()
+        matches = [self.employees[row] for row in sorted(rows)
+                   if text in self.fields[row]["name"] and all(p(self.fields[row]) for p in predicates)]
+
+        if len(self.results) >= QUERY_CACHE_SIZE:
+            self.results.clear()
+        self.results[query.source] = matches
+        print(f"Query {query.source!r}: {len(matches)} of {len(self.employees)} employees "
+              f"in {(time.perf_counter() - start) * 1000:.2f} ms")
+        return matches
+
+
+def select_employees(state, query):
+    """The employees of a board state matching `query` (text or Query)."""
+    return EmployeeTable(state.get("employees", [])).select(query)
+
+
+def main():
+    from board_sqlite import load_board
+
+    parser = argparse.ArgumentParser(description="List the employees of a board (output.json or output.db) matching a query.")
+    parser.add_argument("board_file")
+    parser.add_argument("query", help='e.g. \'role:Electrician cert:OSHA skill:Mechanic status:!Sick site:"Job Site 4"\'')
+    args = parser.parse_args()
+
+    try:
+        matches = select_employees(load_board(args.board_file), args.query)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return
+    for emp in matches:
+        site = emp.get("job_site") if emp.get("box") else None
+        print(f"{emp.get('text', '')}  |  {emp.get('role') or ''}  |  {emp.get('current_status') or DEFAULT_STATUS}"
+              f"  |  {site or 'unassigned'}")
+    print(f"[INFO] {len(matches)} employee(s)")
+
+
+if __name__ == "__main__":
+    main()
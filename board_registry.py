@@ -0,0 +1,112 @@
+# board_registry.py
+from collections import defaultdict
+
+from board_search import EmployeeSearchIndex
+
+
+class BoardRegistry:
+    """Dict indexes over the app's employee boxes and job site hubs.
+
+    ``employee_boxes`` and ``canvas.hub_list`` stay the ordered lists the
+    board is saved from; the app calls add/remove/rename here next to every
+    change to them, so finding a box or hub by canvas id or by name is a
+    dict lookup instead of a scan of the list. The side panel's search
+    index (see board_search.py) is kept up to date through the same calls,
+    plus ``box_edited`` when an employee's fields change.
+
+    Names are not unique, and lookups by name return the boxes and hubs in
+    board order (the first one is the one a scan of the list would find).
+    The progressive loader creates them visible-first, so it passes each
+    one's index in the file as ``order``; boxes and hubs added without one
+    come after those.
+    """
+
+    def __init__(self):
+        self.boxes_by_id = {}  # Text item id -> DraggableBox
+        self.boxes_by_name = defaultdict(list)  # Employee name -> DraggableBoxes, in board order
+        self.hubs_by_id = {}  # Hub rectangle id -> JobSiteHub
+        self.hubs_by_name = defaultdict(list)  # Job site name -> JobSiteHubs, in board order
+        self.order = {}  # Box or hub -> its index in the board file, for those placed by the loader
+        self.search = EmployeeSearchIndex()
+
+    def clear(self):
+        self.boxes_by_id.clear()
+        self.boxes_by_name.clear()
+        self.hubs_by_id.clear()
+        self.hubs_by_name.clear()
+        self.order.clear()
+        self.search.clear()
+
+    # -----------------------------------------------------------
+    # Employees
+    # -----------------------------------------------------------
+    def add_box(self, box, order=None):
+        self.boxes_by_id[box.id] = box
+        self.insert_named(self.boxes_by_name[box.text], box, order)
+        self.search.add(box)
+
+    def remove_box(self, box):
+        self.boxes_by_id.pop(box.id, None)
+        discard(self.boxes_by_name, box.text, box)
+        self.order.pop(box, None)
+        self.search.remove(box)
+
+    def rename_box(self, box, old_name):
+        """Call after box.text has been changed from `old_name`."""
+        if box.text != old_name:
+            discard(self.boxes_by_name, old_name, box)
+            self.boxes_by_name[box.text].append(box)
+
+    def box_edited(self, box):
+        """Call after an employee's name, certifications or skills were changed."""
+        self.search.update(box)
+
+    def box(self, employee_id):
+        return self.boxes_by_id.get(employee_id)
+
+    def boxes_named(self, name):
+        return list(self.boxes_by_name.get(name, ()))
+
+    # -----------------------------------------------------------
+    # Job site hubs
+    # -----------------------------------------------------------
+    def add_hub(self, hub, order=None):
+        self.hubs_by_id[hub.id] = hub
+        self.insert_named(self.hubs_by_name[hub.text], hub, order)
+
+    def remove_hub(self, hub):
+        self.hubs_by_id.pop(hub.id, None)
+        discard(self.hubs_by_name, hub.text, hub)
+        self.order.pop(hub, None)
+
+    def rename_hub(self, hub, old_name):
+        """Call after hub.text has been changed from `old_name`."""
+        if hub.text != old_name:
+            discard(self.hubs_by_name, old_name, hub)
+            self.hubs_by_name[hub.text].append(hub)
+
+    def hub(self, item):
+        return self.hubs_by_id.get(item)
+
+    def hub_named(self, name):
+        hubs = self.hubs_by_name.get(name)
+        return hubs[0] if hubs else None
+
+    def insert_named(self, items, item, order):
+        """Insert `item` into a same-name list ahead of anything that comes later in the file."""
+        if order is None:
+            items.append(item)
+            return
+        self.order[item] = order
+        i = 0
+        while i < len(items) and self.order.get(items[i], order) < order:
+            i += 1
+        items.insert(i, item)
+
+
+def discard(index, name, item):
+    items = index.get(name)
+    if items and item in items:
+        items.remove(item)
+        if not items:
+            del index[name]
@@ -0,0 +1,215 @@
+# board_render.py
+import argparse
+import os
+from collections import defaultdict
+
+from PIL import Image, ImageDraw, ImageFont
+
+from board_fonts import FONT_SPECS, MIN_FONT_SIZE
+from board_sqlite import load_board
+from board_view import BoardView, hub_grid_rect, snap_box_rects, upgrade_board_coordinates
+from draggable_box import employee_label
+from job_site_hub import hub_label
+from constants import ROLE_COLORS, STATUS_TEXT_COLORS, BOARD_BACKGROUND
+
+# Tk's "Helvetica" is Arial on Windows; the others cover Linux and macOS
+BOLD_FONT_FILES = ("arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf")
+PIXELS_PER_POINT = 96 / 72  # Tk font sizes are points, drawn at 96 DPI
+IMAGE_MARGIN = 10  # Pixels of background around the board
+ELECTRICIAN_BOXES = ("Electrician", "Fire Alarm")
+
+
+class BoardRenderer:
+    """Draws a saved board into PIL images without Tk.
+
+    The board is laid out the way the whiteboard lays it out at zoom
+    ``scale``: hubs on the grid, role boxes, assigned employees stacked in
+    their boxes, fonts that follow the zoom or stay fixed as on the canvas.
+    Everything is collected once as a list of shapes in image pixels, so any
+    rectangle of the board (the whole of it, or one tile of a huge board)
+    can be drawn without holding a full-size image in memory.
+    """
+
+    def __init__(self, state, scale=None, include_unassigned=False):
+        upgrade_board_coordinates(state)
+        self.scale = scale or BoardView.from_state(state).scale
+        self.fonts = {}
+        self.items = []  # (kind, bbox, options) in drawing order
+        self.lay_out(state, include_unassigned)
+
+        x1 = min(bbox[0] for _, bbox, _ in self.items) if self.items else 0
+        y1 = min(bbox[1] for _, bbox, _ in self.items) if self.items else 0
+        x2 = max(bbox[2] for _, bbox, _ in self.items) if self.items else 1
+        y2 = max(bbox[3] for _, bbox, _ in self.items) if self.items else 1
+        self.bounds = (int(x1) - IMAGE_MARGIN, int(y1) - IMAGE_MARGIN, int(x2) + IMAGE_MARGIN, int(y2) + IMAGE_MARGIN)
+
+    @property
+    def size(self):
+        return self.bounds[2] - self.bounds[0], self.bounds[3] - self.bounds[1]
+
+    def font(self, name):
+        """PIL font for one of the canvas fonts in board_fonts.FONT_SPECS at this zoom."""
+        if name not in self.fonts:
+            _, size, _, zooms = FONT_SPECS[name]
+            if zooms:
+                size = max(MIN_FONT_SIZE, int(size * self.scale))
+            pixels = round(size * PIXELS_PER_POINT)
+            for font_file in BOLD_FONT_FILES:
+                try:
+                    self.fonts[name] = ImageFont.truetype(font_file, pixels)
+                    break
+                except OSError:
+                    continue
+            else:
+                self.fonts[name] = ImageFont.load_default(pixels)
+        return self.fonts[name]
+
+    # -----------------------------------------------------------
+    # Layout
+    # -----------------------------------------------------------
+    def lay_out(self, state, include_unassigned):
+        occupants = defaultdict(list)
+        unassigned = []
+        for emp in state.get("employees", []):
+            if emp.get("job_site") and emp.get("box"):
+                occupants[emp["job_site"]].append(emp)
+            else:
+                unassigned.append(emp)
+
+        for i, job in enumerate(state.get("job_sites", [])):
+            self.add_hub(i, job, occupants.get(job["name"], []))
+
+        if include_unassigned:
+            for emp in unassigned:
+                x, y = emp.get("x"), emp.get("y")
+                if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+                    self.add_employee(emp, x * self.scale, y * self.scale, 15)
+
+    def add_hub(self, i, job, employees):
+        scale = self.scale
+        x1, y1, x2, y2 = [value * scale for value in hub_grid_rect(i)]
+        status = job.get("status") or {}
+        collapsed = status.get("Collapsed", False)
+
+        self.add_rect((x1, y1, x2, y2), fill="lightblue", outline="black")
+        self.add_text((x1 + x2) / 2, y1 - 10, hub_label(job["name"]), "hub_title", anchor="md")
+        rects = snap_box_rects((x1, y1, x2, y2), scale, collapsed)
+        for rect in rects.values():
+            self.add_rect(rect, fill="white", outline="black")
+        self.add_text(x1 + 15, y2 - 15, "[+]" if collapsed else "[-]", "hub_button", anchor="mm")
+        self.add_text(x2 - 15, y1 + 15, "X", "hub_button", fill="red", anchor="mm")
+        # Sticky note square as placed by WhiteboardApp.place_sticky_note
+        self.add_rect((x2 - 20, y1 - 25, x2 - 10, y1 - 15),
+                      fill="yellow" if job.get("note") else None, outline="black")
+
+        electricians = 0
+        for emp in employees:
+            box = emp["box"]
+            if box in ELECTRICIAN_BOXES:
+                bx1, by1, _, _ = rects["Electrician"]
+                # Stacked like JobSiteHub.update_electrician_positions, circles hidden
+                self.add_employee(emp, bx1 + 35, by1 + electricians * 40 * scale, None)
+                electricians += 1
+            elif box in rects:
+                bx1, by1, _, _ = rects[box]
+                self.add_employee(emp, bx1 + 35, by1, 15)
+
+    def add_employee(self, emp, x, y, circle_radius):
+        if circle_radius:
+            color = ROLE_COLORS.get(emp.get("role"), "black")
+            radius = circle_radius * self.scale
+            self.add_oval((x - 25, y + 5, x - 25 + radius, y + radius), fill=color, outline=color)
+        text = employee_label(emp.get("role"), emp.get("skills") or [], emp.get("text", ""))
+        fill = STATUS_TEXT_COLORS.get(emp.get("current_status"), "black")
+        self.add_text(x, y, text, "employee", fill=fill, anchor="la")
+
+    def add_rect(self, bbox, fill=None, outline=None):
+        self.items.append(("rect", bbox, {"fill": fill, "outline": outline}))
+
+    def add_oval(self, bbox, fill=None, outline=None):
+        x1, y1, x2, y2 = bbox
+        # Tiny zooms can turn the circle inside out (as on the canvas); PIL wants it the right way round
+        bbox = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        self.items.append(("oval", bbox, {"fill": fill, "outline": outline}))
+
+    def add_text(self, x, y, text, font, fill="black", anchor="la"):
+        bbox = self.font(font).getbbox(text, anchor=anchor)
+        bbox = (x + bbox[0], y + bbox[1], x + bbox[2], y + bbox[3])
+        self.items.append(("text", bbox, {"xy": (x, y), "text": text, "font": font, "fill": fill, "anchor": anchor}))
+
+    # -----------------------------------------------------------
+    # Drawing
+    # -----------------------------------------------------------
+    def render(self, region=None):
+        """Draw `region` (x1, y1, x2, y2 in board pixels, the whole board by default) into a new image."""
+        x1, y1, x2, y2 = region or self.bounds
+        image = Image.new("RGB", (x2 - x1, y2 - y1), BOARD_BACKGROUND)
+        draw = ImageDraw.Draw(image)
+        drawn = 0
+        for kind, bbox, options in self.items:
+            if bbox[2] < x1 or bbox[0] > x2 or bbox[3] < y1 or bbox[1] > y2:
+                continue
+            shifted = (bbox[0] - x1, bbox[1] - y1, bbox[2] - x1, bbox[3] - y1)
+            if kind == "rect":
+                draw.rectangle(shifted, fill=options["fill"], outline=options["outline"])
+            elif kind == "oval":
+                draw.ellipse(shifted, fill=options["fill"], outline=options["outline"])
+            else:
+                x, y = options["xy"]
+                draw.text((x - x1, y - y1), options["text"], fill=options["fill"],
+                          font=self.font(options["font"]), anchor=options["anchor"])
+            drawn += 1
+        print(f"Rendered {drawn} of {len(self.items)} board items into {image.size[0]}x{image.size[1]}")
+        return image
+
+    def tiles(self, tile_size):
+        """(row, column, region) of each tile_size x tile_size tile covering the board."""
+        bx1, by1, bx2, by2 = self.bounds
+        for row, y in enumerate(range(by1, by2, tile_size)):
+            for column, x in enumerate(range(bx1, bx2, tile_size)):
+                yield row, column, (x, y, min(x + tile_size, bx2), min(y + tile_size, by2))
+
+    def save(self, path, tile_size=None):
+        """Write the board to `path`, or to path_<row>_<column> tiles; returns the files written."""
+        if not tile_size:
+            self.render().save(path)
+            return [path]
+        stem, ext = os.path.splitext(path)
+        paths = []
+        for row, column, region in self.tiles(tile_size):
+            tile_path = f"{stem}_{row}_{column}{ext}"
+            self.render(region).save(tile_path)
+            paths.append(tile_path)
+        return paths
+
+
+def render_board(state, path, scale=None, tile_size=None, include_unassigned=False):
+    """Render a board state to PNG; see BoardRenderer. Returns the files written."""
+    return BoardRenderer(state, scale, include_unassigned).save(path, tile_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Draw a board (output.json or output.db) to a PNG without opening the whiteboard.")
+    parser.add_argument("board_file")
+    parser.add_argument("image_file", nargs="?", default="board.png")
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--scale", type=float, help="Zoom to draw at (default: the zoom the board was saved with)")
+    size.add_argument("--width", type=int, help="Pick the zoom that makes the hub grid this many pixels wide")
+    parser.add_argument("--tile", type=int, metavar="PIXELS", help="Write square tiles of this size instead of one image")
+    parser.add_argument("--unassigned", action="store_true", help="Also draw employees not assigned to a job site")
+    args = parser.parse_args()
+
+    state = load_board(args.board_file)
+    scale = args.scale
+    if args.width:
+        # Hub grid width in board coordinates, plus the 50 left of the first column
+        columns = len(state.get("job_sites", [])) or 1
+        board_width = max(hub_grid_rect(i)[2] for i in range(columns)) + 50
+        scale = args.width / board_width
+
+    paths = render_board(state, args.image_file, scale, args.tile, args.unassigned)
+    print(f"[INFO] Wrote {len(paths)} image(s): {', '.join(paths[:3])}{' ...' if len(paths) > 3 else ''}")
+
+
+if __name__ == "__main__":
+    main()
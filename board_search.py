@@ -0,0 +1,235 @@
+# board_search.py
+import math
+import re
+from collections import defaultdict
+
+GRAM_SIZE = 3  # Names are indexed under every piece of up to this many characters
+FUZZY_GRAM_SIZES = (2, 3)  # Fuzzy matching compares the pairs and triples of letters of each word
+FUZZY_FIELD_WEIGHTS = {"name": 1.0, "phone": 1.0, "cert": 0.6, "skill": 0.6}  # How much a hit in each field counts
+FUZZY_MIN_SCORE = 0.45  # Share of the query's letter pairs/triples a fuzzy match must have
+EXACT_SCORE = 3.0  # Rank of a name or phone number that contains the query as typed
+PHONE_MIN_DIGITS = 3  # Queries with at least this many digits (and nothing but phone punctuation) search phones
+
+# Certificate menu entries that test a field other than the certification list
+CERT_FILTERS = {
+    "SST": lambda box: box.sst_card == "Yes",
+    "Journeyman": lambda box: box.worker_status == "Journeyman",
+    "Contractor": lambda box: box.worker_status == "Contractor",
+    "OSHA": lambda box: "OSHA Card" in certifications(box),
+    "NJ Certified": lambda box: box.nj_ny_certified == "NJ",
+    "NY Certified": lambda box: box.nj_ny_certified == "NY",
+    "Both": lambda box: box.nj_ny_certified in ["NY", "NJ"],
+}
+
+
+class EmployeeSearchIndex:
+    """Name pieces and filter sets over the employee boxes, for the side panel search.
+
+    Each box is filed under every 1- to GRAM_SIZE-character piece of its
+    lower-cased name and under each certificate and skill menu entry it
+    satisfies. A query intersects a few of those sets (smallest first) and
+    only checks the substring on what is left, instead of testing every
+    box against every filter.
+
+    For typos and partial names every word of the name, phone number,
+    certifications and skills is also filed under its letter pairs and
+    triples (``fuzzy``). Search text is ranked: names and phone numbers
+    containing it first, then boxes sharing enough of its pairs/triples.
+    """
+
+    def __init__(self):
+        self.grams = defaultdict(set)  # Name piece -> boxes
+        self.facets = defaultdict(set)  # ("cert" | "skill", menu entry) -> boxes
+        self.fuzzy = defaultdict(dict)  # Letter pair/triple -> {box: weight of the best field it occurs in}
+        self.filed = {}  # Box -> (lower-cased name, pieces, facets, fuzzy pieces, phone digits) it is filed under
+        self.order = {}  # Box -> sequence number; results keep the order boxes were added in
+        self.sequence = 0
+
+    def clear(self):
+        self.grams.clear()
+        self.facets.clear()
+        self.fuzzy.clear()
+        self.filed.clear()
+        self.order.clear()
+
+    def add(self, box):
+        self.order[box] = self.sequence
+        self.sequence += 1
+        self.file(box)
+
+    def remove(self, box):
+        self.unfile(box)
+        self.order.pop(box, None)
+
+    def update(self, box):
+        """Re-file a box after its name, phone, certifications or skills were edited."""
+        self.unfile(box)
+        self.file(box)
+
+    def file(self, box):
+        name = box.text.lower()
+        grams = name_grams(name)
+        facets = employee_facets(box)
+        fuzzy = employee_fuzzy_grams(box)
+        for gram in grams:
+            self.grams[gram].add(box)
+        for facet in facets:
+            self.facets[facet].add(box)
+        for gram, weight in fuzzy.items():
+            self.fuzzy[gram][box] = weight
+        self.filed[box] = (name, grams, facets, fuzzy, phone_digits(box.phone))
+
+    def unfile(self, box):
+        if box not in self.filed:
+            return
+        _, grams, facets, fuzzy, _ = self.filed.pop(box)
+        for index, keys in ((self.grams, grams), (self.facets, facets), (self.fuzzy, fuzzy)):
+            for key in keys:
+                if isinstance(index[key], dict):
+                    index[key].pop(box, None)
+                else:
+                    index[key].discard(box)
+                if not index[key]:
+                    del index[key]
+
+    def search(self, text="", cert="All", skill="All", unassigned_only=True):
+        """Boxes that pass the certificate and skill menus, best match for `text` first.
+
+        Without search text the boxes come back in the order they were added.
+        """
+        text = text.strip().lower()
+        sets = []
+        if cert != "All":
+            sets.append(self.facets.get(("cert", cert), set()))
+        if skill != "All":
+            sets.append(self.facets.get(("skill", skill), set()))
+        sets.sort(key=len)
+
+        if text:
+            scores = self.rank(text)
+            candidates = [box for box in scores if all(box in facet for facet in sets)]
+            candidates.sort(key=lambda box: (-scores[box], self.order[box]))
+        elif not sets:
+            candidates = self.order  # Dict order is already the order boxes were added in
+        else:
+            candidates = sets[0].intersection(*sets[1:])
+            if len(candidates) * 4 > len(self.order):
+                # Most of the board matched: walking the added order is cheaper than sorting
+                candidates = [box for box in self.order if box in candidates]
+            else:
+                candidates = sorted(candidates, key=self.order.__getitem__)
+        return [box for box in candidates if not (unassigned_only and box.current_snap_box)]
+
+    def rank(self, text):
+        """{box: score} for lower-cased search text: EXACT_SCORE and up for names or phones containing it, else fuzzy."""
+        scores = self.fuzzy_scores(text)
+        for box in self.name_matches(text):
+            name = self.filed[box][0]
+            # Names starting with the text, or with a word that does, come before other names containing it
+            scores[box] = EXACT_SCORE + (name.startswith(text) or f" {text}" in name)
+        digits = query_digits(text)
+        if digits:
+            for box in list(scores):
+                if digits in self.filed[box][4]:
+                    scores[box] = max(scores[box], EXACT_SCORE)
+        return scores
+
+    def name_matches(self, text):
+        """Boxes whose name contains `text`."""
+        sets = [self.grams.get(gram, set()) for gram in query_grams(text)]
+        sets.sort(key=len)
+        candidates = sets[0].intersection(*sets[1:])
+        if len(text) > GRAM_SIZE:
+            # Sharing every piece with the query doesn't guarantee the pieces are in order
+            candidates = [box for box in candidates if text in self.filed[box][0]]
+        return candidates
+
+    def fuzzy_scores(self, text):
+        """{box: share of the query's letter pairs/triples it has} for boxes with at least FUZZY_MIN_SCORE."""
+        digits = query_digits(text)
+        query = fuzzy_grams([digits] if digits else words(text))
+        if not query:
+            return {}
+        postings = sorted((self.fuzzy.get(gram, {}) for gram in query), key=len)
+        # A box missing from all of the rarest len - needed + 1 postings can't reach the minimum score
+        needed = max(1, int(FUZZY_MIN_SCORE * len(query) + 0.999))
+        candidates = set()
+        for posting in postings[:len(postings) - needed + 1]:
+            candidates.update(posting)
+        scores = {}
+        for box in candidates:
+            score = sum(posting.get(box, 0.0) for posting in postings) / len(query)
+            if score >= FUZZY_MIN_SCORE:
+                scores[box] = score
+        return scores
+
+
+def name_grams(name):
+    return {name[i:i + n] for n in range(1, GRAM_SIZE + 1) for i in range(len(name) - n + 1)}
+
+
+def query_grams(text):
+    if len(text) <= GRAM_SIZE:
+        return {text}
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def employee_facets(box):
+    facets = {("cert", name) for name, test in CERT_FILTERS.items() if test(box)}
+    # Any other certificate menu entry is looked up in the certification list itself
+    facets.update(("cert", cert) for cert in certifications(box) if cert not in CERT_FILTERS)
+    skills = box.skills if isinstance(box.skills, list) else [box.skills]
+    facets.update(("skill", skill) for skill in skills if isinstance(skill, str) and skill)
+    return facets
+
+
+def certifications(box):
+    return [cert for cert in box.certifications if isinstance(cert, str)] if isinstance(box.certifications, list) else []
+
+
+def words(text):
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def fuzzy_grams(terms):
+    """Letter pairs and triples of each term, padded so the first and last letters count on their own."""
+    grams = set()
+    for term in terms:
+        padded = f" {term} "
+        for n in FUZZY_GRAM_SIZES:
+            grams.update(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+def phone_digits(phone):
+    """Digits of a phone number; "" for a missing one (None, or NaN in boards written by pandas)."""
+    if isinstance(phone, float):
+        if not math.isfinite(phone) or not phone.is_integer():
+            return ""
+        phone = int(phone)  # A number pandas read as a float, e.g. 7185550101.0
+    if isinstance(phone, bool) or not isinstance(phone, (str, int)):
+        return ""
+    return re.sub(r"\D", "", str(phone))
+
+
+def query_digits(text):
+    """The digits of a query that looks like (part of) a phone number, else ""."""
+    digits = phone_digits(text)
+    if len(digits) >= PHONE_MIN_DIGITS and not re.search(r"[^\d\s()+.-]", text):
+        return digits
+    return ""
+
+
+def employee_fuzzy_grams(box):
+    skills = box.skills if isinstance(box.skills, list) else [box.skills]
+    fields = {
+        "name": words(box.text),
+        "phone": [phone_digits(box.phone)] if phone_digits(box.phone) else [],
+        "cert": [word for cert in certifications(box) for word in words(cert)],
+        "skill": [word for skill in skills if isinstance(skill, str) for word in words(skill)],
+    }
+    grams = {}
+    # Lightest fields first, so a piece found in several fields keeps the weight of the heaviest
+    for field in sorted(fields, key=FUZZY_FIELD_WEIGHTS.get):
+        grams.update(dict.fromkeys(fuzzy_grams(fields[field]), FUZZY_FIELD_WEIGHTS[field]))
+    return grams
@@ -0,0 +1,122 @@
+# board_serializer.py
+import json
+
+from constants import BOARD_FORMAT
+
+try:
+    import orjson  # Optional: a much faster JSON codec, used automatically when installed
+except ImportError:
+    orjson = None
+
+COORD_KEYS = ("ElectricianBoxCoords", "PMCoords", "GMCoords", "ForemanCoords", "SuperCoords")
+
+
+def round_coords(values, precision):
+    return [round(v, precision) if isinstance(v, float) else v for v in values]
+
+
+class BoardSerializer:
+    """Turns board state dicts into JSON text and back.
+
+    ``indent=None`` writes compact JSON and streams the board record by
+    record, so the employees may be any iterable (e.g. a generator) rather
+    than a fully built list. With ``precision`` set, canvas coordinates are
+    rounded before writing. Loading always accepts either layout.
+    """
+
+    def __init__(self, indent=None, precision=None, codec=None):
+        self.indent = indent
+        self.precision = precision
+        if codec is None:
+            # orjson only does 2-space indentation, so pretty output stays on the standard library
+            codec = "orjson" if orjson and indent is None else "json"
+        self.codec = codec
+
+    def encode(self, obj):
+        if self.codec == "orjson":
+            try:
+                return orjson.dumps(obj).decode("utf-8")
+            except TypeError:
+                pass  # Types orjson does not handle fall back to the standard library
+        return json.dumps(obj, separators=(",", ":"))
+
+    def prepare_employee(self, emp):
+        if self.precision is None:
+            return emp
+        emp = dict(emp)
+        for key in ("x", "y"):
+            if isinstance(emp.get(key), float):
+                emp[key] = round(emp[key], self.precision)
+        return emp
+
+    def prepare_job_site(self, job):
+        if self.precision is None:
+            return job
+        job = dict(job)
+        for key in ("x", "y"):
+            if isinstance(job.get(key), float):
+                job[key] = round(job[key], self.precision)
+        if isinstance(job.get("status"), dict):
+            status = dict(job["status"])
+            for key in COORD_KEYS:
+                if isinstance(status.get(key), list):
+                    status[key] = round_coords(status[key], self.precision)
+            job["status"] = status
+        return job
+
+    def iter_chunks(self, state):
+        """Yield the serialized board piece by piece."""
+        employees = (self.prepare_employee(emp) for emp in state.get("employees", []))
+        job_sites = (self.prepare_job_site(job) for job in state.get("job_sites", []))
+        rest = {key: value for key, value in state.items() if key not in ("employees", "job_sites")}
+
+        if self.indent is not None:
+            board = {"employees": list(employees), "job_sites": list(job_sites)}
+            board.update(rest)
+            yield from json.JSONEncoder(indent=self.indent).iterencode(board)
+            return
+
+        yield '{"employees":['
+        for i, emp in enumerate(employees):
+            yield ("," if i else "") + self.encode(emp)
+        yield '],"job_sites":['
+        for i, job in enumerate(job_sites):
+            yield ("," if i else "") + self.encode(job)
+        yield "]"
+        for key, value in rest.items():
+            yield f",{json.dumps(key)}:{self.encode(value)}"
+        yield "}"
+
+    def dumps(self, state):
+        return "".join(self.iter_chunks(state))
+
+    def dump(self, state, path):
+        with open(path, "w") as f:
+            for chunk in self.iter_chunks(state):
+                f.write(chunk)
+
+    def loads(self, text):
+        if orjson:
+            try:
+                return orjson.loads(text)
+            except ValueError:
+                pass  # e.g. NaN written by pandas, which only the standard library accepts
+        return json.loads(text)
+
+    def load(self, path):
+        with open(path, "r") as f:
+            return self.loads(f.read())
+
+
+SERIALIZERS = {
+    "compact": BoardSerializer(indent=None, precision=2),
+    "pretty": BoardSerializer(indent=4),
+}
+
+
+def get_serializer(mode=None):
+    """Return the serializer for `mode` ("compact" or "pretty"), defaulting to BOARD_FORMAT."""
+    mode = mode or BOARD_FORMAT
+    if mode not in SERIALIZERS:
+        raise ValueError(f"Unknown board format '{mode}', expected one of {sorted(SERIALIZERS)}")
+    return SERIALIZERS[mode]
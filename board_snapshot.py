@@ -0,0 +1,382 @@
+# board_snapshot.py
+import argparse
+import json
+import math
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+from collections import namedtuple
+
+from board_view import with_legacy_coordinates
+
+# Compact binary snapshot of a board (.fbs), written next to output.json.
+#
+# Layout (little-endian):
+#   header    magic, version, record counts and the byte offset of every section
+#   meta      UTF-8 JSON with the top-level keys (scale, scroll, ...)
+#   values    interned scalar table: every name, role, skill, status, phone, ... once
+#             (a JSON array, which keeps str/int/float/bool/None apart and decodes in C)
+#   lists     interned lists of value indexes (skills, certifications, electricians), also JSON
+#   employees fixed-width records of value/list indexes
+#   coords    two float64 arrays with every employee's x and y
+#   hubs      fixed-width records: name, note, flags, x/y and the five snap box rectangles
+#
+# Records are fixed width, so record i of a section lives at
+# section_offset + i * record_size and can be read without scanning.
+
+MAGIC = b"FBSN"
+VERSION = 2  # 2: employee "key"
+
+HEADER = struct.Struct("<4sHHIIII6Q")
+
+EMPLOYEE_FIELDS = ("key", "text", "role", "phone", "skills", "sst_card", "nj_ny_certified", "electrician_rank",
+                   "certifications", "worker_status", "current_status", "job_site", "box")
+LIST_FIELDS = {"skills", "certifications"}
+EMPLOYEE = struct.Struct(f"<{len(EMPLOYEE_FIELDS)}I")
+
+STATUS_FLAGS = ("PM", "GM", "Foreman", "Super", "Collapsed")
+STATUS_COORDS = ("ElectricianBoxCoords", "PMCoords", "GMCoords", "ForemanCoords", "SuperCoords")
+# name, note, electricians (list), flags (2 bits per flag: missing/false/true), x, y, 5 x 4 coords
+HUB = struct.Struct("<IIIHdd20d")
+
+MISSING = 0xFFFFFFFF
+SCALAR = 0x80000000  # Set on a list field that holds a plain value instead of a list
+
+EmployeeRow = namedtuple("EmployeeRow", EMPLOYEE_FIELDS + ("x", "y"))
+HubRow = namedtuple("HubRow", ("name", "note", "x", "y", "status"))
+
+
+def snapshot_path_for(json_path):
+    """Return the binary snapshot path for a board file, e.g. output.json -> output.fbs."""
+    return os.path.splitext(json_path)[0] + ".fbs"
+
+
+class _Interner:
+    def __init__(self):
+        self.values = []
+        self.value_index = {}
+        self.lists = []
+        self.list_index = {}
+
+    def value(self, value):
+        # Key on the type too, so 1, 1.0 and True stay distinct; repr() makes NaN hashable
+        key = (type(value).__name__, repr(value) if isinstance(value, float) else value)
+        index = self.value_index.get(key)
+        if index is None:
+            index = self.value_index[key] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def list(self, values):
+        key = tuple(self.value(v) for v in values)
+        index = self.list_index.get(key)
+        if index is None:
+            index = self.list_index[key] = len(self.lists)
+            self.lists.append(key)
+        return index
+
+
+def _coords4(coords):
+    if isinstance(coords, (list, tuple)) and len(coords) == 4:
+        return [float(c) for c in coords]
+    return [math.nan] * 4
+
+
+def encode_snapshot(state):
+    """Serialize a board state dict into the binary snapshot format."""
+    interner = _Interner()
+
+    employees = state.get("employees", [])
+    employee_bytes = bytearray()
+    xs = array("d")
+    ys = array("d")
+    for emp in employees:
+        fields = []
+        for name in EMPLOYEE_FIELDS:
+            if name not in emp:
+                fields.append(MISSING)
+            elif name in LIST_FIELDS:
+                value = emp[name]
+                fields.append(interner.list(value) if isinstance(value, list) else interner.value(value) | SCALAR)
+            else:
+                fields.append(interner.value(emp[name]))
+        employee_bytes += EMPLOYEE.pack(*fields)
+        xs.append(float(emp["x"]) if emp.get("x") is not None else math.nan)
+        ys.append(float(emp["y"]) if emp.get("y") is not None else math.nan)
+
+    hubs = state.get("job_sites", [])
+    hub_bytes = bytearray()
+    for job in hubs:
+        status = job.get("status", {})
+        flags = 0
+        for bit, name in enumerate(STATUS_FLAGS):
+            if name in status:
+                flags |= (2 if status[name] else 1) << (bit * 2)
+        electricians = status.get("Electrician")
+        coords = []
+        for name in STATUS_COORDS:
+            coords.extend(_coords4(status.get(name)))
+        hub_bytes += HUB.pack(interner.value(job["name"]),
+                              interner.value(job["note"]) if "note" in job else MISSING,
+                              interner.list(electricians) if isinstance(electricians, list) else MISSING,
+                              flags, float(job.get("x", 0)), float(job.get("y", 0)), *coords)
+
+    meta = {k: v for k, v in state.items() if k not in ("employees", "job_sites")}
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    value_bytes = json.dumps(interner.values, separators=(",", ":")).encode("utf-8")
+    list_bytes = json.dumps(interner.lists, separators=(",", ":")).encode("utf-8")
+
+    meta_off = HEADER.size
+    values_off = meta_off + len(meta_bytes)
+    lists_off = values_off + len(value_bytes)
+    employees_off = lists_off + len(list_bytes)
+    coords_off = employees_off + len(employee_bytes)
+    hubs_off = coords_off + 16 * len(employees)
+    header = HEADER.pack(MAGIC, VERSION, 0, len(interner.values), len(interner.lists), len(employees), len(hubs),
+                         values_off, lists_off, employees_off, coords_off, hubs_off, hubs_off + len(hub_bytes))
+    return b"".join([header, meta_bytes, value_bytes, list_bytes, bytes(employee_bytes),
+                     xs.tobytes(), ys.tobytes(), bytes(hub_bytes)])
+
+
+class SnapshotReader:
+    """Random-access view over a binary snapshot.
+
+    Rows are materialized straight from the fixed-width records as tuples;
+    ``to_state`` builds the regular board dict for code that expects one.
+    """
+
+    def __init__(self, data):
+        self.buf = memoryview(data)
+        (magic, version, _, n_values, n_lists, self.employee_count, self.hub_count, self.values_off, self.lists_off,
+         self.employees_off, self.coords_off, self.hubs_off, end) = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a board snapshot file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported board snapshot version {version}")
+        self.meta = json.loads(bytes(self.buf[HEADER.size:self.values_off]).decode("utf-8"))
+        self.values = json.loads(bytes(self.buf[self.values_off:self.lists_off]).decode("utf-8"))
+        self.lists = json.loads(bytes(self.buf[self.lists_off:self.employees_off]).decode("utf-8"))
+        coords = array("d")
+        coords.frombytes(self.buf[self.coords_off:self.hubs_off])
+        self.xs = coords[:self.employee_count]
+        self.ys = coords[self.employee_count:]
+
+    @classmethod
+    def open(cls, path):
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def employee_offset(self, index):
+        return self.employees_off + index * EMPLOYEE.size
+
+    def hub_offset(self, index):
+        return self.hubs_off + index * HUB.size
+
+    def _field(self, name, index):
+        if name in LIST_FIELDS and not index & SCALAR:
+            return [self.values[i] for i in self.lists[index]]
+        return self.values[index & ~SCALAR]
+
+    def _employee_values(self, fields):
+        return [None if index == MISSING else self._field(name, index)
+                for name, index in zip(EMPLOYEE_FIELDS, fields)]
+
+    def employee(self, index):
+        """Return one employee as an EmployeeRow without decoding the rest of the board."""
+        fields = EMPLOYEE.unpack_from(self.buf, self.employee_offset(index))
+        return EmployeeRow(*self._employee_values(fields), self.xs[index], self.ys[index])
+
+    def columns(self):
+        """Decode every employee field column by column, straight from the record table."""
+        raw = array("I")
+        raw.frombytes(self.buf[self.employees_off:self.coords_off])
+        if sys.byteorder != "little":
+            raw.byteswap()
+        width = len(EMPLOYEE_FIELDS)
+        values = self.values
+        lists = [[values[i] for i in items] for items in self.lists]
+        columns = {}
+        for col, name in enumerate(EMPLOYEE_FIELDS):
+            indexes = raw[col::width]
+            if MISSING in indexes:
+                columns[name] = [None if i == MISSING else self._field(name, i) for i in indexes]
+            elif name in LIST_FIELDS:
+                # Copy interned lists so callers can mutate their own
+                columns[name] = [values[i & ~SCALAR] if i & SCALAR else lists[i][:] for i in indexes]
+            else:
+                columns[name] = [values[i] for i in indexes]
+        return columns, raw
+
+    def employees(self):
+        columns, _ = self.columns()
+        for row in zip(*columns.values(), self.xs, self.ys):
+            yield EmployeeRow._make(row)
+
+    def _hub_row(self, record):
+        name, note, electricians, flags, x, y = record[:6]
+        status = {}
+        for bit, flag in enumerate(STATUS_FLAGS[:4]):
+            if (flags >> (bit * 2)) & 3:
+                status[flag] = (flags >> (bit * 2)) & 3 == 2
+        if electricians != MISSING:
+            values = self.values
+            status["Electrician"] = [values[i] for i in self.lists[electricians]]
+        for i, key in enumerate(STATUS_COORDS):
+            box = list(record[6 + i * 4:10 + i * 4])
+            if box[0] == box[0]:  # NaN marks a missing rectangle
+                status[key] = box
+        collapsed = (flags >> 8) & 3
+        if collapsed:
+            status["Collapsed"] = collapsed == 2
+        return HubRow(self.values[name], self.values[note] if note != MISSING else None, x, y, status)
+
+    def hub(self, index):
+        return self._hub_row(HUB.unpack_from(self.buf, self.hub_offset(index)))
+
+    def hubs(self):
+        for record in HUB.iter_unpack(self.buf[self.hubs_off:self.hubs_off + self.hub_count * HUB.size]):
+            yield self._hub_row(record)
+
+    def to_state(self):
+        """Build the board state dict in the same shape as output.json."""
+        columns, raw = self.columns()
+        keys = EMPLOYEE_FIELDS + ("x", "y")
+        employees = [dict(zip(keys, row)) for row in zip(*columns.values(), self.xs, self.ys)]
+
+        # Fields that were absent from the original record stay absent
+        width = len(EMPLOYEE_FIELDS)
+        for col, name in enumerate(EMPLOYEE_FIELDS):
+            indexes = raw[col::width]
+            if MISSING in indexes:
+                for emp, index in zip(employees, indexes):
+                    if index == MISSING:
+                        del emp[name]
+        if any(math.isnan(x) for x in self.xs):
+            for emp in employees:
+                if math.isnan(emp["x"]):
+                    del emp["x"], emp["y"]
+
+        job_sites = []
+        for hub in self.hubs():
+            job = {"name": hub.name, "x": hub.x, "y": hub.y, "status": hub.status}
+            if hub.note is not None:
+                job["note"] = hub.note
+            job_sites.append(job)
+
+        state = {"employees": employees, "job_sites": job_sites}
+        state.update(self.meta)
+        return state
+
+
+def write_snapshot(state, path):
+    with open(path, "wb") as f:
+        f.write(encode_snapshot(state))
+
+
+def read_snapshot(path):
+    """Load a binary snapshot as a board state dict."""
+    return SnapshotReader.open(path).to_state()
+
+
+def json_to_snapshot(json_path, snapshot_path=None):
+    snapshot_path = snapshot_path or snapshot_path_for(json_path)
+    with open(json_path, "r") as f:
+        write_snapshot(json.load(f), snapshot_path)
+    print(f"[INFO] Wrote binary snapshot '{snapshot_path}'")
+    return snapshot_path
+
+
+def snapshot_to_json(snapshot_path, json_path):
+    with open(json_path, "w") as f:
+        json.dump(with_legacy_coordinates(read_snapshot(snapshot_path)), f, indent=4)
+    print(f"[INFO] Wrote JSON board '{json_path}'")
+    return json_path
+
+
+def synthetic_board(employee_count, seed=0):
+    """Generate a board shaped like output.json with `employee_count` employees."""
+    rng = random.Random(seed)
+    roles = ["Electrician", "Fire Alarm Electrician", "Roughing Electrician", "PM", "GM", "Foreman", "Super"]
+    skills = ["Helper", "Junior Mechanic", "Mechanic", "Sub Foreman"]
+    hub_count = max(1, employee_count // 3)
+    job_sites = []
+    for i in range(hub_count):
+        x, y = 50.0 + (i % 8) * 211.5, 50.0 + (i // 8) * 281.25
+        box = lambda top, height: [x + 2.25, y + top, x + 200.25, y + top + height]
+        job_sites.append({
+            "name": f"Job Site {i + 1}", "x": x, "y": y,
+            "status": {"PM": False, "GM": True, "Foreman": False, "Super": False, "Electrician": [],
+                       "ElectricianBoxCoords": box(81.0, 164.25), "PMCoords": box(2.25, 15.75),
+                       "GMCoords": box(20.25, 15.75), "ForemanCoords": box(38.25, 15.75),
+                       "SuperCoords": box(56.25, 15.75), "Collapsed": False},
+            "note": "Bring ladders" if i % 5 == 0 else "",
+        })
+    employees = []
+    for i in range(employee_count):
+        site = job_sites[rng.randrange(hub_count)] if rng.random() < 0.8 else None
+        employees.append({
+            "text": f"Employee {i}", "role": rng.choice(roles), "phone": f"555-{i % 1000:03d}-{i % 10000:04d}",
+            "skills": [rng.choice(skills)], "sst_card": rng.choice(["Yes", "No"]),
+            "nj_ny_certified": rng.choice(["NJ", "NY", "Both"]), "electrician_rank": str(rng.randrange(6)),
+            "certifications": ["OSHA Card"] if rng.random() < 0.5 else [],
+            "worker_status": rng.choice(["Journeyman", "Contractor"]),
+            "current_status": rng.choice(["On-site", "On-site", "Sick", "Vacation"]),
+            "job_site": site["name"] if site else None, "box": "Electrician" if site else None,
+            "x": round(rng.uniform(0, 2000), 2), "y": round(rng.uniform(-3300, 3000), 2),
+        })
+    return {"employees": employees, "job_sites": job_sites, "scale": 0.225,
+            "canvas_transform": [-54.0, -56.0], "scroll_x": 0.0, "scroll_y": 0.0}
+
+
+def _best_of(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_benchmark(sizes=(100, 1000, 10000)):
+    """Compare output.json (as written by save_state) with the binary snapshot."""
+    print(f"{'employees':>10} {'format':>7} {'size KB':>9} {'save ms':>9} {'load ms':>9}")
+    for size in sizes:
+        state = synthetic_board(size)
+        save_json, text = _best_of(lambda: json.dumps(state, indent=4))
+        load_json, _ = _best_of(lambda: json.loads(text))
+        save_bin, data = _best_of(lambda: encode_snapshot(state))
+        load_bin, _ = _best_of(lambda: SnapshotReader(data).to_state())
+        rows_bin, _ = _best_of(lambda: sum(1 for _ in SnapshotReader(data).employees()))
+        assert SnapshotReader(data).to_state() == state
+        print(f"{size:>10} {'json':>7} {len(text.encode()) / 1024:>9.1f} {save_json * 1000:>9.2f} {load_json * 1000:>9.2f}")
+        print(f"{size:>10} {'fbs':>7} {len(data) / 1024:>9.1f} {save_bin * 1000:>9.2f} {load_bin * 1000:>9.2f}"
+              f"   (rows only: {rows_bin * 1000:.2f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert boards between output.json and the binary snapshot format.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    to_binary = commands.add_parser("to-binary", help="Write a .fbs snapshot from a JSON board")
+    to_binary.add_argument("json_file")
+    to_binary.add_argument("snapshot_file", nargs="?")
+    to_json = commands.add_parser("to-json", help="Write a JSON board from a .fbs snapshot")
+    to_json.add_argument("snapshot_file")
+    to_json.add_argument("json_file")
+    benchmark = commands.add_parser("benchmark", help="Compare load/save time and size against JSON")
+    benchmark.add_argument("sizes", nargs="*", type=int, default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    if args.command == "to-binary":
+        json_to_snapshot(args.json_file, args.snapshot_file)
+    elif args.command == "to-json":
+        snapshot_to_json(args.snapshot_file, args.json_file)
+    else:
+        run_benchmark(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
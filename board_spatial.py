@@ -0,0 +1,55 @@
+# board_spatial.py
+from collections import defaultdict
+
+SNAP_BOX_TYPES = ("PM", "GM", "Foreman", "Super", "Electrician")
+
+
+class SnapBoxIndex:
+    """Uniform grid over the snap boxes of every hub, for point queries while dragging.
+
+    ``rebuild`` reads each snap box's coordinates once; after that a query
+    looks at the one grid cell under the pointer instead of asking the canvas
+    for every hub's boxes. Matches come back in the same order as a scan of
+    ``hub_list`` x SNAP_BOX_TYPES would find them.
+    """
+
+    def __init__(self):
+        self.cells = defaultdict(list)
+        self.cell_size = 1.0
+        self.version = None  # Layout version the index was built for
+        self.box_count = 0
+
+    def rebuild(self, canvas, hubs, version):
+        entries = []
+        for hub in hubs:
+            for box_type in SNAP_BOX_TYPES:
+                item = getattr(hub, f"{box_type.lower()}_box")
+                coords = canvas.coords(item)
+                if len(coords) == 4:
+                    entries.append((len(entries), coords, hub, box_type, item))
+
+        self.cells.clear()
+        # Cells about the size of a snap box keep each cell's list short at any zoom
+        widths = [coords[2] - coords[0] for _, coords, _, _, _ in entries]
+        self.cell_size = max(1.0, sum(widths) / len(widths)) if widths else 1.0
+        for entry in entries:
+            x1, y1, x2, y2 = entry[1]
+            for cx in range(self.cell(x1), self.cell(x2) + 1):
+                for cy in range(self.cell(y1), self.cell(y2) + 1):
+                    self.cells[cx, cy].append(entry)
+        self.version = version
+        self.box_count = len(entries)
+
+    def cell(self, value):
+        return int(value // self.cell_size)
+
+    def find_all(self, x, y):
+        """All (hub, box type, coords, canvas item) whose snap box contains canvas point (x, y)."""
+        hits = [entry for entry in self.cells.get((self.cell(x), self.cell(y)), ())
+                if entry[1][0] < x < entry[1][2] and entry[1][1] < y < entry[1][3]]
+        hits.sort(key=lambda entry: entry[0])
+        return [(hub, box_type, coords, item) for _, coords, hub, box_type, item in hits]
+
+    def find(self, x, y):
+        hits = self.find_all(x, y)
+        return hits[0] if hits else None
@@ -0,0 +1,387 @@
+# board_sqlite.py
+import argparse
+import json
+import sqlite3
+import threading
+
+from board_journal import apply_record, load_board_state
+from board_serializer import get_serializer
+from board_sync import assign_employee_keys, same_value
+from board_view import with_legacy_coordinates
+
+# One SQLite file holds the whole board. WAL mode lets readers (Excel export,
+# dashboard, other whiteboards) query it while a whiteboard is writing, and
+# every board change is a small transaction touching only the affected rows.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS employees (
+    id INTEGER PRIMARY KEY,
+    key TEXT,
+    position INTEGER NOT NULL,
+    text TEXT,
+    role TEXT,
+    phone,
+    skills TEXT,
+    sst_card TEXT,
+    nj_ny_certified TEXT,
+    electrician_rank,
+    certifications TEXT,
+    worker_status TEXT,
+    current_status TEXT,
+    x REAL,
+    y REAL
+);
+CREATE INDEX IF NOT EXISTS employees_position ON employees(position);
+CREATE TABLE IF NOT EXISTS job_sites (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    x REAL,
+    y REAL,
+    status TEXT
+);
+CREATE TABLE IF NOT EXISTS assignments (
+    employee_id INTEGER PRIMARY KEY REFERENCES employees(id) ON DELETE CASCADE,
+    job_site TEXT,
+    box TEXT
+);
+CREATE INDEX IF NOT EXISTS assignments_job_site ON assignments(job_site);
+CREATE TABLE IF NOT EXISTS notes (
+    job_site TEXT PRIMARY KEY,
+    note TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+EMPLOYEE_COLUMNS = ("key", "text", "role", "phone", "skills", "sst_card", "nj_ny_certified", "electrician_rank",
+                    "certifications", "worker_status", "current_status", "x", "y")
+JSON_COLUMNS = {"skills", "certifications"}
+
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+
+def is_sqlite_path(path):
+    return str(path).lower().endswith(SQLITE_EXTENSIONS)
+
+
+class SQLiteBoardStore:
+    """Board storage in a single SQLite database.
+
+    ``load`` returns the same state dict as output.json, ``save`` replaces
+    the whole board in one transaction (used to import a board), ``update``
+    writes only the rows that differ from the board this store last wrote,
+    and ``apply`` turns a single change record (the ones written to the
+    journal, see board_journal.py) into row-level UPSERTs.
+
+    Other whiteboards write to the same database, so ``update`` only deletes
+    rows this store wrote itself and that are gone from the new state; rows
+    someone else added are left alone even if the board being saved was
+    built before they showed up. ``load`` does not change what was written.
+
+    Employees are rows keyed by their "key" (see board_sync.assign_employee_keys);
+    ``position`` only keeps the order of the employee list.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self._add_employee_keys()
+        self._saved = None  # The board as this store last wrote it, which ``update`` diffs against
+
+    def _add_employee_keys(self):
+        """Give databases created before employees had keys a key column, filled like an old output.json."""
+        with self.conn:
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(employees)")}
+            if "key" not in columns:
+                self.conn.execute("ALTER TABLE employees ADD COLUMN key TEXT")
+            rows = self.conn.execute("SELECT id, text, key FROM employees ORDER BY position").fetchall()
+            if any(key is None for _, _, key in rows):
+                state = assign_employee_keys({"employees": [{"text": text, "key": key} for _, text, key in rows]})
+                self.conn.executemany("UPDATE employees SET key = ? WHERE id = ?",
+                                      [(emp["key"], row[0]) for emp, row in zip(state["employees"], rows)])
+            self.conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS employees_key ON employees(key)")
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    # -----------------------------------------------------------
+    # Reading
+    # -----------------------------------------------------------
+    def load(self):
+        """Return the board as a state dict shaped like output.json."""
+        with self._lock:
+            cur = self.conn.cursor()
+            employees = []
+            rows = cur.execute(f"""
+                SELECT {", ".join("e." + c for c in EMPLOYEE_COLUMNS)}, a.job_site, a.box
+                FROM employees e LEFT JOIN assignments a ON a.employee_id = e.id
+                ORDER BY e.position
+            """)
+            for row in rows:
+                emp = dict(zip(EMPLOYEE_COLUMNS, row[:-2]))
+                for column in JSON_COLUMNS:
+                    emp[column] = json.loads(emp[column]) if emp[column] is not None else []
+                emp["job_site"], emp["box"] = row[-2], row[-1]
+                # Keep the key order of output.json
+                emp["x"] = emp.pop("x")
+                emp["y"] = emp.pop("y")
+                employees.append(emp)
+
+            job_sites = []
+            rows = cur.execute("""
+                SELECT j.name, j.x, j.y, j.status, n.note
+                FROM job_sites j LEFT JOIN notes n ON n.job_site = j.name
+                ORDER BY j.position
+            """)
+            for name, x, y, status, note in rows:
+                job_sites.append({"name": name, "x": x, "y": y, "status": json.loads(status or "{}"),
+                                  "note": note or ""})
+
+            state = {"employees": employees, "job_sites": job_sites}
+            for key, value in cur.execute("SELECT key, value FROM meta"):
+                state[key] = json.loads(value)
+            return state
+
+    # -----------------------------------------------------------
+    # Writing
+    # -----------------------------------------------------------
+    def save(self, state):
+        """Replace the whole board with `state` in a single transaction."""
+        state = assign_employee_keys(dict(state, employees=list(state.get("employees", []))))
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM assignments")
+            self.conn.execute("DELETE FROM employees")
+            self.conn.execute("DELETE FROM notes")
+            self.conn.execute("DELETE FROM job_sites")
+            for position, emp in enumerate(state["employees"]):
+                self._put_employee(emp, position)
+            for position, job in enumerate(state.get("job_sites", [])):
+                self._upsert_job_site(job, position)
+            self._put_meta(state)
+            self._remember(state)
+
+    def update(self, state):
+        """Write `state` over what this store last wrote, touching only the rows that differ.
+
+        The first update writes every row of `state` and deletes nothing.
+        """
+        state = assign_employee_keys(dict(state, employees=list(state.get("employees", []))))
+        with self._lock, self.conn:
+            old = self._saved or {"employees": [], "job_sites": []}
+            old_employees = {emp["key"]: emp for emp in old["employees"]}
+            new_keys = {emp["key"] for emp in state["employees"]}
+            removed = [key for key in old_employees if key not in new_keys]
+            self.conn.executemany("DELETE FROM employees WHERE key = ?", [(key,) for key in removed])
+            stored = dict(self.conn.execute("SELECT key, position FROM employees"))
+            positions = keep_positions([emp["key"] for emp in state["employees"]], stored)
+            written = 0
+            for emp, position in zip(state["employees"], positions):
+                before = old_employees.get(emp["key"])
+                if before is None or stored.get(emp["key"]) != position or not same_record(before, emp):
+                    self._put_employee(emp, position)
+                    written += 1
+
+            old_jobs = {job["name"]: job for job in old["job_sites"]}
+            new_names = {job["name"] for job in state["job_sites"]}
+            for name in old_jobs:
+                if name not in new_names:
+                    self._erase_job_site(name)
+            stored = dict(self.conn.execute("SELECT name, position FROM job_sites"))
+            positions = keep_positions([job["name"] for job in state["job_sites"]], stored)
+            for job, position in zip(state["job_sites"], positions):
+                before = old_jobs.get(job["name"])
+                if before is None or stored.get(job["name"]) != position or not same_record(before, job):
+                    self._upsert_job_site(job, position)
+                    written += 1
+
+            if not same_record(meta_of(old), meta_of(state)):
+                self._put_meta(state)
+            self._remember(state)
+        print(f"Board database updated: {written} rows written, {len(removed)} employees removed")
+
+    def apply(self, record):
+        """Apply one change record as row-level updates in a single transaction."""
+        op = record["op"]
+        with self._lock, self.conn:
+            if op in ("move", "assign", "edit", "add_employee"):
+                self._put_employee(record["employee"])
+            elif op == "delete_employee":
+                # Its assignment goes with it (ON DELETE CASCADE)
+                self.conn.execute("DELETE FROM employees WHERE key = ?", (record["key"],))
+            elif op == "hub_rename":
+                self.conn.execute("UPDATE job_sites SET name = ? WHERE name = ?", (record["new"], record["old"]))
+                self.conn.execute("UPDATE assignments SET job_site = ? WHERE job_site = ?",
+                                  (record["new"], record["old"]))
+                self.conn.execute("UPDATE notes SET job_site = ? WHERE job_site = ?", (record["new"], record["old"]))
+            elif op == "hub_erase":
+                self._erase_job_site(record["name"])
+            elif op == "note":
+                self._upsert_note(record["name"], record["note"])
+            elif op != "hub_add":
+                print(f"[WARNING] Unknown board change '{op}', skipping.")
+
+            for job in record.get("hubs", []):
+                self._upsert_job_site(job)
+            if self._saved is not None:
+                apply_record(self._saved, record)
+
+    def _remember(self, state):
+        # Copies, so the caller's later changes do not leak in; apply_record keeps this in step with our writes
+        self._saved = dict(state, employees=[dict(emp) for emp in state["employees"]],
+                           job_sites=[dict(job) for job in state["job_sites"]])
+
+    def _employee_values(self, emp):
+        return [json.dumps(emp.get(c)) if c in JSON_COLUMNS else emp.get(c) for c in EMPLOYEE_COLUMNS]
+
+    def _put_employee(self, emp, position=None):
+        """UPSERT an employee by key; new employees go to the end of the list unless `position` is given."""
+        if position is None:
+            row = self.conn.execute("SELECT position FROM employees WHERE key = ?", (emp["key"],)).fetchone()
+            if row:
+                position = row[0]
+            else:
+                position = self.conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM employees").fetchone()[0]
+        self.conn.execute(
+            f"INSERT INTO employees (position, {', '.join(EMPLOYEE_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' for _ in EMPLOYEE_COLUMNS)}) "
+            f"ON CONFLICT(key) DO UPDATE SET position = excluded.position, "
+            f"{', '.join(f'{c} = excluded.{c}' for c in EMPLOYEE_COLUMNS[1:])}",
+            [position] + self._employee_values(emp))
+        employee_id = self.conn.execute("SELECT id FROM employees WHERE key = ?", (emp["key"],)).fetchone()[0]
+        self._put_assignment(employee_id, emp)
+
+    def _put_assignment(self, employee_id, emp):
+        if emp.get("job_site") and emp.get("box"):
+            self.conn.execute("""
+                INSERT INTO assignments (employee_id, job_site, box) VALUES (?, ?, ?)
+                ON CONFLICT(employee_id) DO UPDATE SET job_site = excluded.job_site, box = excluded.box
+            """, (employee_id, emp["job_site"], emp["box"]))
+        else:
+            self.conn.execute("DELETE FROM assignments WHERE employee_id = ?", (employee_id,))
+
+    def _upsert_job_site(self, job, position=None):
+        if position is None:
+            row = self.conn.execute("SELECT position FROM job_sites WHERE name = ?", (job["name"],)).fetchone()
+            if row:
+                position = row[0]
+            else:
+                position = self.conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM job_sites").fetchone()[0]
+        self.conn.execute("""
+            INSERT INTO job_sites (name, position, x, y, status) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET position = excluded.position, x = excluded.x, y = excluded.y,
+                                            status = excluded.status
+        """, (job["name"], position, job.get("x"), job.get("y"), json.dumps(job.get("status", {}))))
+        self._upsert_note(job["name"], job.get("note", ""))
+
+    def _erase_job_site(self, name):
+        self.conn.execute("DELETE FROM job_sites WHERE name = ?", (name,))
+        self.conn.execute("DELETE FROM notes WHERE job_site = ?", (name,))
+        # Whoever was in it is unassigned now, like on the board
+        self.conn.execute("DELETE FROM assignments WHERE job_site = ?", (name,))
+
+    def _put_meta(self, state):
+        self.conn.execute("DELETE FROM meta")
+        for key, value in meta_of(state).items():
+            self.conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+    def _upsert_note(self, job_site, note):
+        if note:
+            self.conn.execute("""
+                INSERT INTO notes (job_site, note) VALUES (?, ?)
+                ON CONFLICT(job_site) DO UPDATE SET note = excluded.note
+            """, (job_site, note))
+        else:
+            self.conn.execute("DELETE FROM notes WHERE job_site = ?", (job_site,))
+
+    # -----------------------------------------------------------
+    # JSON import / export
+    # -----------------------------------------------------------
+    def import_json(self, json_path):
+        self.save(get_serializer().load(json_path))
+        print(f"[INFO] Imported '{json_path}' into '{self.path}'")
+
+    def export_json(self, json_path, mode=None):
+        get_serializer(mode).dump(with_legacy_coordinates(self.load()), json_path)
+        print(f"[INFO] Exported '{self.path}' to '{json_path}'")
+
+
+def meta_of(state):
+    """The top-level keys of a board other than its employees and job sites (view, scroll, ...)."""
+    return {key: value for key, value in state.items() if key not in ("employees", "job_sites")}
+
+
+def keep_positions(keys, stored):
+    """Positions that put rows in the order of `keys` while moving as few stored rows as possible.
+
+    Rows keep their stored position while it still comes after the previous
+    row's, so deletes and appends rewrite no other rows; positions may have gaps.
+    """
+    positions = []
+    last = -1
+    for key in keys:
+        position = stored.get(key)
+        if position is None or position <= last:
+            position = last + 1
+        positions.append(position)
+        last = position
+    return positions
+
+
+def same_record(a, b):
+    return a.keys() == b.keys() and all(same_value(a[key], b[key]) for key in a)
+
+
+def load_board(path):
+    """Load a board from output.json (plus journal) or from a SQLite database."""
+    if not is_sqlite_path(path):
+        return load_board_state(path)
+    store = SQLiteBoardStore(path)
+    try:
+        return store.load()
+    finally:
+        store.close()
+
+
+def save_board(state, path):
+    """Write a whole board to output.json or to a SQLite database."""
+    if not is_sqlite_path(path):
+        get_serializer().dump(with_legacy_coordinates(state), path)
+        return
+    store = SQLiteBoardStore(path)
+    try:
+        store.save(state)
+    finally:
+        store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move a board between output.json and a SQLite database.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_cmd = commands.add_parser("import", help="Load a JSON board into the database")
+    import_cmd.add_argument("json_file")
+    import_cmd.add_argument("db_file")
+    export_cmd = commands.add_parser("export", help="Write the database out as a JSON board")
+    export_cmd.add_argument("db_file")
+    export_cmd.add_argument("json_file")
+    export_cmd.add_argument("--compact", action="store_true", help="No indentation, coordinates rounded")
+    args = parser.parse_args()
+
+    store = SQLiteBoardStore(args.db_file)
+    try:
+        if args.command == "import":
+            store.import_json(args.json_file)
+        else:
+            store.export_json(args.json_file, "compact" if args.compact else None)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
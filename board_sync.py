@@ -0,0 +1,192 @@
+# board_sync.py
+import threading
+import time
+import uuid
+
+EMPLOYEE_FIELDS = ("text", "role", "phone", "skills", "sst_card", "nj_ny_certified", "electrician_rank",
+                   "certifications", "worker_status", "current_status")
+
+
+def employee_keys(employees):
+    """Identify employees by their saved "key", or by (name, occurrence) for records without one.
+
+    Names are not unique (see copy_employee), so records saved before keys
+    existed can only be told apart by how many times the name came before.
+    """
+    seen = {}
+    keys = []
+    for emp in employees:
+        n = seen.get(emp["text"], 0)
+        seen[emp["text"]] = n + 1
+        keys.append(emp.get("key") or (emp["text"], n))
+    return keys
+
+
+def new_employee_key():
+    return uuid.uuid4().hex[:16]
+
+
+def assign_employee_keys(state):
+    """Give every employee of a loaded board a key, in place.
+
+    Records saved before keys existed (or by older builds, which drop them)
+    get "<name>#<occurrence>", so the same board always gets the same keys
+    and journal records written against it still find their employee.
+    """
+    employees = state.get("employees", [])
+    used = {emp["key"] for emp in employees if emp.get("key")}
+    seen = {}
+    for i, emp in enumerate(employees):
+        n = seen.get(emp["text"], 0)
+        seen[emp["text"]] = n + 1
+        if emp.get("key"):
+            continue
+        key = f"{emp['text']}#{n}"
+        while key in used:
+            n += 1
+            key = f"{emp['text']}#{n}"
+        used.add(key)
+        employees[i] = dict(emp, key=key)
+    return state
+
+
+def hub_renames(old_names, new_names):
+    """Pair hubs that vanished with hubs that appeared at the same list position (a rename keeps its slot)."""
+    renames = {}
+    new_set = set(new_names)
+    old_set = set(old_names)
+    for i, name in enumerate(old_names):
+        if name not in new_set and i < len(new_names) and new_names[i] not in old_set:
+            renames[name] = new_names[i]
+    return renames
+
+
+def diff_boards(old, new):
+    """Return the changes that turn board state `old` into `new`, or None if there are none.
+
+    The result is a dict of lists, applied in this order by
+    WhiteboardApp.apply_board_diff:
+      hub_renames        [(old name, new name)]
+      employees_removed  [key]                  keys are (name, occurrence) in `old`
+      hubs_removed       [name]
+      hubs_added         [(index, job site)]
+      employees_changed  [(key, employee)]
+      employees_added    [(index, employee)]   index into new["employees"]
+      notes              [(hub name, note)]
+      collapsed          [(hub name, collapsed)]
+    """
+    old_names = [job["name"] for job in old["job_sites"]]
+    new_names = [job["name"] for job in new["job_sites"]]
+    renames = hub_renames(old_names, new_names)
+    renamed_to = set(renames.values())
+
+    old_jobs = {renames.get(job["name"], job["name"]): job for job in old["job_sites"]}
+    diff = {
+        "hub_renames": list(renames.items()),
+        "employees_removed": [],
+        "hubs_removed": [name for name in old_names if name not in renames and name not in new_names],
+        "hubs_added": [(i, job) for i, job in enumerate(new["job_sites"])
+                       if job["name"] not in old_jobs and job["name"] not in renamed_to],
+        "employees_changed": [],
+        "employees_added": [],
+        "notes": [],
+        "collapsed": [],
+    }
+
+    for job in new["job_sites"]:
+        before = old_jobs.get(job["name"])
+        if before is None:
+            continue
+        if (before.get("note") or "") != (job.get("note") or ""):
+            diff["notes"].append((job["name"], job.get("note") or ""))
+        collapsed = job.get("status", {}).get("Collapsed", False)
+        if before.get("status", {}).get("Collapsed", False) != collapsed:
+            diff["collapsed"].append((job["name"], collapsed))
+
+    old_employees = dict(zip(employee_keys(old["employees"]), old["employees"]))
+    new_keys = employee_keys(new["employees"])
+    new_key_set = set(new_keys)
+    diff["employees_removed"] = [key for key in old_employees if key not in new_key_set]
+
+    for i, (key, emp) in enumerate(zip(new_keys, new["employees"])):
+        before = old_employees.get(key)
+        if before is None:
+            diff["employees_added"].append((i, emp))
+        elif employee_changed(before, emp, renames):
+            diff["employees_changed"].append((key, emp))
+
+    if not any(diff.values()):
+        return None
+    return diff
+
+
+def same_value(a, b):
+    # Boards written by pandas carry NaN for empty cells, and NaN != NaN
+    return a == b or (isinstance(a, float) and isinstance(b, float) and a != a and b != b)
+
+
+def employee_changed(before, after, renames):
+    if not all(same_value(before.get(field), after.get(field)) for field in EMPLOYEE_FIELDS):
+        return True
+    job_site = renames.get(before.get("job_site"), before.get("job_site"))
+    if job_site != after.get("job_site") or before.get("box") != after.get("box"):
+        return True
+    # Assigned employees are laid out by their hub; only loose ones keep their own position
+    if not after.get("box") and (before.get("x"), before.get("y")) != (after.get("x"), after.get("y")):
+        return True
+    return False
+
+
+def count_changes(diff):
+    return sum(len(changes) for changes in diff.values())
+
+
+class BoardSyncer:
+    """Background thread that turns file watcher events into board diffs.
+
+    ``request`` may be called from any thread (normally the watchdog thread).
+    After a short settle delay the syncer asks the board cache for changes
+    made by someone else, diffs them against the state the board was showing
+    and hands the diff to ``on_diff``, still on the syncer thread. Parsing and
+    diffing never run on the Tk main thread.
+    """
+
+    SETTLE_DELAY = 0.25  # Seconds; sync clients often write a file in several steps
+
+    def __init__(self, cache, on_diff):
+        self.cache = cache
+        self.on_diff = on_diff
+        self._event = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="BoardSyncer", daemon=True)
+        self._thread.start()
+
+    def request(self):
+        self._event.set()
+
+    def stop(self):
+        self._stopped = True
+        self._event.set()
+
+    def _run(self):
+        while True:
+            self._event.wait()
+            if self._stopped:
+                return
+            time.sleep(self.SETTLE_DELAY)
+            self._event.clear()
+
+            try:
+                start = time.perf_counter()
+                changes = self.cache.take_changes()
+                if changes is None:
+                    continue
+                diff = diff_boards(*changes)
+                elapsed = (time.perf_counter() - start) * 1000
+                if diff is None:
+                    print(f"Board file changed but nothing on the board did ({elapsed:.1f} ms)")
+                    continue
+                print(f"Board sync: {count_changes(diff)} changes found in {elapsed:.1f} ms")
+                self.on_diff(diff)
+            except Exception as e:
+                print(f"[ERROR] Board sync failed: {e}")
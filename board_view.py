@@ -0,0 +1,124 @@
+# board_view.py
+import math
+
+from constants import DEFAULT_ZOOM_SCALE, ZOOM_STEP, JOB_HUB_WIDTH, JOB_HUB_HEIGHT, VERTICAL_SPACING, MAX_COLUMNS, \
+    BOX_HEIGHT, ELECTRICIAN_BOX_HEIGHT
+
+
+class BoardView:
+    """Maps board coordinates to canvas coordinates: canvas = scale * board + offset.
+
+    Saved positions are board coordinates, so they do not depend on how far
+    the board was zoomed when it was saved. The zoom is a whole number of
+    ZOOM_STEP steps from DEFAULT_ZOOM_SCALE, so zooming in and back out
+    returns to exactly the same scale.
+    """
+
+    def __init__(self, level=0, offset=(0.0, 0.0)):
+        self.level = level
+        self.offset = tuple(offset)
+
+    @property
+    def scale(self):
+        return DEFAULT_ZOOM_SCALE * ZOOM_STEP ** self.level
+
+    def to_canvas(self, x, y):
+        return self.scale * x + self.offset[0], self.scale * y + self.offset[1]
+
+    def to_board(self, x, y):
+        return (x - self.offset[0]) / self.scale, (y - self.offset[1]) / self.scale
+
+    def rect_to_canvas(self, x1, y1, x2, y2):
+        return self.to_canvas(x1, y1) + self.to_canvas(x2, y2)
+
+    def zoomed(self, steps, x, y):
+        """The view after zooming `steps` steps about canvas point (x, y), which stays where it is."""
+        view = BoardView(self.level + steps)
+        factor = view.scale / self.scale
+        # Same as canvas.scale(..., x, y, factor, factor) applied to the current view
+        # (rounded, so zooming back out lands on exactly the same offset)
+        view.offset = (round(self.offset[0] * factor + x * (1 - factor), 6),
+                       round(self.offset[1] * factor + y * (1 - factor), 6))
+        return view
+
+    def to_state(self):
+        return {"level": self.level, "x": self.offset[0], "y": self.offset[1]}
+
+    @classmethod
+    def from_state(cls, state):
+        view = state.get("view")
+        if not view:
+            return cls(level_for_scale(state.get("scale") or DEFAULT_ZOOM_SCALE))
+        return cls(view.get("level", 0), (view.get("x", 0.0), view.get("y", 0.0)))
+
+
+def level_for_scale(scale):
+    return round(math.log(scale / DEFAULT_ZOOM_SCALE) / math.log(ZOOM_STEP))
+
+
+def hub_grid_rect(i):
+    """Board rectangle of the i-th job site hub in the grid layout."""
+    x = 50 + (JOB_HUB_WIDTH + 40) * (i % MAX_COLUMNS)
+    y = 50 + (JOB_HUB_HEIGHT + VERTICAL_SPACING) * (i // MAX_COLUMNS)
+    return x, y, x + JOB_HUB_WIDTH, y + JOB_HUB_HEIGHT
+
+
+def snap_box_rects(hub_rect, scale, collapsed=False):
+    """Canvas rectangles of a hub's role boxes, given the hub's canvas rectangle at `scale`."""
+    x1, y1, x2, y2 = hub_rect
+    left, right = x1 + 10 * scale, x2 - 10 * scale
+    rects = {}
+    for row, box_type in enumerate(("PM", "GM", "Foreman", "Super")):
+        top = y1 + 10 * (row + 1) * scale + row * BOX_HEIGHT * scale
+        rects[box_type] = (left, top, right, top + BOX_HEIGHT * scale)
+    if not collapsed:
+        rects["Electrician"] = (left, y2 - ELECTRICIAN_BOX_HEIGHT * scale - 10 * scale, right, y2 - 10 * scale)
+    else:
+        rects["Electrician"] = (left, y2 - 50 * scale, right, y2 - 10 * scale)
+    return rects
+
+
+def upgrade_board_coordinates(state):
+    """Convert a board saved with canvas coordinates to board coordinates, in place.
+
+    Boards saved before BoardView existed stored canvas coordinates at the
+    zoom they were saved with ("scale"); dividing by it gives positions that
+    no longer depend on zoom. Boards written by with_legacy_coordinates carry
+    "view" as well, and are converted back through that view exactly.
+    """
+    if not state.get("scale"):
+        return state  # Already in board coordinates
+    scale = state.pop("scale")
+    state.pop("canvas_transform", None)
+    if "view" in state:
+        to_board = BoardView.from_state(state).to_board
+    else:
+        state["view"] = BoardView(level_for_scale(scale)).to_state()
+        to_board = lambda x, y: (x / scale, y / scale)
+    for item in state.get("employees", []) + state.get("job_sites", []):
+        if isinstance(item.get("x"), (int, float)) and isinstance(item.get("y"), (int, float)):
+            item["x"], item["y"] = to_board(item["x"], item["y"])
+    return state
+
+
+def with_legacy_coordinates(state):
+    """A copy of `state` (board coordinates) that builds from before BoardView also read correctly.
+
+    Those builds place everything at the saved x/y as canvas coordinates and
+    zoom to "scale", so both are written as the current view shows them,
+    next to "view". upgrade_board_coordinates turns it back into `state`.
+    """
+    if state.get("scale"):
+        return state  # Still in canvas coordinates
+    view = BoardView.from_state(state)
+
+    def to_canvas(item):
+        if isinstance(item.get("x"), (int, float)) and isinstance(item.get("y"), (int, float)):
+            x, y = view.to_canvas(item["x"], item["y"])
+            return dict(item, x=x, y=y)
+        return item
+
+    legacy = dict(state, scale=view.scale, canvas_transform=list(view.offset))
+    legacy["employees"] = [to_canvas(emp) for emp in state.get("employees", [])]
+    legacy["job_sites"] = [to_canvas(job) for job in state.get("job_sites", [])]
+    return legacy
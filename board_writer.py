@@ -0,0 +1,150 @@
+# board_writer.py
+import os
+import threading
+import time
+
+
+class BoardWriter:
+    """Background thread that performs board file writes off the Tk main thread.
+
+    Jobs are kept in submission order. A burst of full-file replacements of the
+    same path collapses into the last one (as long as no append was queued in
+    between), and consecutive appends to the same path are written together,
+    so a busy UI costs at most one write per path each time the thread wakes up.
+
+    Other work that must stay ordered with the file writes (such as SQLite
+    transactions) can be queued with ``call``.
+
+    Replacements are written to a temporary file next to the target and moved
+    into place with ``os.replace``, so readers (and sync clients) never see a
+    half-written board. ``on_written`` is called from the writer thread after
+    each batch of jobs has been written.
+    """
+
+    REPLACE_RETRIES = 5  # Sync clients on Windows can briefly lock the target
+    RETRY_DELAY = 0.2  # Seconds between attempts
+
+    def __init__(self, on_written=None):
+        self.on_written = on_written
+        self._condition = threading.Condition()
+        self._jobs = []
+        self._busy = False
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="BoardWriter", daemon=True)
+        self._thread.start()
+
+    def replace(self, path, data):
+        """Queue a full rewrite of `path`.
+
+        `data` is str/bytes, or a callable returning str/bytes or an iterable
+        of str chunks. Passing a callable defers serialization to the writer
+        thread, and a replacement superseded before it runs is never
+        serialized at all.
+        """
+        self._queue("replace", path, data)
+
+    def call(self, func, key=None):
+        """Queue `func` to run on the writer thread, e.g. a database transaction.
+
+        Consecutive calls sharing a `key` supersede each other the same way
+        replacements of one path do; calls without a key always run.
+        """
+        self._queue("call", key, func)
+
+    def _queue(self, kind, key, data):
+        with self._condition:
+            # Supersede a pending job for the same target in place, keeping its position
+            superseded = False
+            if key is not None:
+                for i in range(len(self._jobs) - 1, -1, -1):
+                    job_kind, job_key, _ = self._jobs[i]
+                    if job_kind != kind or job_key is None:
+                        break
+                    if job_key == key:
+                        self._jobs[i] = (kind, key, data)
+                        superseded = True
+                        break
+            if not superseded:
+                self._jobs.append((kind, key, data))
+            self._condition.notify()
+
+    def append(self, path, text):
+        """Queue `text` to be appended to `path`."""
+        with self._condition:
+            if self._jobs and self._jobs[-1][0] == "append" and self._jobs[-1][1] == path:
+                self._jobs[-1] = ("append", path, self._jobs[-1][2] + text)
+            else:
+                self._jobs.append(("append", path, text))
+            self._condition.notify()
+
+    def flush(self, timeout=None):
+        """Block until every queued job has been written. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._jobs or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout=10):
+        """Flush pending writes and stop the thread."""
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._jobs and not self._stopped:
+                    self._condition.wait()
+                if not self._jobs and self._stopped:
+                    return
+                jobs, self._jobs = self._jobs, []
+                self._busy = True
+
+            for kind, path, data in jobs:
+                try:
+                    if kind == "replace":
+                        self._replace(path, data() if callable(data) else data)
+                    elif kind == "call":
+                        data()
+                    else:
+                        with open(path, "a") as f:
+                            f.write(data)
+                except Exception as e:
+                    print(f"[ERROR] Background write to {path or kind} failed: {e}")
+
+            if self.on_written:
+                try:
+                    self.on_written()
+                except Exception as e:
+                    print(f"[ERROR] Write callback failed: {e}")
+
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+
+    def _replace(self, path, data):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb" if isinstance(data, bytes) else "w") as f:
+            if isinstance(data, (str, bytes)):
+                f.write(data)
+            else:
+                for chunk in data:
+                    f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+
+        for attempt in range(self.REPLACE_RETRIES):
+            try:
+                os.replace(tmp_path, path)
+                return
+            except PermissionError:
+                if attempt == self.REPLACE_RETRIES - 1:
+                    raise
+                time.sleep(self.RETRY_DELAY)
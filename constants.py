@@ -10,6 +10,13 @@ ROLE_COLORS = {
     # Add other roles as needed
 }
 
+# Employee text colors by current status (anything else is drawn black)
+STATUS_TEXT_COLORS = {
+    "Sick": "#006400",
+    "Vacation": "blue",
+}
+BOARD_BACKGROUND = "#D3D3D3"  # Canvas color behind the hubs
+
 
 VERTICAL_SPACING = 150  # Constant vertical spacing between rows // CHANGED FROM 300
 ELECTRICIAN_BOX_HEIGHT = 730  # Height of the electrician box
@@ -20,7 +27,25 @@ DEFAULT_EMPLOYEE_X = 1200  # Where non-assigned employees get placed
 DEFAULT_EMPLOYEE_Y = -3300
 GRID_SIZE = 30
 DRAG_DELAY = 200  # Delay in milliseconds
+DRAG_FRAME_MS = 16  # Dragging moves the box and updates the highlight at most once per this many milliseconds
 JOB_HUB_HEIGHT_COLLAPSED = 250
 MAX_COLUMNS = 8  # Maximum number of columns for job site hubs
 DEFAULT_ZOOM_SCALE = 0.225  # Adjust this value as needed (e.g., 1.0, 1.5, 0.75)
+ZOOM_STEP = 1.1  # Each Ctrl + mouse wheel notch zooms by this factor (see board_view.py)
+
 
+JOURNAL_MODE = False  # Append each change to a sidecar journal instead of rewriting output.json
+JOURNAL_COMPACT_RECORDS = 500  # Compact the journal into output.json after this many records
+JOURNAL_COMPACT_BYTES = 256 * 1024  # ...or once the journal grows past this size
+JOURNAL_COMPACT_INTERVAL = 5 * 60 * 1000  # ...or on this schedule (milliseconds)
+BINARY_SNAPSHOT = False  # Also write a compact output.fbs next to output.json and load from it when current
+BOARD_FORMAT = "pretty"  # "pretty" (indented, as output.json has always been written) or "compact" (opt-in: no indentation, rounded coordinates)
+STORAGE_BACKEND = "json"  # "json" (output.json) or "sqlite" (output.db, row-level updates, see board_sqlite.py)
+LOAD_CHUNK_MS = 25  # Progressive load: milliseconds of hub/employee creation per Tk event-loop turn
+HISTORY_MODE = None  # Board history (see board_history.py): "save" (every save), "daily" (first save each day) or None
+HISTORY_KEEP_ALL_DAYS = 14  # History keeps every version this many days back...
+HISTORY_KEEP_DAYS = 365  # ...then one per day up to this many days, and nothing older
+SUMMARY_ZOOM_SCALE = 0.2  # Below this zoom each hub is drawn as a headcount summary instead of its employees
+VIEWPORT_MARGIN = 200  # Canvas pixels around the window in which hubs and employees are kept up to date
+SEARCH_HIGHLIGHT_COLOR = "magenta"  # Employee names matching the side panel search are drawn in this color...
+SEARCH_HIGHLIGHT_LIMIT = 50  # ...for this many of the best matches
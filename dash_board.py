@@ -5,8 +5,26 @@ import pandas as pd
 import plotly.express as px
 import socket
 import os
+import sys
 
-def run_dashboard():
+def load_board_frames(board_file, query=None):
+    """Build the dashboard tables straight from a board (output.db or output.json) instead of output.xlsx.
+
+    With a `query` (see board_query.py) only the matching employees are counted and listed.
+    """
+    from board_sqlite import load_board
+    from board_query import select_employees
+    from jsonToExcel import build_job_site_summary, build_employee_list
+
+    data = load_board(board_file)
+    if query:
+        data["employees"] = select_employees(data, query)
+    employees = pd.DataFrame(data["employees"])
+    job_sites = pd.DataFrame(data["job_sites"])
+    return build_job_site_summary(employees, job_sites), build_employee_list(employees), employees
+
+
+def run_dashboard(board_file=None, query=None):
     EXCEL_FILE = "output.xlsx"
     REQUESTS_FILE = "requests.csv"
 
@@ -14,9 +32,22 @@ def run_dashboard():
     if not os.path.exists(REQUESTS_FILE):
         pd.DataFrame(columns=["Request"]).to_csv(REQUESTS_FILE, index=False)
 
+    # Query the live board directly when one is given (e.g. output.db)
+    board_frames = None
+    if board_file:
+        try:
+            board_frames = load_board_frames(board_file, query)
+        except Exception as e:
+            print(f"[ERROR] Could not load board '{board_file}', falling back to {EXCEL_FILE}: {e}")
+    elif query:
+        print(f"[WARNING] The query only applies to a board file, not {EXCEL_FILE}. Showing everyone.")
+
     # Load Job Site Summary
     try:
-        job_site_summary = pd.read_excel(EXCEL_FILE, sheet_name="Job Site Summary")
+        if board_frames:
+            job_site_summary = board_frames[0]
+        else:
+            job_site_summary = pd.read_excel(EXCEL_FILE, sheet_name="Job Site Summary")
     except Exception as e:
         print(f"[ERROR] Could not load Excel file: {e}")
         job_site_summary = pd.DataFrame()
@@ -37,14 +68,20 @@ def run_dashboard():
 
     # Load Employee List
     try:
-        employee_list = pd.read_excel(EXCEL_FILE, sheet_name="Employee List")
+        if board_frames:
+            employee_list = board_frames[1]
+        else:
+            employee_list = pd.read_excel(EXCEL_FILE, sheet_name="Employee List")
     except Exception as e:
         print(f"[ERROR] Could not load Employee List: {e}")
         employee_list = pd.DataFrame()
 
     # Load Employees sheet for status
     try:
-        employees_df = pd.read_excel(EXCEL_FILE, sheet_name="Employees")
+        if board_frames:
+            employees_df = board_frames[2]
+        else:
+            employees_df = pd.read_excel(EXCEL_FILE, sheet_name="Employees")
     except Exception as e:
         print(f"[ERROR] Could not load Employees sheet: {e}")
         employees_df = pd.DataFrame()
@@ -215,4 +252,5 @@ def run_dashboard():
     app.run_server(debug=False, use_reloader=False, host="0.0.0.0", port=5000)
 
 if __name__ == "__main__":
-    run_dashboard()
+    # e.g. python dash_board.py output.db "role:*electrician status:!Sick"
+    run_dashboard(sys.argv[1] if len(sys.argv) > 1 else None, sys.argv[2] if len(sys.argv) > 2 else None)
@@ -1,10 +1,14 @@
 import tkinter as tk
-from constants import ROLE_COLORS, DRAG_DELAY
+from board_sync import new_employee_key
+from constants import ROLE_COLORS, DRAG_DELAY, DRAG_FRAME_MS
+
+ELECTRICIAN_ROLES = ("Electrician", "Fire Alarm Electrician", "Roughing Electrician")
 
 class DraggableBox:
-    def __init__(self, app, canvas, text, role, x, y, phone, job_site, box, skills, sst_card, nj_ny_certified, electrician_rank, certifications, worker_status, current_status):
+    def __init__(self, app, canvas, text, role, x, y, phone, job_site, box, skills, sst_card, nj_ny_certified, electrician_rank, certifications, worker_status, current_status, key=None):
         self.app = app
         self.canvas = canvas
+        self.key = key or new_employee_key()  # Stable id in journal records and board diffs; names are not unique
         self.text = text  # Keep full name intact
         self.role = role
         self.x = x
@@ -22,8 +26,9 @@ class DraggableBox:
         self.current_snap_box = None
 
         self.color = ROLE_COLORS.get(role, "black")
-        self.font = ("Helvetica", 14, "bold")
+        self.font = app.fonts.get("employee")  # Shared and resized with the zoom (see board_fonts.py)
         self.circle_radius = 15
+        self.scaled_at = None  # (layout generation, scale) the font and circle were last sized for
 
         # Use provided coordinates or default to app default
         x = x if x is not None else (app.default_x if job_site is None else job_site.x)
@@ -31,11 +36,15 @@ class DraggableBox:
 
         self.circle_id = canvas.create_oval(x - self.circle_radius, y,
                                             x + self.circle_radius, y,
-                                            fill=self.color, outline=self.color)
+                                            fill=self.color, outline=self.color, tags="employee_circle")
 
         # Generate and set the display text
         display_text = self.get_display_text()
         self.id = canvas.create_text(x, y, text=display_text, font=self.font, tags="draggable", anchor=tk.NW)
+        # One tag for the text and its circle; hubs add their own tag to it while the employee is assigned
+        self.tag = f"employee{self.id}"
+        canvas.addtag_withtag(self.tag, self.id)
+        canvas.addtag_withtag(self.tag, self.circle_id)
 
         self.canvas.tag_bind(self.id, "<ButtonPress-1>", self.on_press)
         self.canvas.tag_bind(self.id, "<ButtonRelease-1>", self.on_release)
@@ -43,15 +52,16 @@ class DraggableBox:
         self._drag_data = {"x": 0, "y": 0}
         self.current_snap_box = None
         self.drag_delay = None
+        self.drag_pointer = None  # Latest pointer position not yet drawn
+        self.drag_frame = None  # Pending after() id of the next drag frame
         self.is_dragging = False
 
         if job_site and box:
-            for hub in self.canvas.hub_list:
-                if hub.text == job_site:
-                    self.current_snap_box = {"hub": hub, "box": box, "occupied": True}
-                    hub.update_occupation(box, True, self.id)
-                    self.snap_to_box()
-                    break
+            hub = app.find_job_site_hub_by_name(job_site)
+            if hub:
+                self.current_snap_box = {"hub": hub, "box": box, "occupied": True}
+                hub.update_occupation(box, True, self)
+                self.snap_to_box()
 
     def __del__(self):
         self.canvas.delete(self.circle_id)
@@ -62,71 +72,19 @@ class DraggableBox:
 
     def truncate_text(self, text, max_length=16):
         """Truncate text to a maximum of `max_length` characters, appending '...' if truncated."""
-        if len(text) > max_length:
-            return text[:max_length] + "..."
-        return text
+        return truncate_text(text, max_length)
 
     def get_display_text_supers(self):
         """Generate the display text for the box with supervisory roles."""
         # Debug prints to check values
         print(f"Role: {self.role}, Skills: {self.skills}")
-
-        # Set a default value for displayText
-        displayText = "Unknown"  # or some other default value that makes sense in your context
-
-        # Determine displayText based on role and skills
-        if self.role == "PM":
-            displayText = "PM"
-        elif self.role == "GM":
-            displayText = "GC"
-        elif self.role == "Foreman":
-            displayText = "FM"
-        elif self.role == "Super":
-            displayText = "Super"
-
-        # Truncate the name for display
-        truncated_name = self.truncate_text(self.text)
-
-        return f"{displayText} - {truncated_name}"
+        return supervisor_label(self.role, self.text)
 
     def get_display_text(self):
         """Generate the display text for technical roles."""
         # Debug prints to check values
         print(f"Role: {self.role}, Skills: {self.skills}")
-
-        # Set a default value for displayText
-        displayText = "Unknown"  # or some other default value that makes sense in your context
-
-        # Determine displayText based on role and skills
-        if self.role == "Electrician" and "Helper" in self.skills:
-            displayText = "E - H"
-        elif self.role == "Electrician" and "Junior Mechanic" in self.skills:
-            displayText = "E - JM"
-        elif self.role == "Electrician" and "Mechanic" in self.skills:
-            displayText = "E - M"
-        elif self.role == "Electrician" and "Sub Foreman" in self.skills:
-            displayText = "E - SF"
-        elif self.role == "Fire Alarm Electrician" and "Fire Alarm Helper" in self.skills:
-            displayText = "FA - H"
-        elif self.role == "Fire Alarm Electrician" and "Fire Alarm Junior Mechanic" in self.skills:
-            displayText = "FA - JM"
-        elif self.role == "Fire Alarm Electrician" and "Fire Alarm Mechanic" in self.skills:
-            displayText = "FA - M"
-        elif self.role == "Fire Alarm Electrician" and "Fire Alarm Sub Foreman" in self.skills:
-            displayText = "FA - SF"
-        elif self.role == "Roughing Electrician" and "Roughing Helper" in self.skills:
-            displayText = "R - H"
-        elif self.role == "Roughing Electrician" and "Roughing Junior Mechanic" in self.skills:
-            displayText = "R - JM"
-        elif self.role == "Roughing Electrician" and "Roughing Mechanic" in self.skills:
-            displayText = "R - M"
-        elif self.role == "Roughing Electrician" and "Roughing Sub Foreman" in self.skills:
-            displayText = "R - SF"
-
-        # Truncate the name for display
-        truncated_name = self.truncate_text(self.text)
-
-        return f"{displayText} - {truncated_name}"
+        return technician_label(self.role, self.skills, self.text)
 
     def snap_to_box(self):
         if self.current_snap_box:
@@ -137,7 +95,7 @@ class DraggableBox:
             circle_radius = self.circle_radius * self.app.scale
             self.canvas.coords(self.circle_id, left_x + 10, top_y, left_x + 10 + circle_radius, top_y + circle_radius)
 
-            if self.role in ("Electrician", "Fire Alarm Electrician", "Roughing Electrician"):
+            if self.role in ELECTRICIAN_ROLES:
                 display_text = self.get_display_text()
             else:
                 display_text = self.get_display_text_supers()
@@ -161,6 +119,8 @@ class DraggableBox:
         return left_x, top_y
 
     def on_press(self, event):
+        if self.app.is_loading:
+            return  # The rest of the board is still loading; a move could not be saved yet
         self._drag_data["x"] = event.x
         self._drag_data["y"] = event.y
         self.drag_delay = self.canvas.after(DRAG_DELAY, self.start_drag, event)
@@ -172,41 +132,49 @@ class DraggableBox:
     def on_motion(self, event):
         if not self.is_dragging:
             return
-        delta_x = event.x - self._drag_data["x"]
-        delta_y = event.y - self._drag_data["y"]
+        # Mice can report motion far faster than the screen redraws; keep only the latest
+        # position and draw it in the next frame
+        self.drag_pointer = (event.x, event.y)
+        if self.drag_frame is None:
+            self.drag_frame = self.canvas.after(DRAG_FRAME_MS, self.draw_drag_frame)
+
+    def draw_drag_frame(self):
+        self.drag_frame = None
+        if not self.is_dragging or self.drag_pointer is None:
+            return
+        event_x, event_y = self.drag_pointer
+        self.drag_pointer = None
+        delta_x = event_x - self._drag_data["x"]
+        delta_y = event_y - self._drag_data["y"]
         self.canvas.move(self.id, delta_x, delta_y)
         self.canvas.move(self.circle_id, delta_x, delta_y)
-        self._drag_data["x"] = event.x
-        self._drag_data["y"] = event.y
+        self._drag_data["x"] = event_x
+        self._drag_data["y"] = event_y
 
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
+        x = self.canvas.canvasx(event_x)
+        y = self.canvas.canvasy(event_y)
 
-        for hub in self.canvas.hub_list:
-            for box_type in ["PM", "GM", "Foreman", "Super", "Electrician"]:
-                box_coords = self.canvas.coords(getattr(hub, f"{box_type.lower()}_box"))
-                if box_coords[0] < x < box_coords[2] and box_coords[1] < y < box_coords[3]:
-                    self.canvas.itemconfig(getattr(hub, f"{box_type.lower()}_box"), fill="lightgreen")
-                else:
-                    self.canvas.itemconfig(getattr(hub, f"{box_type.lower()}_box"), fill="white")
+        # One lookup in the app's snap box index; only the box gaining or losing the highlight is recolored
+        hits = self.app.snap_boxes_at(x, y)
+        self.app.highlight_snap_box(hits[0][3] if hits else None)
 
     def snap_to_hub(self, hub, box_type, coords):
-        if box_type != "Electrician" and box_type != "Fire Alarm" and getattr(hub, f"{box_type.lower()}_occupied"):
+        if hub.slot_taken(box_type, self):
             return False
 
         if self.current_snap_box:
-            self.current_snap_box["hub"].update_occupation(self.current_snap_box["box"], False, self.id)
+            self.current_snap_box["hub"].update_occupation(self.current_snap_box["box"], False, self)
 
         left_x = coords[0]
         top_y = coords[1]
         self.current_snap_box = {"hub": hub, "box": box_type, "occupied": True}
-        hub.update_occupation(box_type, True, self.id)
+        hub.update_occupation(box_type, True, self)
         self.canvas.coords(self.id, left_x + 35, top_y)
         circle_radius = self.circle_radius * self.app.scale
         self.canvas.coords(self.circle_id, left_x + 10, top_y, left_x + 10 + circle_radius, top_y + circle_radius)
         self.canvas.tag_raise(self.id)
         self.canvas.tag_raise(self.circle_id)
-        if self.role in ("Electrician", "Fire Alarm Electrician", "Roughing Electrician"):
+        if self.role in ELECTRICIAN_ROLES:
             display_text = self.get_display_text()
         else:
             display_text = self.get_display_text_supers()
@@ -223,21 +191,25 @@ class DraggableBox:
         if not self.is_dragging:
             return
 
+        # Draw the last buffered position so the box ends up exactly where it was dropped
+        if self.drag_frame:
+            self.canvas.after_cancel(self.drag_frame)
+        self.drag_pointer = (event.x, event.y)
+        self.draw_drag_frame()
+
         self.is_dragging = False
         self.canvas.tag_unbind(self.id, "<B1-Motion>")
+        self.app.highlight_snap_box(None)
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
 
-        for hub in self.canvas.hub_list:
-            for box_type in ["PM", "GM", "Foreman", "Super", "Electrician"]:
-                coords = self.canvas.coords(getattr(hub, f"{box_type.lower()}_box"))
-                if coords[0] < x < coords[2] and coords[1] < y < coords[3]:
-                    if self.snap_to_hub(hub, box_type, coords):
-                        hub.update_electrician_positions()
-                        return
+        for hub, box_type, coords, _ in self.app.snap_boxes_at(x, y):
+            if self.snap_to_hub(hub, box_type, coords):
+                hub.update_electrician_positions()
+                return
 
         if self.current_snap_box:
-            self.current_snap_box["hub"].update_occupation(self.current_snap_box["box"], False, self.id)
+            self.current_snap_box["hub"].update_occupation(self.current_snap_box["box"], False, self)
         self.current_snap_box = None
         self.app.update_employee_position(self.text, None, None, self.id)
         self.app.update_unassigned_employees()
@@ -248,13 +220,36 @@ class DraggableBox:
         self.canvas.itemconfig(self.circle_id, fill=self.color, outline=self.color)
 
         if self.current_snap_box:
-            self.current_snap_box["hub"].update_occupation(self.current_snap_box["box"], False, self.id)
+            self.current_snap_box["hub"].update_occupation(self.current_snap_box["box"], False, self)
             self.current_snap_box = None
 
         self.snap_to_box()
-        self.app.update_employee_position(self.text, None, None, self.id)
+        self.app.update_employee_position(self.text, None, None, self.id)  # Also saves the state
         self.app.update_unassigned_employees()
-        self.app.save_state()
+
+    def update_attributes(self, data):
+        """Take over the saved fields of an employee record (e.g. after someone else edited it)."""
+        old_name = self.text
+        self.text = data.get("text", self.text)
+        self.app.registry.rename_box(self, old_name)
+        self.role = data.get("role", self.role)
+        self.phone = data.get("phone", self.phone)
+        self.skills = data.get("skills", self.skills)
+        self.sst_card = data.get("sst_card", self.sst_card)
+        self.nj_ny_certified = data.get("nj_ny_certified", self.nj_ny_certified)
+        self.electrician_rank = data.get("electrician_rank", self.electrician_rank)
+        self.certifications = data.get("certifications") or []
+        self.worker_status = data.get("worker_status", self.worker_status)
+        self.current_status = data.get("current_status", self.current_status)
+        self.app.registry.box_edited(self)
+
+        self.color = ROLE_COLORS.get(self.role, "black")
+        self.canvas.itemconfig(self.circle_id, fill=self.color, outline=self.color)
+        if self.role in ELECTRICIAN_ROLES:
+            display_text = self.get_display_text()
+        else:
+            display_text = self.get_display_text_supers()
+        self.canvas.itemconfig(self.id, text=display_text)
 
     def on_right_click(self, event):
         self.app.open_add_employee_dialog(prefill_data={
@@ -270,3 +265,75 @@ class DraggableBox:
             "current_status": self.current_status,
             "index": self.app.employee_boxes.index(self)
         })
+
+
+# Label helpers shared with the headless renderer (board_render.py), which has no canvas items
+def truncate_text(text, max_length=16):
+    """Truncate text to a maximum of `max_length` characters, appending '...' if truncated."""
+    if len(text) > max_length:
+        return text[:max_length] + "..."
+    return text
+
+
+def supervisor_label(role, name):
+    """Display text for supervisory roles (PM, GC, Foreman, Super)."""
+    # Set a default value for displayText
+    displayText = "Unknown"  # or some other default value that makes sense in your context
+
+    # Determine displayText based on role and skills
+    if role == "PM":
+        displayText = "PM"
+    elif role == "GM":
+        displayText = "GC"
+    elif role == "Foreman":
+        displayText = "FM"
+    elif role == "Super":
+        displayText = "Super"
+
+    # Truncate the name for display
+    truncated_name = truncate_text(name)
+
+    return f"{displayText} - {truncated_name}"
+
+
+def technician_label(role, skills, name):
+    """Display text for technical roles (electricians and their skill level)."""
+    # Set a default value for displayText
+    displayText = "Unknown"  # or some other default value that makes sense in your context
+
+    # Determine displayText based on role and skills
+    if role == "Electrician" and "Helper" in skills:
+        displayText = "E - H"
+    elif role == "Electrician" and "Junior Mechanic" in skills:
+        displayText = "E - JM"
+    elif role == "Electrician" and "Mechanic" in skills:
+        displayText = "E - M"
+    elif role == "Electrician" and "Sub Foreman" in skills:
+        displayText = "E - SF"
+    elif role == "Fire Alarm Electrician" and "Fire Alarm Helper" in skills:
+        displayText = "FA - H"
+    elif role == "Fire Alarm Electrician" and "Fire Alarm Junior Mechanic" in skills:
+        displayText = "FA - JM"
+    elif role == "Fire Alarm Electrician" and "Fire Alarm Mechanic" in skills:
+        displayText = "FA - M"
+    elif role == "Fire Alarm Electrician" and "Fire Alarm Sub Foreman" in skills:
+        displayText = "FA - SF"
+    elif role == "Roughing Electrician" and "Roughing Helper" in skills:
+        displayText = "R - H"
+    elif role == "Roughing Electrician" and "Roughing Junior Mechanic" in skills:
+        displayText = "R - JM"
+    elif role == "Roughing Electrician" and "Roughing Mechanic" in skills:
+        displayText = "R - M"
+    elif role == "Roughing Electrician" and "Roughing Sub Foreman" in skills:
+        displayText = "R - SF"
+
+    # Truncate the name for display
+    truncated_name = truncate_text(name)
+
+    return f"{displayText} - {truncated_name}"
+
+
+def employee_label(role, skills, name):
+    if role in ELECTRICIAN_ROLES:
+        return technician_label(role, skills, name)
+    return supervisor_label(role, name)
@@ -2,7 +2,8 @@
 
 import tkinter as tk
 import tkinter.messagebox as messagebox
-from constants import ROLE_COLORS, BOX_HEIGHT, ELECTRICIAN_BOX_HEIGHT, JOB_HUB_HEIGHT_COLLAPSED
+from constants import ROLE_COLORS, JOB_HUB_HEIGHT_COLLAPSED
+from board_view import snap_box_rects
 
 class JobSiteHub:
     def __init__(self, app, canvas, text, x, y, address=""):
@@ -13,15 +14,22 @@ class JobSiteHub:
         self.circle_radius = 15
         self.width = 320
         self.height = 800
-        self.font = ("Helvetica", 12, "bold")
+        self.font = app.fonts.get("hub_title")
+        self.button_font = app.fonts.get("hub_button")
         self.collapsed = False
+        self.layout_rect = None  # Grid rectangle redraw_canvas last placed the hub at
+        self.laid_out_at = None  # (layout generation, scale, collapsed) the role boxes were last laid out for
         self.id = canvas.create_rectangle(x, y, x + self.width, y + self.height, fill="lightblue", tags="hub")
+        # Every item belonging to the hub, assigned employees included, carries this tag so the
+        # whole group can be moved or scaled with a single canvas call
+        self.tag = f"jobsite{self.id}"
+        canvas.addtag_withtag(self.tag, self.id)
         self.text_id = canvas.create_text(x + self.width / 2, y - 20, text=self.get_display_text(), font=self.font,
-                                          tags=("hub", str(len(canvas.hub_list))), anchor=tk.S)
+                                          tags=("hub", str(len(canvas.hub_list)), self.tag), anchor=tk.S)
 
         self.canvas.tag_bind(self.text_id, "<Button-3>", self.rename_hub)
-        self.erase_button_id = canvas.create_text(x + self.width - 15, y + 15, text="X", font=self.font, fill="red",
-                                                  tags="erase_button")
+        self.erase_button_id = canvas.create_text(x + self.width - 15, y + 15, text="X", font=self.button_font, fill="red",
+                                                  tags=("erase_button", self.tag))
         self.canvas.tag_bind(self.erase_button_id, "<ButtonPress-1>", self.confirm_erase_hub)
 
 # -----------------------------------------------------------
@@ -33,18 +41,17 @@ class JobSiteHub:
         self.super_box = self.create_snap_box()  # ADDED THIS LINE
         self.electrician_box = self.create_snap_box()
 
-        self.collapse_button_id = canvas.create_text(x + 15, y + self.height - 15, text="[-]", font=self.font,
-                                                     fill="black", tags="collapse_button")
+        self.collapse_button_id = canvas.create_text(x + 15, y + self.height - 15, text="[-]", font=self.button_font,
+                                                     fill="black", tags=("collapse_button", self.tag))
         self.canvas.tag_bind(self.collapse_button_id, "<ButtonPress-1>", self.toggle_electrician_box)
 
 # -----------------------------------------------------------
 # Occurrence 2 // ROLES BOX STATUS
 # -----------------------------------------------------------
-        self.pm_occupied = False
-        self.gm_occupied = False
-        self.foreman_occupied = False
-        self.super_occupied = False  # ADDED THIS LINE
-        self.electrician_occupied = []
+        # The DraggableBox in each role slot (None when empty) and the electricians in stacking order,
+        # so laying out a hub only touches its own occupants
+        self.occupants = {"PM": None, "GM": None, "Foreman": None, "Super": None}
+        self.electricians = []
 
         self.update_positions()
 
@@ -67,12 +74,10 @@ class JobSiteHub:
         self.canvas.tag_unbind(self.collapse_button_id, "<ButtonPress-1>")
 
     def get_display_text(self):
-        # Return the text truncated to 20 characters with "..." if it's too long
-        truncated_text = (self.text[:15] + '...') if len(self.text) > 17 else self.text
-        return f"{truncated_text}{self.address}"
+        return hub_label(self.text, self.address)
 
     def create_snap_box(self):
-        return self.canvas.create_rectangle(0, 0, 1, 1, fill="white", outline="black", tags="snap_box")
+        return self.canvas.create_rectangle(0, 0, 1, 1, fill="white", outline="black", tags=("snap_box", self.tag))
 
 
 # -----------------------------------------------------------
@@ -81,40 +86,21 @@ class JobSiteHub:
     def update_positions(self, scale=1.0):
         self.scale = scale
         x1, y1, x2, y2 = self.canvas.coords(self.id)
-        width = x2 - x1
-        height = y2 - y1
-
-        self.canvas.coords(self.pm_box, x1 + 10 * self.scale,
-                           y1 + 10 * self.scale,
-                           x1 + width - 10 * self.scale,
-                           y1 + 10 * self.scale + BOX_HEIGHT * self.scale)
-        self.canvas.coords(self.gm_box, x1 + 10 * self.scale,
-                           y1 + 20 * self.scale + BOX_HEIGHT * self.scale,
-                           x1 + width - 10 * self.scale,
-                           y1 + 20 * self.scale + 2 * BOX_HEIGHT * self.scale)
-        self.canvas.coords(self.foreman_box, x1 + 10 * self.scale,
-                           y1 + 30 * self.scale + 2 * BOX_HEIGHT * self.scale,
-                           x1 + width - 10 * self.scale,
-                           y1 + 30 * self.scale + 3 * BOX_HEIGHT * self.scale)
-        self.canvas.coords(self.super_box, x1 + 10 * self.scale,
-                           y1 + 40 * self.scale + 3 * BOX_HEIGHT * self.scale,
-                           x1 + width - 10 * self.scale,
-                           y1 + 40 * self.scale + 4 * BOX_HEIGHT * self.scale)
-
-        if not self.collapsed:
-            self.canvas.coords(self.electrician_box, x1 + 10 * self.scale,
-                               y1 + height - ELECTRICIAN_BOX_HEIGHT * self.scale - 10 * self.scale,
-                               x1 + width - 10 * self.scale, y1 + height - 10 * self.scale)
-            self.canvas.itemconfig(self.collapse_button_id, text="[-]")
-        else:
-            self.canvas.coords(self.electrician_box, x1 + 10 * self.scale, y1 + height - 50 * self.scale,
-                               x1 + width - 10 * self.scale, y1 + height - 10 * self.scale)
-            self.canvas.itemconfig(self.collapse_button_id, text="[+]")
+
+        # Same geometry the headless renderer uses (see board_view.py)
+        rects = snap_box_rects((x1, y1, x2, y2), self.scale, self.collapsed)
+        self.canvas.coords(self.pm_box, *rects["PM"])
+        self.canvas.coords(self.gm_box, *rects["GM"])
+        self.canvas.coords(self.foreman_box, *rects["Foreman"])
+        self.canvas.coords(self.super_box, *rects["Super"])
+        self.canvas.coords(self.electrician_box, *rects["Electrician"])
+        self.canvas.itemconfig(self.collapse_button_id, text="[+]" if self.collapsed else "[-]")
 
         self.canvas.coords(self.collapse_button_id, x1 + 15 * self.scale, y2 - 15 * self.scale)
         self.canvas.coords(self.erase_button_id, x2 - 15 * self.scale, y1 + 15 * self.scale)
 
         self.canvas.tag_raise(self.erase_button_id)
+        self.app.layout_changed()
         self.update_all_positions()
 
     def toggle_electrician_box(self, event):
@@ -136,69 +122,79 @@ class JobSiteHub:
         self.update_super_positions()
 
     def update_pm_positions(self):
-        if self.pm_occupied:
-            self.update_employee_position(self.pm_box, "PM")
+        self.update_employee_position(self.pm_box, "PM")
 
     def update_gm_positions(self):
-        if self.gm_occupied:
-            self.update_employee_position(self.gm_box, "GM")
+        self.update_employee_position(self.gm_box, "GM")
 
     def update_foreman_positions(self):
-        if self.foreman_occupied:
-            self.update_employee_position(self.foreman_box, "Foreman")
+        self.update_employee_position(self.foreman_box, "Foreman")
 
     def update_super_positions(self):
-        if self.super_occupied:
-            self.update_employee_position(self.super_box, "Super")
+        self.update_employee_position(self.super_box, "Super")
 
     def update_employee_position(self, box, role):
-        x1, y1, x2, y2 = self.canvas.coords(box)
-        employee_id = self.get_employee_id_by_role(role)
-        if employee_id:
-            self.canvas.coords(employee_id, x1 + 35, y1)
-            circle_id = self.app.find_circle(employee_id)
-            if circle_id:
-                self.canvas.coords(circle_id, x1 + 10, y1 + 5, x1 + 10 + (self.circle_radius * self.app.scale),
-                                   y1 + (self.circle_radius * self.app.scale))
-            self.canvas.itemconfig(employee_id, state='normal')
-            if circle_id:
-                self.canvas.itemconfig(circle_id, state='normal')
+        employee = self.occupants[role]
+        if employee:
+            x1, y1, x2, y2 = self.canvas.coords(box)
+            self.canvas.coords(employee.id, x1 + 35, y1)
+            self.canvas.coords(employee.circle_id, x1 + 10, y1 + 5, x1 + 10 + (self.circle_radius * self.app.scale),
+                               y1 + (self.circle_radius * self.app.scale))
+            self.canvas.itemconfig(employee.id, state='normal')
+            self.canvas.itemconfig(employee.circle_id, state='normal')
 
             # Debugging output
-            print(f"Placing employee {employee_id} in box {box} with coordinates {self.canvas.coords(employee_id)}")
+            print(f"Placing employee {employee.id} in box {box} with coordinates {self.canvas.coords(employee.id)}")
 
     def get_employee_id_by_role(self, role):
-        for box in self.app.employee_boxes:
-            if box.role == role and box.current_snap_box and box.current_snap_box["hub"] == self:
-                return box.id
-        return None
-
-    def update_occupation(self, box, occupied, employee_id=None):
-        if box == "PM":
-            self.pm_occupied = occupied
-        elif box == "GM":
-            self.gm_occupied = occupied
-        elif box == "Foreman":
-            self.foreman_occupied = occupied
-        elif box == "Super":
-            self.super_occupied = occupied
+        employee = self.occupants.get(role)
+        return employee.id if employee else None
+
+    def slot_taken(self, box, employee):
+        """True if role slot `box` already holds someone other than `employee` (electrician boxes never fill up)."""
+        occupant = self.occupants.get(box)
+        return occupant is not None and occupant is not employee
+
+    def occupant_boxes(self):
+        """Everyone assigned to this hub: the role slots in order, then the electrician roster."""
+        return [employee for employee in self.occupants.values() if employee] + self.electricians
+
+    def clear_occupants(self):
+        """Empty every slot and the roster without touching the employees' own state; returns who was removed."""
+        removed = self.occupant_boxes()
+        for employee in removed:
+            self.canvas.dtag(employee.tag, self.tag)
+        self.occupants = dict.fromkeys(self.occupants)
+        self.electricians = []
+        return removed
+
+    def update_occupation(self, box, occupied, employee=None):
+        if employee:
+            # The employee's text and circle share the tag "employee<text id>" (see DraggableBox)
             if occupied:
-                self.update_super_positions()
+                self.canvas.addtag_withtag(self.tag, employee.tag)
             else:
-                # If unoccupied, there's no assigned employee in super_occupied
-                pass
+                self.canvas.dtag(employee.tag, self.tag)
+
+        if box in self.occupants:
+            if occupied:
+                self.occupants[box] = employee
+            elif employee is None or self.occupants[box] is employee:
+                self.occupants[box] = None
+            if box == "Super" and occupied:
+                self.update_super_positions()
 
         elif box == "Electrician" or box == "Fire Alarm":
             if not occupied:
-                if employee_id in self.electrician_occupied:
-                    self.electrician_occupied.remove(employee_id)
+                if employee in self.electricians:
+                    self.electricians.remove(employee)
             else:
-                if employee_id and employee_id not in self.electrician_occupied:
-                    self.electrician_occupied.append(employee_id)
+                if employee and employee not in self.electricians:
+                    self.electricians.append(employee)
             self.update_electrician_positions()
 
         # For debugging:
-        print(f"[update_occupation] box={box}, occupied={occupied}, employee_id={employee_id}")
+        print(f"[update_occupation] box={box}, occupied={occupied}, employee_id={employee.id if employee else None}")
 
     def update_electrician_positions(self):
         if self.electrician_box and self.canvas.type(self.electrician_box):
@@ -211,26 +207,23 @@ class JobSiteHub:
         padding = 10
 
         valid_electricians = []
-        for employee_id in self.electrician_occupied:
-            if self.canvas.type(employee_id):
-                valid_electricians.append(employee_id)
+        for employee in self.electricians:
+            if self.canvas.type(employee.id):
+                valid_electricians.append(employee)
 
-        self.electrician_occupied = valid_electricians
+        self.electricians = valid_electricians
 
-        for index, employee_id in enumerate(self.electrician_occupied):
+        for index, employee in enumerate(self.electricians):
             y_offset = y1 + index * (box_height + padding) * self.app.scale
-            if self.canvas.type(employee_id) == 'text':
-                self.canvas.coords(employee_id, x1 + 35, y_offset)
-            circle_id = self.app.find_circle(employee_id)
-            if circle_id and self.canvas.type(circle_id) == 'oval':
+            if self.canvas.type(employee.id) == 'text':
+                self.canvas.coords(employee.id, x1 + 35, y_offset)
+            circle_id = employee.circle_id
+            if self.canvas.type(circle_id) == 'oval':
                 circle_radius = 10 * self.app.scale
                 self.canvas.coords(circle_id, x1 + 10, y_offset + 5, x1 + 10 + circle_radius, y_offset + circle_radius)
-                if circle_id:
-                    self.canvas.itemconfig(circle_id, state='hidden')
+                self.canvas.itemconfig(circle_id, state='hidden')
             else:
-                self.canvas.itemconfig(employee_id, state='normal')
-                if circle_id:
-                    self.canvas.itemconfig(circle_id, state='normal')
+                self.canvas.itemconfig(employee.id, state='normal')
 
 # -----------------------------------------------------------
 # Occurrence 5 // GET & SET OF OCCUPATION STATUS
@@ -244,11 +237,11 @@ class JobSiteHub:
         electrician_box_coords = self.canvas.coords(self.electrician_box)
 
         return {
-            "PM": self.pm_occupied,
-            "GM": self.gm_occupied,
-            "Foreman": self.foreman_occupied,
-            "Super": self.super_occupied,  # Already included
-            "Electrician": self.electrician_occupied,
+            "PM": self.occupants["PM"] is not None,
+            "GM": self.occupants["GM"] is not None,
+            "Foreman": self.occupants["Foreman"] is not None,
+            "Super": self.occupants["Super"] is not None,  # Already included
+            "Electrician": [employee.id for employee in self.electricians],
             "ElectricianBoxCoords": electrician_box_coords,
             "PMCoords": pm_coords,
             "GMCoords": gm_coords,
@@ -258,13 +251,8 @@ class JobSiteHub:
         }
 
     def set_occupation_status(self, status):
-        self.pm_occupied = status["PM"]
-        self.gm_occupied = status["GM"]
-        self.foreman_occupied = status["Foreman"]
-        self.super_occupied = status["Super"]
-        self.electrician_occupied = status.get("Electrician", [])
-        if isinstance(self.electrician_occupied, bool):
-            self.electrician_occupied = []
+        # Slots and the electrician roster are filled by update_occupation as the employees are placed;
+        # the saved flags and canvas ids only describe whoever saved the file
         self.collapsed = status.get("Collapsed", False)
 
         # Provide a safe default if "SuperCoords" is missing
@@ -284,14 +272,20 @@ class JobSiteHub:
         self.update_all_positions()
 
     def erase_hub(self, event):
-        for box in [self.pm_box, self.gm_box, self.foreman_box, self.electrician_box]:
+        self.remove()
+        self.app.save_state("hub_erase", name=self.text)
+
+    def remove(self):
+        """Take the hub off the canvas and out of the hub list without saving."""
+        for box in [self.pm_box, self.gm_box, self.foreman_box, self.super_box, self.electrician_box]:
             self.canvas.delete(box)
         self.canvas.delete(self.id)
         self.canvas.delete(self.text_id)
         self.canvas.delete(self.erase_button_id)
         self.canvas.delete(self.collapse_button_id)
         self.app.canvas.hub_list.remove(self)
-        self.app.save_state()
+        self.app.registry.remove_hub(self)
+        self.app.layout_changed()
 
     def rename_hub(self, event):
         self.app.rename_hub(self)  # Call the method from the WhiteboardApp instance
@@ -299,10 +293,18 @@ class JobSiteHub:
     def save_new_name(self):
         new_name = self.new_name_entry.get()
         new_address = self.new_address_entry.get()
+        old_name = self.text
         if (not new_name.isspace()) and new_name != '':
             self.text = new_name
+            self.app.registry.rename_hub(self, old_name)
         if new_address != '':
             self.address = new_address
         self.canvas.itemconfig(self.text_id, text=self.get_display_text())
         self.rename_popup.destroy()
-        self.app.save_state()
+        self.app.save_state("hub_rename", hubs=[self], old=old_name, new=self.text)
+
+
+def hub_label(text, address=""):
+    # Return the text truncated to 20 characters with "..." if it's too long
+    truncated_text = (text[:15] + '...') if len(text) > 17 else text
+    return f"{truncated_text}{address}"
@@ -1,31 +1,24 @@
 # json_to_excel.py
+import argparse
 import pandas as pd
 import json
 from openpyxl import load_workbook
 from openpyxl.styles import Font
 from openpyxl.workbook import Workbook
 
+from board_sqlite import load_board
+from board_query import select_employees
 
-def convert_json_to_excel(json_file="output.json", excel_file="output.xlsx"):
+
+def build_job_site_summary(employees, job_sites):
     """
-    Converts JSON data (with 'employees' and 'job_sites' keys) into an Excel workbook.
-    It creates three sheets:
-      1. "Job Site Summary" – a summary of electrician counts per job site with styling and hyperlinks.
-      2. "Employees" – a sheet containing all employee data.
-      3. "Employee List" – a grouped list of employees by job site.
+    Builds the "Job Site Summary" table: electrician counts per skill and in total
+    for each job site, not counting employees who are out sick.
 
     Parameters:
-        json_file (str): Path to the input JSON file.
-        excel_file (str): Path for the output Excel file.
+        employees (DataFrame): One row per employee, as in the board's "employees" list.
+        job_sites (DataFrame): One row per job site, as in the board's "job_sites" list.
     """
-    # Load JSON data from file
-    with open(json_file, "r") as file:
-        data = json.load(file)
-
-    # Create DataFrames for employees and job sites
-    employees = pd.DataFrame(data["employees"])
-    job_sites = pd.DataFrame(data["job_sites"])
-
     # Initialize a list for organized job site data
     job_site_details = []
 
@@ -73,6 +66,47 @@ def convert_json_to_excel(json_file="output.json", excel_file="output.xlsx"):
             axis=1
         )
 
+    return job_site_summary
+
+
+def build_employee_list(employees):
+    """
+    Builds the "Employee List" table (Job Site, Employee Name, Role, Skills) for
+    every assigned employee, grouped by job site.
+    """
+    rows = []
+    for job_site_name, group in employees.groupby("job_site"):
+        for _, emp in group.iterrows():
+            skills = ", ".join(emp["skills"]) if isinstance(emp["skills"], list) else ""
+            rows.append({"Job Site": job_site_name, "Employee Name": emp["text"], "Role": emp["role"],
+                         "Skills": skills})
+    return pd.DataFrame(rows, columns=["Job Site", "Employee Name", "Role", "Skills"])
+
+
+def convert_json_to_excel(json_file="output.json", excel_file="output.xlsx", query=None):
+    """
+    Converts JSON data (with 'employees' and 'job_sites' keys) into an Excel workbook.
+    It creates three sheets:
+      1. "Job Site Summary" – a summary of electrician counts per job site with styling and hyperlinks.
+      2. "Employees" – a sheet containing all employee data.
+      3. "Employee List" – a grouped list of employees by job site.
+
+    Parameters:
+        json_file (str): Path to the input JSON file (or SQLite .db board).
+        excel_file (str): Path for the output Excel file.
+        query (str): Optional employee filter (see board_query.py), e.g. 'skill:Mechanic status:!Sick'.
+    """
+    # Load the board (output.json plus any journaled changes, or a SQLite output.db)
+    data = load_board(json_file)
+    if query:
+        data["employees"] = select_employees(data, query)
+
+    # Create DataFrames for employees and job sites
+    employees = pd.DataFrame(data["employees"])
+    job_sites = pd.DataFrame(data["job_sites"])
+
+    job_site_summary = build_job_site_summary(employees, job_sites)
+
     # Define a styler for the "Total Electricians" column (light yellow background, bold text)
     styler = job_site_summary.style.set_properties(
         subset=["Total Electricians"],
@@ -140,4 +174,9 @@ def convert_json_to_excel(json_file="output.json", excel_file="output.xlsx"):
 
 # To run as a standalone script:
 if __name__ == "__main__":
-    convert_json_to_excel()
+    parser = argparse.ArgumentParser(description="Export a board to Excel.")
+    parser.add_argument("json_file", nargs="?", default="output.json")
+    parser.add_argument("excel_file", nargs="?", default="output.xlsx")
+    parser.add_argument("--query", help="Only export employees matching this filter, e.g. 'role:*electrician status:!Sick'")
+    args = parser.parse_args()
+    convert_json_to_excel(args.json_file, args.excel_file, args.query)
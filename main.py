@@ -5,9 +5,13 @@ import os
 import sys
 import json  # Import json to create the file if needed
 
+from constants import STORAGE_BACKEND
+
 def select_file():
     """Automatically set the file path to 'output.json' in the same directory.
-    If the file does not exist, create an empty one with the required structure."""
+    If the file does not exist, create an empty one with the required structure.
+    With STORAGE_BACKEND = "sqlite" the board is 'output.db' instead, seeded from
+    'output.json' the first time if there is one."""
     if getattr(sys, 'frozen', False):
         # If the application is run as a bundled executable
         script_dir = os.path.dirname(sys.executable)
@@ -18,6 +22,9 @@ def select_file():
     # Construct the path to 'output.json' in the same directory
     file_path = os.path.join(script_dir, 'output.json')
 
+    if STORAGE_BACKEND == "sqlite":
+        return select_database(script_dir, file_path)
+
     # Check if the file exists
     if not os.path.isfile(file_path):
         try:
@@ -41,6 +48,38 @@ def select_file():
     return file_path
 
 
+def select_database(script_dir, json_path):
+    """Return the path to 'output.db', creating it (from 'output.json' if present) when missing."""
+    from board_sqlite import SQLiteBoardStore
+
+    db_path = os.path.join(script_dir, 'output.db')
+    if os.path.isfile(db_path):
+        return db_path
+
+    try:
+        store = SQLiteBoardStore(db_path)
+        try:
+            if os.path.isfile(json_path):
+                store.import_json(json_path)
+            else:
+                store.save({
+                    "employees": [],
+                    "job_sites": [],
+                    "scale": 1.0,
+                    "canvas_transform": [0, 0],
+                    "scroll_x": 0,
+                    "scroll_y": 0
+                })
+        finally:
+            store.close()
+        messagebox.showinfo("Info", f"'output.db' was not found and has been created at:\n{db_path}")
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to create 'output.db'. Error: {e}\nThe application will close.")
+        sys.exit(1)
+
+    return db_path
+
+
 if __name__ == "__main__":
     # Automatically set mode to 'online' and use the default file path
     selected_mode = 'online'
@@ -2,6 +2,7 @@ from webScraper import run_scraper
 from traqsperaCsvToJson import main as convert_csv_to_json
 from jsonToExcel import convert_json_to_excel
 import dash_board
+from constants import STORAGE_BACKEND
 
 
 def main():
@@ -16,7 +17,8 @@ def main():
     convert_json_to_excel(json_file="output.json", excel_file="output.xlsx")
 
     # Step 4: Launch the dashboard for shared viewing (server stays up)
-    dash_board.run_dashboard()
+    # With a SQLite board the dashboard reads output.db directly instead of the Excel export
+    dash_board.run_dashboard("output.db" if STORAGE_BACKEND == "sqlite" else None)
 
 
 if __name__ == "__main__":
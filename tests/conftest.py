@@ -0,0 +1,55 @@
+# conftest.py
+import json
+import os
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+BOARD_321 = os.path.join(REPO_DIR, "3.21.2025", "output.json")  # Real board written by pandas (NaN phones)
+
+
+class FakeBox:
+    """Stands in for a DraggableBox: the attributes the search and query code read, no canvas."""
+
+    def __init__(self, emp, hub=None):
+        self.text = emp.get("text", "")
+        self.role = emp.get("role")
+        self.phone = emp.get("phone", "")
+        self.skills = emp.get("skills", [])
+        self.sst_card = emp.get("sst_card")
+        self.nj_ny_certified = emp.get("nj_ny_certified")
+        self.certifications = emp.get("certifications") or []
+        self.worker_status = emp.get("worker_status")
+        self.current_status = emp.get("current_status")
+        self.current_snap_box = {"hub": hub, "box": emp.get("box")} if hub else None
+
+    def __repr__(self):
+        return f"FakeBox({self.text!r})"
+
+
+class FakeHub:
+    def __init__(self, text):
+        self.text = text
+
+
+@pytest.fixture
+def board_321():
+    with open(BOARD_321) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def make_box():
+    def make(text="Ana Lopez", site=None, **fields):
+        return FakeBox(dict(fields, text=text), FakeHub(site) if site else None)
+    return make
+
+
+@pytest.fixture
+def board_321_boxes(board_321):
+    hubs = {}
+    return [FakeBox(emp, hubs.setdefault(emp["job_site"], FakeHub(emp["job_site"])) if emp.get("box") else None)
+            for emp in board_321["employees"]]
@@ -0,0 +1,99 @@
+# test_board_cache.py
+import json
+import os
+
+import pytest
+
+from board_cache import BoardStateCache, file_signature
+
+
+def board(*names):
+    return {"employees": [{"key": name, "text": name} for name in names], "job_sites": []}
+
+
+class Board:
+    """A board file on disk and a cache over it that counts how often it was parsed."""
+
+    def __init__(self, path):
+        self.path = path
+        self.loads = 0
+        self.writes = 0
+        self.write(board("Ana Lopez"))
+        self.cache = BoardStateCache(path, self.load)
+
+    def load(self):
+        self.loads += 1
+        with open(self.path) as f:
+            return json.load(f)
+
+    def write(self, state):
+        with open(self.path, "w") as f:
+            json.dump(state, f)
+        # Make sure the signature changes even on filesystems with coarse timestamps
+        self.writes += 1
+        os.utime(self.path, ns=(0, self.writes * 1_000_000_000))
+
+
+@pytest.fixture
+def shared(tmp_path):
+    return Board(str(tmp_path / "output.json"))
+
+
+def test_get_parses_the_file_once(shared):
+    assert shared.cache.get() == board("Ana Lopez")
+    shared.cache.get()
+    shared.cache.invalidate()  # e.g. the watcher saw an unrelated event
+    shared.cache.get()
+    assert shared.loads == 1
+
+
+def test_changed_file_is_parsed_again_after_invalidate(shared):
+    shared.cache.get()
+    shared.write(board("Ana Lopez", "Sam Roe"))
+    assert shared.cache.get() == board("Ana Lopez")  # Not invalidated yet
+    shared.cache.invalidate()
+    assert shared.cache.get() == board("Ana Lopez", "Sam Roe")
+    assert shared.loads == 2
+
+
+def test_take_changes_hands_over_both_states_once(shared):
+    shared.cache.get()
+    assert shared.cache.take_changes() is None
+    shared.write(board("Sam Roe"))
+    assert shared.cache.take_changes() == (board("Ana Lopez"), board("Sam Roe"))
+    assert shared.cache.take_changes() is None
+
+
+def test_mark_synced_drops_the_pending_changes(shared):
+    shared.cache.get()
+    shared.write(board("Sam Roe"))
+    shared.cache.invalidate()
+    shared.cache.get()
+    shared.cache.mark_synced()
+    assert shared.cache.take_changes() is None
+
+
+def test_our_own_writes_are_not_parsed_back(shared):
+    shared.cache.get()
+    state = board("Ana Lopez", "New Hire")
+    shared.cache.store(state)
+    assert shared.cache.take_changes() is None  # Write still in flight
+    shared.write(state)
+    shared.cache.stamp()
+    shared.cache.invalidate()
+    assert shared.cache.get() == state
+    assert shared.cache.take_changes() is None
+    assert shared.loads == 1
+
+
+def test_apply_updates_the_cached_state_without_touching_the_stored_one(shared):
+    state = board("Ana Lopez", "Sam Roe")
+    shared.cache.store(state)
+    shared.cache.apply({"op": "delete_employee", "key": "Ana Lopez"})
+    assert shared.cache.get() == board("Sam Roe")
+    assert state == board("Ana Lopez", "Sam Roe")
+
+
+def test_file_signature(shared, tmp_path):
+    assert file_signature(str(tmp_path / "missing.json")) is None
+    assert file_signature(shared.path)[1] == os.path.getsize(shared.path)
@@ -0,0 +1,95 @@
+# test_board_history.py
+import copy
+import io
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+
+import pytest
+
+from board_history import BoardHistory, parse_when
+
+# Recording prunes against the real clock, so versions must be recent enough to be kept
+RECENT = (datetime.now() - timedelta(days=1)).replace(hour=8, minute=0, second=0, microsecond=0)
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = BoardHistory(str(tmp_path / "output.history.db"))
+    yield history
+    history.close()
+
+
+def test_move_on_nan_board_reports_only_the_move(history, board_321):
+    monday = RECENT
+    history.record(board_321, when=monday)
+    after = copy.deepcopy(board_321)
+    lrc = after["employees"][0]
+    assert lrc["text"] == "LRC Construction"
+    other_site = next(job["name"] for job in after["job_sites"] if job["name"] != lrc["job_site"])
+    lrc["job_site"] = other_site
+    history.record(after, when=monday + timedelta(hours=1))
+
+    changes = history.changes_between(monday, monday + timedelta(hours=1))
+    assert changes["moved"] == [("LRC Construction", (board_321["employees"][0]["job_site"], "GM"), (other_site, "GM"))]
+    assert changes["changed"] == []
+    assert changes["added"] == [] and changes["removed"] == []
+
+
+def test_field_changes_added_and_removed(history):
+    monday = RECENT
+    before = {"employees": [{"text": "Ana", "role": "Electrician", "phone": float("nan")},
+                            {"text": "Bo", "role": "GM"}], "job_sites": []}
+    after = {"employees": [{"text": "Ana", "role": "Foreman", "phone": float("nan")},
+                           {"text": "Cy", "role": "PM"}], "job_sites": []}
+    history.record(before, when=monday)
+    history.record(after, when=monday + timedelta(hours=2))
+    changes = history.changes_between(monday, monday + timedelta(hours=2))
+    assert changes["changed"] == [("Ana", ["role"])]
+    assert changes["removed"] == [("Bo", (None, None))]
+    assert changes["added"] == [("Cy", (None, None))]
+
+
+def test_unchanged_board_is_not_recorded_twice(history, board_321):
+    when = RECENT
+    assert history.record(board_321, when=when)
+    assert history.record(copy.deepcopy(board_321), when=when + timedelta(minutes=5)) is None
+    restored = history.board_at(when + timedelta(minutes=5))
+    assert [emp["text"] for emp in restored["employees"]] == [emp["text"] for emp in board_321["employees"]]
+    with pytest.raises(ValueError):
+        history.changes_between(when - timedelta(days=1), when)
+
+
+def test_zoom_only_change_is_not_a_new_version(history, board_321):
+    when = RECENT
+    assert history.record(board_321, when=when)
+    zoomed = copy.deepcopy(board_321)
+    zoomed.update(view={"level": 3, "x": -120.0, "y": 48.5}, scale=0.5, canvas_transform=[3.0, 1.0], scroll_x=0.4,
+                  scroll_y=0.25, journal_seq=12)
+    for job in zoomed["job_sites"]:
+        job["status"]["PMCoords"] = [coord * 2 for coord in job["status"]["PMCoords"]]
+        job["status"]["Electrician"] = [item + 500 for item in job["status"]["Electrician"]]
+    zoomed["employees"][0]["x"] += 1e-9  # Read back from the zoomed canvas
+    assert history.record(zoomed, when=when + timedelta(minutes=5)) is None
+
+    zoomed["job_sites"][0]["note"] = "Crane Monday"
+    assert history.record(zoomed, when=when + timedelta(minutes=10))
+    restored = history.board_at(when + timedelta(minutes=10))
+    assert restored["job_sites"][0]["note"] == "Crane Monday" and "scale" not in restored
+
+
+def test_prune_keeps_last_version_per_day(history):
+    now = datetime.now()
+    old_day = (now - timedelta(days=30)).replace(minute=0, second=0, microsecond=0)
+    for hour in (8, 12, 16):
+        history.record({"employees": [{"text": f"v{hour}"}], "job_sites": []},
+                       when=old_day.replace(hour=hour))
+    with redirect_stdout(io.StringIO()):
+        history.prune(keep_all_days=14, keep_days=365, now=now)
+    assert [saved_at for _, saved_at, _ in history.versions()] == [old_day.replace(hour=16).isoformat(timespec="seconds")]
+
+
+def test_parse_when():
+    assert parse_when("2025-03-21") == datetime(2025, 3, 21, 23, 59, 59)
+    assert parse_when("3.21.2025", end_of_day=False) == datetime(2025, 3, 21)
+    with pytest.raises(ValueError):
+        parse_when("yesterday")
@@ -0,0 +1,157 @@
+# test_board_journal.py
+import json
+
+from board_journal import BoardJournal, apply_record, journal_path_for, load_board_state
+from board_sqlite import load_board, save_board
+from board_sync import assign_employee_keys, employee_keys
+
+
+def employee(text, key=None, **fields):
+    emp = {"text": text, "role": "Electrician", "job_site": None, "box": None, "x": 10.0, "y": 20.0}
+    if key:
+        emp["key"] = key
+    emp.update(fields)
+    return emp
+
+
+def board():
+    return {"employees": [employee("Ana Lopez", "a1"), employee("Sam Roe", "s1"), employee("Ana Lopez", "a2")],
+            "job_sites": [{"name": "Job Site 1", "x": 50.0, "y": 50.0, "status": {}, "note": ""}]}
+
+
+def test_assign_employee_keys_is_deterministic_for_old_boards():
+    state = {"employees": [employee("Ana Lopez"), employee("Sam Roe"), employee("Ana Lopez")]}
+    keys = [emp["key"] for emp in assign_employee_keys(state)["employees"]]
+    assert keys == ["Ana Lopez#0", "Sam Roe#0", "Ana Lopez#1"]
+    again = {"employees": [employee("Ana Lopez"), employee("Sam Roe"), employee("Ana Lopez")]}
+    assert [emp["key"] for emp in assign_employee_keys(again)["employees"]] == keys
+
+
+def test_assign_employee_keys_keeps_existing_keys_unique():
+    state = {"employees": [employee("Ana Lopez", "Ana Lopez#1"), employee("Ana Lopez"), employee("Ana Lopez")]}
+    keys = [emp["key"] for emp in assign_employee_keys(state)["employees"]]
+    assert keys[0] == "Ana Lopez#1"
+    assert len(set(keys)) == 3
+
+
+def test_employee_keys_prefer_saved_keys():
+    assert employee_keys(board()["employees"]) == ["a1", "s1", "a2"]
+    assert employee_keys([employee("Ana Lopez"), employee("Ana Lopez")]) == [("Ana Lopez", 0), ("Ana Lopez", 1)]
+
+
+def test_records_find_employees_by_key_after_the_list_changed():
+    state = board()
+    apply_record(state, {"op": "delete_employee", "key": "a1"})
+    moved = employee("Ana Lopez", "a2", job_site="Job Site 1", box="Electrician")
+    apply_record(state, {"op": "assign", "key": "a2", "employee": moved})
+    assert [emp["key"] for emp in state["employees"]] == ["s1", "a2"]
+    assert state["employees"][1]["job_site"] == "Job Site 1"
+
+
+def test_add_employee_appends_and_unknown_delete_is_ignored():
+    state = board()
+    apply_record(state, {"op": "add_employee", "key": "n1", "employee": employee("New Hire", "n1")})
+    apply_record(state, {"op": "delete_employee", "key": "gone"})
+    assert employee_keys(state["employees"]) == ["a1", "s1", "a2", "n1"]
+
+
+def test_records_written_before_keys_use_the_index():
+    state = board()
+    apply_record(state, {"op": "edit", "i": 1, "employee": employee("Sam Roe", phone="555")})
+    apply_record(state, {"op": "delete_employee", "i": 0})
+    assert [emp["text"] for emp in state["employees"]] == ["Sam Roe", "Ana Lopez"]
+    assert state["employees"][0]["phone"] == "555"
+
+
+def test_records_replace_employee_dicts_instead_of_editing_them():
+    state = board()
+    shared = state["employees"][0]
+    apply_record(state, {"op": "move", "key": "a1", "employee": employee("Ana Lopez", "a1", x=99.0)})
+    assert shared["x"] == 10.0
+
+
+def test_hub_rename_and_erase():
+    state = board()
+    state["employees"][1] = employee("Sam Roe", "s1", job_site="Job Site 1", box="Foreman")
+    apply_record(state, {"op": "hub_rename", "old": "Job Site 1", "new": "Main St"})
+    assert state["job_sites"][0]["name"] == "Main St"
+    assert state["employees"][1]["job_site"] == "Main St"
+    apply_record(state, {"op": "note", "name": "Main St", "note": "Gate code 42"})
+    assert state["job_sites"][0]["note"] == "Gate code 42"
+    apply_record(state, {"op": "hub_erase", "name": "Main St"})
+    assert state["job_sites"] == []
+
+
+def test_replay_skips_records_already_in_the_snapshot(tmp_path):
+    path = str(tmp_path / "output.json")
+    state = dict(board(), journal_seq=1)
+    with open(path, "w") as f:
+        json.dump(state, f)
+    journal = BoardJournal(path)
+    journal.append("delete_employee", key="s1")  # seq 1, already compacted
+    journal.append("delete_employee", key="a1")
+    assert journal_path_for(path) == str(tmp_path / "output.journal")
+
+    replayed = BoardJournal(path).replay(dict(board(), journal_seq=1))
+    assert employee_keys(replayed["employees"]) == ["s1", "a2"]
+    assert employee_keys(load_board_state(path)["employees"]) == ["s1", "a2"]
+
+
+def test_replay_ignores_a_torn_last_line(tmp_path):
+    path = str(tmp_path / "output.json")
+    journal = BoardJournal(path)
+    journal.append("delete_employee", key="a1")
+    with open(journal.path, "a") as f:
+        f.write('{"seq": 2, "op": "delete_emp')
+    fresh = BoardJournal(path)
+    state = fresh.replay(board())
+    assert employee_keys(state["employees"]) == ["s1", "a2"]
+    assert fresh.seq == 1 and fresh.record_count == 1
+
+
+def test_old_board_and_journal_agree_on_keys(tmp_path):
+    path = str(tmp_path / "output.json")
+    with open(path, "w") as f:
+        json.dump({"employees": [employee("Ana Lopez"), employee("Ana Lopez")], "job_sites": []}, f)
+    BoardJournal(path).append("edit", key="Ana Lopez#1", employee=employee("Ana Lopez", "Ana Lopez#1", phone="555"))
+    state = load_board_state(path)
+    assert [emp.get("phone") for emp in state["employees"]] == [None, "555"]
+
+
+def test_external_saves_are_not_reverted_by_the_journal(tmp_path):
+    path = str(tmp_path / "output.json")
+    with open(path, "w") as f:
+        json.dump(board(), f)
+    BoardJournal(path).append("edit", key="s1", employee=employee("Sam Roe", "s1", current_status="Sick"))
+
+    state = load_board(path)  # e.g. the Traqspera import
+    assert state["employees"][1]["current_status"] == "Sick"
+    state["employees"][1] = dict(state["employees"][1], current_status="Vacation")
+    save_board(state, path)
+
+    assert load_board(path)["employees"][1]["current_status"] == "Vacation"
+    # A record the whiteboard journals after that save still applies
+    journal = BoardJournal(path)
+    journal.replay(load_board(path))
+    journal.append("edit", key="a2", employee=employee("Ana Lopez", "a2", current_status="Sick"))
+    assert load_board(path)["employees"][2]["current_status"] == "Sick"
+
+
+def test_resume_continues_numbering_without_going_back(tmp_path):
+    path = str(tmp_path / "output.json")
+    live = BoardJournal(path)
+    for key in ("a1", "s1", "a2"):
+        live.append("delete_employee", key=key)
+
+    # A sync reload replays with its own journal; the live one is untouched
+    BoardJournal(path).replay(dict(board(), journal_seq=1))
+    assert live.seq == 3 and live.record_count == 3
+
+    live.resume(dict(board(), journal_seq=1))
+    assert live.seq == 3 and live.record_count == 2
+    assert live.size == (tmp_path / "output.journal").stat().st_size
+    assert live.append("delete_employee", key="gone")["seq"] == 4
+
+    fresh = BoardJournal(path)
+    fresh.resume(board())
+    assert fresh.seq == 4 and fresh.record_count == 4
@@ -0,0 +1,160 @@
+# test_board_listview.py
+import tkinter as tk
+from types import SimpleNamespace
+
+from board_listview import VirtualListbox
+
+
+class FakeListbox:
+    """A tk.Listbox stand-in that keeps its rows in a list and counts the rows written."""
+
+    def __init__(self):
+        self.rows = []
+        self.selected = set()
+        self.writes = 0
+        self.events = []
+
+    def _index(self, index):
+        return len(self.rows) if index == tk.END else index
+
+    def insert(self, index, text):
+        self.rows.insert(self._index(index), text)
+        self.writes += 1
+
+    def delete(self, first, last=None):
+        first = self._index(first)
+        last = first if last is None else self._index(last)
+        del self.rows[first:last + 1]
+
+    def yview_moveto(self, fraction):
+        pass
+
+    def selection_clear(self, first, last):
+        self.selected.clear()
+
+    def selection_set(self, index):
+        self.selected.add(index)
+
+    def curselection(self):
+        return tuple(sorted(self.selected))
+
+    def event_generate(self, sequence):
+        self.events.append(sequence)
+
+
+class FakeScrollbar:
+    def set(self, first, last):
+        self.span = (first, last)
+
+
+def make_view(rows):
+    """A VirtualListbox over fake widgets, in the state __init__ leaves it in (no display needed)."""
+    view = VirtualListbox.__new__(VirtualListbox)
+    view.listbox = FakeListbox()
+    view.scrollbar = FakeScrollbar()
+    view.label = str
+    view.items = []
+    view.top = 0
+    view.rows = rows
+    view.shown = []
+    view.selected = None
+    return view
+
+
+def names(count, prefix="Employee"):
+    return [f"{prefix} {i}" for i in range(count)]
+
+
+def test_only_the_visible_rows_are_drawn():
+    view = make_view(rows=10)
+    view.set_items(names(10000))
+    assert view.listbox.rows == names(11)  # Plus the partly visible bottom row
+    assert view.scrollbar.span == (0.0, 10 / 10000)
+
+
+def test_updates_rewrite_only_changed_rows():
+    view = make_view(rows=10)
+    items = names(1000)
+    view.set_items(items)
+    view.listbox.writes = 0
+    items[3] = "New Hire"
+    view.set_items(items)
+    assert view.listbox.writes == 1
+    assert view.listbox.rows[3] == "New Hire"
+
+
+def test_first_visible_item_is_followed_by_identity():
+    view = make_view(rows=5)
+    items = names(100)
+    view.set_items(items)
+    view.scroll(20)
+    assert view.listbox.rows[0] == "Employee 20"
+    view.set_items(names(10, "Added") + items)  # Rows added above the view
+    assert view.top == 30 and view.listbox.rows[0] == "Employee 20"
+    view.set_items(items[:20] + items[21:])  # The first visible row itself went away
+    assert view.top == 30 and view.listbox.rows[0] == "Employee 31"
+
+
+def test_scrolling_stays_in_range():
+    view = make_view(rows=5)
+    view.set_items(names(12))
+    view.scroll(-3)
+    assert view.top == 0
+    view.scroll(100)
+    assert view.top == 7 and view.listbox.rows == names(12)[7:]
+    view.yview("moveto", "0.5")
+    assert view.top == 6
+    view.yview("scroll", "-1", "pages")
+    assert view.top == 1
+    view.yview("scroll", "2", "units")
+    assert view.top == 3
+
+
+def test_short_and_empty_lists():
+    view = make_view(rows=10)
+    view.set_items(names(3))
+    assert view.top == 0 and view.listbox.rows == names(3)
+    view.set_items([])
+    assert view.listbox.rows == [] and view.scrollbar.span == (0.0, 1.0)
+
+
+def test_selection_follows_the_item():
+    view = make_view(rows=5)
+    items = names(50)
+    view.set_items(items)
+    view.scroll(10)
+    view.listbox.selected = {2}
+    view.on_listbox_select(SimpleNamespace())
+    assert view.selection() == "Employee 12"
+
+    view.set_items(["Added"] + items)
+    assert view.listbox.curselection() == (2,)  # Still on Employee 12, which kept its row
+    view.scroll(20)
+    assert view.listbox.curselection() == ()  # Scrolled out of view, still selected
+    assert view.selection() == "Employee 12"
+    view.set_items(items[:12] + items[13:])
+    assert view.selection() is None
+
+
+def test_keyboard_moves_the_selection_and_the_window():
+    view = make_view(rows=5)
+    items = names(50)
+    view.set_items(items)
+    view.move_selection(1)  # Nothing selected yet: start at the first visible row
+    assert view.selection() == "Employee 0" and view.listbox.events == ["<<ListboxSelect>>"]
+    for _ in range(6):
+        view.move_selection(1)
+    assert view.selection() == "Employee 6"
+    assert view.top == 2 and view.listbox.curselection() == (4,)  # Scrolled just far enough
+    view.move_selection(-5)
+    assert view.top == 1 and view.listbox.curselection() == (0,)
+
+    assert view.select(len(items) - 1) == "break"  # End
+    assert view.selection() == "Employee 49" and view.top == 45
+    view.move_selection(1)
+    assert view.selection() == "Employee 49"
+    view.select(0)  # Home
+    assert view.top == 0 and view.listbox.curselection() == (0,)
+    view.move_selection(-1)
+    assert view.selection() == "Employee 0"
+
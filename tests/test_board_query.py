@@ -0,0 +1,74 @@
+# test_board_query.py
+import io
+from contextlib import redirect_stdout
+
+import pytest
+
+from board_query import EmployeeTable, compile_query, employee_fields, select_employees
+
+
+def select(state, query):
+    with redirect_stdout(io.StringIO()):
+        return select_employees(state, query)
+
+
+def test_parse():
+    query = compile_query('role:Electrician cert:OSHA skill:Mechanic,Helper status:!Sick -site:"Job Site 4" ana')
+    assert query.clauses == [
+        ("role", ("electrician",), False),
+        ("cert", ("osha",), False),
+        ("skill", ("mechanic", "helper"), False),
+        ("status", ("sick",), True),
+        ("site", ("job site 4",), True),
+    ]
+    assert query.text == "ana"
+    assert compile_query("role:GM") is compile_query("role:GM")  # Cached by text
+
+
+def test_parse_errors():
+    with pytest.raises(ValueError):
+        compile_query("bogus:1")
+    with pytest.raises(ValueError):
+        compile_query('site:"Job Site 4')
+    assert compile_query("O'Brien").text == "O'Brien"
+
+
+def test_employee_fields_cleans_nan_and_none():
+    fields = employee_fields({"text": "Ana", "role": float("nan"), "phone": float("nan"), "skills": None,
+                              "certifications": float("nan"), "worker_status": float("nan"),
+                              "current_status": None, "job_site": float("nan"), "box": None})
+    assert fields["phone"] == ""
+    assert fields["role"] == {""}
+    assert fields["skill"] == set()
+    assert fields["status"] == {"on-site"}
+    assert fields["assigned"] == {"no"}
+
+
+def test_3_21_board(board_321):
+    employees = board_321["employees"]
+    gms = select(board_321, "role:GM")
+    assert gms == [emp for emp in employees if emp["role"] == "GM"]
+    site = employees[0]["job_site"]
+    assert select(board_321, f'site:"{site}"') == [emp for emp in employees if emp["job_site"] == site]
+    healthy = select(board_321, "role:*electrician status:!Sick")
+    assert healthy and all("Electrician" in emp["role"] and emp["current_status"] != "Sick" for emp in healthy)
+
+
+@pytest.mark.parametrize("text", ["role:gm,pm", "-role:gm site:!", "cert:osha skill:helper", "phone:718",
+                                  "assigned:no", "role:*electrician", "lrc"])
+def test_table_matches_predicates(board_321, text):
+    employees = board_321["employees"]
+    with redirect_stdout(io.StringIO()):
+        table = EmployeeTable(employees)
+        assert table.select(text) == compile_query(text).filter(employees)
+        assert table.select(text) is table.select(text)  # Cached per query text
+
+
+def test_boxes(make_box):
+    placed = make_box("Bo Kim", site="Job Site 4", role="Electrician", current_status="Sick")
+    loose = make_box("Ana Lopez", role="Electrician", phone=float("nan"), certifications=["OSHA Card"])
+    boxes = [placed, loose]
+    assert compile_query('site:"job site 4"').filter(boxes) == [placed]
+    assert compile_query("status:!sick cert:osha").filter(boxes) == [loose]
+    assert compile_query("bo role:electrician").filter(boxes) == [placed]
+    assert compile_query("bo").filter(boxes, text=False) == boxes
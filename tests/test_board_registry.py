@@ -0,0 +1,62 @@
+# test_board_registry.py
+import itertools
+
+import pytest
+
+from board_registry import BoardRegistry
+
+ids = itertools.count(1)
+
+
+@pytest.fixture
+def new_box(make_box):
+    def make(text):
+        box = make_box(text)
+        box.id = next(ids)
+        return box
+    return make
+
+
+class Hub:
+    def __init__(self, text):
+        self.text = text
+        self.id = next(ids)
+
+
+def test_loader_order_keeps_file_order_for_equal_names(new_box):
+    registry = BoardRegistry()
+    # File order: hub 0 "Job Site 1", hub 1 "Job Site 1"; the loader created hub 1 first (it was in view)
+    first, second = Hub("Job Site 1"), Hub("Job Site 1")
+    registry.add_hub(second, order=1)
+    registry.add_hub(first, order=0)
+    assert registry.hub_named("Job Site 1") is first
+
+    boxes = [new_box("Ana Lopez") for _ in range(3)]
+    for j in (2, 0, 1):
+        registry.add_box(boxes[j], order=j)
+    assert registry.boxes_named("Ana Lopez") == boxes
+
+
+def test_boxes_added_later_come_after_the_loaded_ones(new_box):
+    registry = BoardRegistry()
+    added = new_box("Ana Lopez")  # Added by the user while the board was still filling in
+    loaded = new_box("Ana Lopez")
+    registry.add_box(added)
+    registry.add_box(loaded, order=5)
+    assert registry.boxes_named("Ana Lopez") == [loaded, added]
+
+
+def test_remove_and_rename(new_box):
+    registry = BoardRegistry()
+    hub = Hub("Job Site 1")
+    registry.add_hub(hub, order=0)
+    hub.text = "Main St"
+    registry.rename_hub(hub, "Job Site 1")
+    assert registry.hub_named("Job Site 1") is None and registry.hub_named("Main St") is hub
+    assert registry.hub(hub.id) is hub
+
+    box = new_box("Ana Lopez")
+    registry.add_box(box, order=0)
+    registry.remove_box(box)
+    assert registry.boxes_named("Ana Lopez") == [] and registry.box(box.id) is None
+    assert not registry.order.get(box)
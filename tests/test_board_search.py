@@ -0,0 +1,71 @@
+# test_board_search.py
+import io
+from contextlib import redirect_stdout
+
+from board_search import EmployeeSearchIndex, phone_digits, query_digits
+
+
+def search(index, text="", **filters):
+    with redirect_stdout(io.StringIO()):
+        return index.search(text, unassigned_only=False, **filters)
+
+
+def test_phone_digits_ignores_missing_numbers():
+    assert phone_digits("(718) 555-0101") == "7185550101"
+    assert phone_digits(7185550101) == "7185550101"
+    assert phone_digits(7185550101.0) == "7185550101"
+    for missing in (None, float("nan"), float("inf"), True, [], ""):
+        assert phone_digits(missing) == ""
+
+
+def test_query_digits():
+    assert query_digits("555-01") == "55501"
+    assert query_digits("55") == ""
+    assert query_digits("ana 555") == ""
+
+
+def test_indexes_the_3_21_board(board_321_boxes):
+    index = EmployeeSearchIndex()
+    for box in board_321_boxes:
+        index.add(box)
+    assert len(search(index)) == len(board_321_boxes)
+    lrc = next(box for box in board_321_boxes if box.text == "LRC Construction")
+    assert search(index, "LRC Construction")[0] is lrc
+    assert search(index, "lrc constrcution")[0] is lrc  # Typo
+    assert all("OSHA Card" in box.certifications for box in search(index, cert="OSHA"))
+
+
+def test_ranking_and_phone_search(make_box):
+    index = EmployeeSearchIndex()
+    ana = make_box("Ana Lopez", phone="718-555-0101")
+    lopez = make_box("Maria Lopezz", phone=float("nan"))
+    kim = make_box("Bo Kim", phone="212-555-0199", skills=["Mechanic"])
+    for box in (lopez, kim, ana):
+        index.add(box)
+    assert search(index, "ana")[0] is ana
+    assert search(index, "lopez")[:2] == [lopez, ana]  # Both contain it; added order breaks the tie
+    assert search(index, "5550199") == [kim]
+    assert search(index, "mechanic") == [kim]
+    assert search(index, "lopex")[0] in (ana, lopez)
+
+
+def test_update_and_remove(make_box):
+    index = EmployeeSearchIndex()
+    box = make_box("Ana Lopez")
+    index.add(box)
+    box.text = "Zed Quux"
+    index.update(box)
+    assert search(index, "quux") == [box]
+    assert search(index, "lopez") == []
+    index.remove(box)
+    assert search(index, "quux") == []
+    assert not index.grams and not index.fuzzy and not index.facets
+
+
+def test_unassigned_only(make_box):
+    index = EmployeeSearchIndex()
+    loose, placed = make_box("Ana Lopez"), make_box("Ana Placed", site="Job Site 4")
+    index.add(loose)
+    index.add(placed)
+    with redirect_stdout(io.StringIO()):
+        assert index.search("ana") == [loose]
@@ -0,0 +1,49 @@
+# test_board_serializer.py
+import json
+import math
+
+import pytest
+
+from board_serializer import BoardSerializer, get_serializer
+
+
+def test_default_is_pretty():
+    serializer = get_serializer()
+    assert serializer is get_serializer("pretty")
+    assert serializer.indent == 4
+    with pytest.raises(ValueError):
+        get_serializer("yaml")
+
+
+@pytest.mark.parametrize("mode", ["pretty", "compact"])
+def test_round_trip_of_the_3_21_board(board_321, tmp_path, mode):
+    serializer = get_serializer(mode)
+    path = str(tmp_path / "output.json")
+    serializer.dump(board_321, path)
+    loaded = serializer.load(path)
+    assert [emp["text"] for emp in loaded["employees"]] == [emp["text"] for emp in board_321["employees"]]
+    assert [job["name"] for job in loaded["job_sites"]] == [job["name"] for job in board_321["job_sites"]]
+    phone = loaded["employees"][0]["phone"]
+    if serializer.codec == "orjson":
+        assert phone is None  # orjson writes NaN as null
+    else:
+        assert math.isnan(phone)  # pandas' empty cells survive with the standard library
+    assert loaded["scale"] == board_321["scale"]
+
+
+def test_compact_rounds_coordinates_only():
+    state = {"employees": [{"text": "Ana", "x": 1.23456, "y": 2, "electrician_rank": 0.5}],
+             "job_sites": [{"name": "A", "x": 9.87654, "status": {"PMCoords": [1.11111, 2.22222]}}],
+             "scale": 0.123456}
+    text = BoardSerializer(indent=None, precision=2, codec="json").dumps(state)
+    assert json.loads(text) == {
+        "employees": [{"text": "Ana", "x": 1.23, "y": 2, "electrician_rank": 0.5}],
+        "job_sites": [{"name": "A", "x": 9.88, "status": {"PMCoords": [1.11, 2.22]}}],
+        "scale": 0.123456,
+    }
+    assert state["employees"][0]["x"] == 1.23456  # The state itself is left alone
+
+
+def test_pretty_output_is_indented():
+    text = get_serializer("pretty").dumps({"employees": [], "job_sites": []})
+    assert text == json.dumps({"employees": [], "job_sites": []}, indent=4)
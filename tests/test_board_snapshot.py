@@ -0,0 +1,70 @@
+# test_board_snapshot.py
+import json
+
+import pytest
+
+from board_snapshot import (SnapshotReader, encode_snapshot, json_to_snapshot, read_snapshot, snapshot_path_for,
+                            snapshot_to_json, synthetic_board, write_snapshot)
+
+
+def same_board(a, b):
+    # NaN (empty pandas cells) never equals itself, so compare as JSON text
+    return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
+
+
+def test_round_trip_synthetic_board():
+    state = synthetic_board(200)
+    state["employees"][0]["key"] = "a1"
+    assert SnapshotReader(encode_snapshot(state)).to_state() == state
+
+
+def test_round_trip_real_board(board_321):
+    assert same_board(SnapshotReader(encode_snapshot(board_321)).to_state(), board_321)
+
+
+def test_missing_fields_stay_missing():
+    state = {"employees": [{"text": "Ana Lopez", "role": "PM"}, {"text": "Sam Roe", "skills": "Helper", "x": 1.5,
+                                                                 "y": 2.5}],
+             "job_sites": [{"name": "Job Site 1", "x": 50.0, "y": 50.0, "status": {"GM": True}}],
+             "view": {"level": 2, "x": 0.0, "y": 0.0}}
+    assert SnapshotReader(encode_snapshot(state)).to_state() == state
+
+
+def test_values_keep_their_type():
+    state = {"employees": [{"text": "Ana Lopez", "electrician_rank": 1}, {"text": "Sam Roe", "electrician_rank": "1"},
+                           {"text": "Lee Park", "electrician_rank": True}, {"text": "Bo Chan", "electrician_rank": 1.0}],
+             "job_sites": []}
+    ranks = [emp["electrician_rank"] for emp in SnapshotReader(encode_snapshot(state)).to_state()["employees"]]
+    assert [type(rank) for rank in ranks] == [int, str, bool, float]
+
+
+def test_random_access_rows():
+    state = synthetic_board(50)
+    reader = SnapshotReader(encode_snapshot(state))
+    row = reader.employee(17)
+    assert row.text == "Employee 17" and (row.x, row.y) == (state["employees"][17]["x"], state["employees"][17]["y"])
+    assert [row.text for row in reader.employees()] == [emp["text"] for emp in state["employees"]]
+    hub = reader.hub(3)
+    assert hub.name == "Job Site 4" and hub.status == state["job_sites"][3]["status"]
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        SnapshotReader(b"not a snapshot" + bytes(64))
+
+
+def test_json_conversion(tmp_path):
+    json_path = str(tmp_path / "output.json")
+    state = synthetic_board(20)
+    with open(json_path, "w") as f:
+        json.dump(state, f)
+    assert snapshot_path_for(json_path) == str(tmp_path / "output.fbs")
+    assert read_snapshot(json_to_snapshot(json_path)) == state
+
+    board = {"employees": [{"text": "Ana Lopez", "x": 100.0, "y": 40.0}], "job_sites": [],
+             "view": {"level": 0, "x": 0.0, "y": 0.0}}
+    write_snapshot(board, str(tmp_path / "board.fbs"))
+    snapshot_to_json(str(tmp_path / "board.fbs"), str(tmp_path / "board.json"))
+    with open(tmp_path / "board.json") as f:
+        written = json.load(f)
+    assert written["view"] == board["view"] and "scale" in written  # Readable by builds from before BoardView
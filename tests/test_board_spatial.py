@@ -0,0 +1,86 @@
+# test_board_spatial.py
+import random
+
+import pytest
+
+from board_spatial import SNAP_BOX_TYPES, SnapBoxIndex
+from board_view import hub_grid_rect, snap_box_rects
+
+
+class FakeCanvas:
+    """Just enough of a tk.Canvas for the index: item id -> coords."""
+
+    def __init__(self):
+        self.items = {}
+
+    def create(self, coords):
+        item = len(self.items) + 1
+        self.items[item] = list(coords)
+        return item
+
+    def coords(self, item):
+        return self.items.get(item, [])
+
+
+class FakeHub:
+    def __init__(self, canvas, rect, scale):
+        self.rect = rect
+        for box_type, coords in snap_box_rects(rect, scale).items():
+            setattr(self, f"{box_type.lower()}_box", canvas.create(coords))
+
+
+def board(hub_count, scale):
+    canvas = FakeCanvas()
+    hubs = []
+    for i in range(hub_count):
+        x1, y1, x2, y2 = hub_grid_rect(i)
+        hubs.append(FakeHub(canvas, (x1 * scale, y1 * scale, x2 * scale, y2 * scale), scale))
+    return canvas, hubs
+
+
+def scan(canvas, hubs, x, y):
+    """What the drag code did before the index: ask the canvas for every snap box."""
+    hits = []
+    for hub in hubs:
+        for box_type in SNAP_BOX_TYPES:
+            item = getattr(hub, f"{box_type.lower()}_box")
+            coords = canvas.coords(item)
+            if len(coords) == 4 and coords[0] < x < coords[2] and coords[1] < y < coords[3]:
+                hits.append((hub, box_type, coords, item))
+    return hits
+
+
+@pytest.mark.parametrize("scale", [0.225, 1.0, 2.5])
+def test_index_matches_a_full_scan(scale):
+    canvas, hubs = board(40, scale)
+    index = SnapBoxIndex()
+    index.rebuild(canvas, hubs, version=1)
+    assert index.box_count == 40 * len(SNAP_BOX_TYPES)
+    rng = random.Random(7)
+    x_max, y_max = max(hub.rect[2] for hub in hubs), max(hub.rect[3] for hub in hubs)
+    points = [(rng.uniform(-10, x_max + 10), rng.uniform(-10, y_max + 10)) for _ in range(2000)]
+    points += [((x1 + x2) / 2, (y1 + y2) / 2) for x1, y1, x2, y2 in map(canvas.coords, canvas.items)]
+    for x, y in points:
+        assert index.find_all(x, y) == scan(canvas, hubs, x, y)
+
+
+def test_find_returns_the_first_match():
+    canvas, hubs = board(2, 1.0)
+    index = SnapBoxIndex()
+    index.rebuild(canvas, hubs, version="v")
+    x1, y1, x2, y2 = canvas.coords(hubs[1].foreman_box)
+    hub, box_type, coords, item = index.find((x1 + x2) / 2, (y1 + y2) / 2)
+    assert (hub, box_type, item) == (hubs[1], "Foreman", hubs[1].foreman_box)
+    assert index.find(-500, -500) is None
+    assert index.version == "v"
+
+
+def test_boxes_without_coords_are_skipped():
+    canvas, hubs = board(1, 1.0)
+    del canvas.items[hubs[0].gm_box]
+    index = SnapBoxIndex()
+    index.rebuild(canvas, hubs, version=1)
+    assert index.box_count == len(SNAP_BOX_TYPES) - 1
+    empty = SnapBoxIndex()
+    empty.rebuild(FakeCanvas(), [], version=1)
+    assert empty.find(0, 0) is None
@@ -0,0 +1,184 @@
+# test_board_sqlite.py
+import copy
+import sqlite3
+
+import pytest
+
+from board_sqlite import SQLiteBoardStore, is_sqlite_path, keep_positions, load_board, save_board
+from board_sync import assign_employee_keys
+
+
+def employee(key, text, job_site=None, box=None, **fields):
+    emp = {"key": key, "text": text, "role": "Electrician", "phone": "555-0100", "skills": ["Mechanic"],
+           "sst_card": "No", "nj_ny_certified": "NJ", "electrician_rank": "1", "certifications": ["OSHA 10"],
+           "worker_status": "Journeyman", "current_status": "On-site", "job_site": job_site, "box": box,
+           "x": 10.0, "y": 20.0}
+    emp.update(fields)
+    return emp
+
+
+def board():
+    return {
+        "employees": [employee("a1", "Ana Lopez", "Job Site 1", "Electrician"), employee("s1", "Sam Roe"),
+                      employee("a2", "Ana Lopez", "Job Site 2", "Foreman")],
+        "job_sites": [{"name": "Job Site 1", "x": 50.0, "y": 50.0, "status": {"Collapsed": False}, "note": "Gate 4"},
+                      {"name": "Job Site 2", "x": 90.0, "y": 50.0, "status": {}, "note": ""}],
+        "view": {"level": 0, "x": 0.0, "y": 0.0}, "scroll_x": 0.0, "scroll_y": 0.0,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteBoardStore(str(tmp_path / "output.db"))
+    store.save(board())
+    yield store
+    store.close()
+
+
+def count(store, table):
+    return store.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_save_and_load_round_trip(store):
+    assert store.load() == board()
+    assert is_sqlite_path("board.SQLite") and not is_sqlite_path("output.json")
+
+
+def test_records_update_rows_by_key(store):
+    store.apply({"op": "delete_employee", "key": "a1"})
+    store.apply({"op": "edit", "key": "a2", "employee": employee("a2", "Ana Lopez", phone="555-0199")})
+    store.apply({"op": "add_employee", "key": "n1", "employee": employee("n1", "New Hire")})
+    employees = store.load()["employees"]
+    assert [emp["key"] for emp in employees] == ["s1", "a2", "n1"]
+    assert employees[1]["phone"] == "555-0199"
+    assert employees[1]["job_site"] is None  # Unassigned by the edit
+    assert count(store, "assignments") == 0
+
+
+def test_hub_erase_drops_its_assignments(store):
+    store.apply({"op": "hub_erase", "name": "Job Site 1"})
+    state = store.load()
+    assert [job["name"] for job in state["job_sites"]] == ["Job Site 2"]
+    assert [(emp["job_site"], emp["box"]) for emp in state["employees"]] == \
+        [(None, None), (None, None), ("Job Site 2", "Foreman")]
+    assert count(store, "notes") == 0
+
+
+def test_hub_rename_moves_assignments_and_notes(store):
+    store.apply({"op": "hub_rename", "old": "Job Site 1", "new": "Main St"})
+    state = store.load()
+    assert state["job_sites"][0]["name"] == "Main St" and state["job_sites"][0]["note"] == "Gate 4"
+    assert state["employees"][0]["job_site"] == "Main St"
+
+
+def test_update_writes_only_changed_rows(store):
+    store.load()
+    ids = dict(store.conn.execute("SELECT key, id FROM employees"))
+    new = board()
+    new["employees"][1] = employee("s1", "Sam Roe", "Job Site 2", "Electrician")
+    del new["employees"][0]
+    new["employees"].append(employee("n1", "New Hire"))
+    new["job_sites"][1]["note"] = "Crane Monday"
+    new["scroll_y"] = 0.5
+
+    changes = []
+    store.conn.set_trace_callback(changes.append)
+    store.update(new)
+    store.conn.set_trace_callback(None)
+
+    assert store.load() == new
+    # Ana #2 was untouched, so her row was neither deleted nor rewritten
+    assert dict(store.conn.execute("SELECT key, id FROM employees"))["a2"] == ids["a2"]
+    assert not any("'a2'" in sql for sql in changes)
+    assert not any("DELETE FROM employees" in sql and "key" not in sql for sql in changes)
+
+
+def test_update_inserts_in_the_middle(store):
+    store.load()
+    new = board()
+    new["employees"].insert(1, employee("n1", "New Hire"))
+    new["job_sites"].reverse()
+    store.update(new)
+    assert store.load() == new
+
+
+@pytest.mark.parametrize("keys, expected", [
+    (["b", "c"], [1, 2]),  # "a" deleted: nothing moves
+    (["a", "b", "c", "d"], [0, 1, 2, 3]),  # Appended
+    (["a", "d", "b", "c"], [0, 1, 2, 3]),  # Inserted: only the rows after it move
+    (["c", "a", "b"], [2, 3, 4]),
+])
+def test_keep_positions(keys, expected):
+    assert keep_positions(keys, {"a": 0, "b": 1, "c": 2}) == expected
+
+
+def test_update_keeps_in_step_with_applied_records(store):
+    store.load()
+    store.apply({"op": "delete_employee", "key": "a1"})
+    new = board()
+    del new["employees"][0]
+    store.update(new)
+    assert store.load() == new
+
+
+def test_first_update_writes_everything(tmp_path):
+    store = SQLiteBoardStore(str(tmp_path / "fresh.db"))
+    try:
+        store.update(board())
+        assert store.load() == board()
+    finally:
+        store.close()
+
+
+def test_update_keeps_rows_another_client_added(store, tmp_path):
+    other = SQLiteBoardStore(str(tmp_path / "output.db"))  # A teammate's whiteboard on the same database
+    try:
+        other.apply({"op": "add_employee", "key": "n1", "employee": employee("n1", "New Hire")})
+        other.apply({"op": "hub_add", "hubs": [{"name": "Job Site 3", "x": 0.0, "y": 0.0, "status": {}, "note": ""}]})
+        store.load()  # The sync reload picks them up, but the board we save was built before that
+
+        local = board()
+        local["employees"][2] = employee("a2", "Ana Lopez", current_status="Sick")
+        del local["employees"][1]
+        store.update(local)
+
+        state = other.load()
+        assert [emp["key"] for emp in state["employees"]] == ["a1", "a2", "n1"]
+        assert state["employees"][1]["current_status"] == "Sick"
+        assert [job["name"] for job in state["job_sites"]] == ["Job Site 1", "Job Site 2", "Job Site 3"]
+
+        # The teammate's own first save does not delete rows it never wrote either
+        other.update({"employees": [employee("n1", "New Hire", phone="555-0142")], "job_sites": []})
+        assert [emp["key"] for emp in store.load()["employees"]] == ["a1", "a2", "n1"]
+    finally:
+        other.close()
+
+
+def test_databases_without_keys_get_them(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE employees (id INTEGER PRIMARY KEY, position INTEGER NOT NULL, text TEXT, role TEXT, phone,
+            skills TEXT, sst_card TEXT, nj_ny_certified TEXT, electrician_rank, certifications TEXT,
+            worker_status TEXT, current_status TEXT, x REAL, y REAL);
+        INSERT INTO employees (position, text) VALUES (0, 'Ana Lopez'), (1, 'Sam Roe'), (2, 'Ana Lopez');
+    """)
+    conn.close()
+
+    store = SQLiteBoardStore(path)
+    try:
+        keys = [emp["key"] for emp in store.load()["employees"]]
+        assert keys == ["Ana Lopez#0", "Sam Roe#0", "Ana Lopez#1"]
+        store.apply({"op": "delete_employee", "key": "Ana Lopez#1"})
+        assert [emp["key"] for emp in store.load()["employees"]] == keys[:2]
+    finally:
+        store.close()
+
+
+def test_save_board_gives_old_boards_keys(tmp_path):
+    state = board()
+    for emp in state["employees"]:
+        del emp["key"]
+    path = str(tmp_path / "imported.db")
+    save_board(copy.deepcopy(state), path)
+    assert load_board(path)["employees"] == assign_employee_keys(state)["employees"]
@@ -0,0 +1,91 @@
+# test_board_sync.py
+import copy
+import math
+
+from board_sync import count_changes, diff_boards, hub_renames
+
+
+def employee(key, text, job_site=None, box=None, **fields):
+    emp = {"key": key, "text": text, "role": "Electrician", "phone": "555-0100", "job_site": job_site, "box": box,
+           "x": 10.0, "y": 20.0}
+    emp.update(fields)
+    return emp
+
+
+def hub(name, note="", collapsed=False):
+    return {"name": name, "x": 50.0, "y": 50.0, "status": {"Collapsed": collapsed}, "note": note}
+
+
+def board():
+    return {"employees": [employee("a1", "Ana Lopez", "Job Site 1", "Foreman"), employee("s1", "Sam Roe"),
+                          employee("a2", "Ana Lopez")],
+            "job_sites": [hub("Job Site 1"), hub("Job Site 2")]}
+
+
+def test_same_board_has_no_diff(board_321):
+    assert diff_boards(board(), board()) is None
+    assert diff_boards(board_321, copy.deepcopy(board_321)) is None  # NaN phones compare equal
+
+
+def test_employee_changes_are_found_by_key():
+    old, new = board(), board()
+    new["employees"][2]["phone"] = "555-0199"
+    del new["employees"][0]
+    new["employees"].append(employee("n1", "New Hire"))
+    diff = diff_boards(old, new)
+    assert diff["employees_removed"] == ["a1"]
+    assert diff["employees_changed"] == [("a2", new["employees"][1])]
+    assert diff["employees_added"] == [(2, new["employees"][2])]
+    assert count_changes(diff) == 3
+
+
+def test_renaming_an_employee_is_a_change_not_a_swap():
+    old, new = board(), board()
+    new["employees"][0]["text"] = "Ana Lopez-Diaz"
+    diff = diff_boards(old, new)
+    assert diff["employees_changed"] == [("a1", new["employees"][0])]
+    assert not diff["employees_added"] and not diff["employees_removed"]
+
+
+def test_assigned_employees_ignore_their_position():
+    old, new = board(), board()
+    new["employees"][0]["x"] = 400.0  # Laid out by the hub
+    assert diff_boards(old, new) is None
+    new["employees"][1]["x"] = 400.0  # Loose, so the position is what changed
+    assert diff_boards(old, new)["employees_changed"] == [("s1", new["employees"][1])]
+
+
+def test_hub_rename_carries_its_employees():
+    old, new = board(), board()
+    new["job_sites"][0]["name"] = "Main St"
+    new["employees"][0]["job_site"] = "Main St"
+    diff = diff_boards(old, new)
+    assert diff["hub_renames"] == [("Job Site 1", "Main St")]
+    assert not diff["employees_changed"] and not diff["hubs_added"] and not diff["hubs_removed"]
+
+
+def test_hubs_notes_and_collapse():
+    old, new = board(), board()
+    new["job_sites"][1] = hub("Job Site 2", note="Crane Monday", collapsed=True)
+    new["job_sites"].append(hub("Job Site 3"))
+    diff = diff_boards(old, new)
+    assert diff["notes"] == [("Job Site 2", "Crane Monday")]
+    assert diff["collapsed"] == [("Job Site 2", True)]
+    assert diff["hubs_added"] == [(2, new["job_sites"][2])]
+    del new["job_sites"][0]
+    assert diff_boards(old, new)["hubs_removed"] == ["Job Site 1"]
+
+
+def test_boards_without_keys_match_by_name_and_occurrence():
+    old, new = board(), board()
+    for emp in old["employees"] + new["employees"]:
+        del emp["key"]
+    new["employees"][2]["phone"] = math.nan
+    diff = diff_boards(old, new)
+    assert diff["employees_changed"] == [(("Ana Lopez", 1), new["employees"][2])]
+
+
+def test_hub_renames_pair_by_slot():
+    assert hub_renames(["A", "B", "C"], ["A", "B2", "C"]) == {"B": "B2"}
+    assert hub_renames(["A", "B"], ["A"]) == {}
+    assert hub_renames(["A", "B"], ["B", "A"]) == {}
@@ -0,0 +1,67 @@
+# test_board_view.py
+import copy
+
+import pytest
+
+from board_view import BoardView, level_for_scale, upgrade_board_coordinates, with_legacy_coordinates
+from constants import DEFAULT_ZOOM_SCALE
+
+
+def board(view):
+    return {"employees": [{"text": "Ana Lopez", "x": 120.0, "y": 340.0}, {"text": "Sam Roe", "x": None, "y": None}],
+            "job_sites": [{"name": "Job Site 1", "x": 50.0, "y": 50.0}],
+            "view": view.to_state(), "scroll_x": 0.0, "scroll_y": 0.0}
+
+
+def test_view_maps_board_to_canvas_and_back():
+    view = BoardView(3, (-54.0, 12.5))
+    x, y = view.to_canvas(120.0, 340.0)
+    assert view.to_board(x, y) == pytest.approx((120.0, 340.0))
+    assert BoardView.from_state({"view": view.to_state()}).offset == view.offset
+
+
+def test_zooming_in_and_out_returns_to_the_same_view():
+    view = BoardView().zoomed(2, 400, 300).zoomed(-2, 400, 300)
+    assert view.level == 0
+    assert view.offset == (0.0, 0.0)
+
+
+def test_level_for_scale():
+    assert level_for_scale(DEFAULT_ZOOM_SCALE) == 0
+    assert level_for_scale(BoardView(-4).scale) == -4
+
+
+@pytest.mark.parametrize("view", [BoardView(), BoardView(5, (-812.25, 96.0)), BoardView(-3, (14.0, -7.5))])
+def test_legacy_coordinates_round_trip(view):
+    state = board(view)
+    legacy = with_legacy_coordinates(state)
+
+    assert legacy["scale"] == view.scale
+    assert legacy["canvas_transform"] == list(view.offset)
+    assert legacy["view"] == state["view"]
+    assert (legacy["employees"][0]["x"], legacy["employees"][0]["y"]) == view.to_canvas(120.0, 340.0)
+    assert legacy["employees"][1] == state["employees"][1]  # Not placed yet
+    assert state["employees"][0]["x"] == 120.0  # The state itself is left alone
+
+    upgraded = upgrade_board_coordinates(copy.deepcopy(legacy))
+    assert "scale" not in upgraded and "canvas_transform" not in upgraded
+    assert upgraded["view"] == state["view"]
+    for before, after in zip(state["employees"] + state["job_sites"], upgraded["employees"] + upgraded["job_sites"]):
+        assert after["x"] == pytest.approx(before["x"])
+        assert after["y"] == pytest.approx(before["y"])
+
+
+def test_upgrades_boards_saved_before_board_view():
+    scale = BoardView(2).scale
+    state = {"employees": [{"text": "Ana Lopez", "x": 120.0 * scale, "y": 340.0 * scale}],
+             "job_sites": [], "scale": scale, "canvas_transform": [-54.0, -56.0]}
+    upgrade_board_coordinates(state)
+    assert state["view"] == BoardView(2).to_state()
+    assert (state["employees"][0]["x"], state["employees"][0]["y"]) == pytest.approx((120.0, 340.0))
+
+
+def test_board_coordinates_are_left_alone():
+    state = board(BoardView(1, (3.0, 4.0)))
+    assert upgrade_board_coordinates(copy.deepcopy(state)) == state
+    legacy = with_legacy_coordinates(state)
+    assert with_legacy_coordinates(legacy) is legacy
@@ -4,6 +4,8 @@ import json
 import os
 import sys
 
+from board_sqlite import load_board, save_board
+
 # Default paths (will be overridden by the downloaded CSV path if provided)
 DEFAULT_CSV_FILE_PATH = r'C:\Users\Work\Downloads\Employee-Locations-2025-03-03-to-2025-03-03.csv'
 JSON_FILE_PATH = r'C:\Users\Work\PycharmProjects\PlanBoard\output.json'
@@ -34,8 +36,7 @@ def load_csv(csv_path):
 def load_json(json_path):
     """Load JSON data into a Python dictionary."""
     try:
-        with open(json_path, 'r') as file:
-            data = json.load(file)
+        data = load_board(json_path)  # output.json or output.db
         print(f"[INFO] JSON data loaded successfully from '{json_path}'.")
         employees_count = len(data.get('employees', []))
         job_sites_count = len(data.get('job_sites', []))
@@ -53,8 +54,7 @@ def load_json(json_path):
 def save_json(data, json_path):
     """Save the updated data back to a JSON file."""
     try:
-        with open(json_path, 'w') as file:
-            json.dump(data, file, indent=4)
+        save_board(data, json_path)
         print(f"[INFO] Updated JSON data saved to '{json_path}'.")
     except Exception as e:
         print(f"[ERROR] Error saving JSON file: {e}")
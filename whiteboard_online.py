@@ -1,15 +1,33 @@
 import tkinter as tk
 from tkinter import ttk,filedialog, messagebox
-import json
 import os
 import time
-from PIL import ImageGrab
-from draggable_box import DraggableBox
+from collections import Counter
+from datetime import date
+from draggable_box import DraggableBox, ELECTRICIAN_ROLES
 from job_site_hub import JobSiteHub
+from board_journal import BoardJournal
+from board_writer import BoardWriter
+from board_cache import BoardStateCache
+from board_sync import BoardSyncer, assign_employee_keys, diff_boards
+from board_loader import ProgressiveBoardLoader
+from board_history import BoardHistory, history_path_for
+from board_snapshot import encode_snapshot, read_snapshot, snapshot_path_for
+from board_serializer import get_serializer
+from board_sqlite import SQLiteBoardStore, is_sqlite_path
+from board_view import BoardView, hub_grid_rect, upgrade_board_coordinates, with_legacy_coordinates
+from board_fonts import FontRegistry
+from board_spatial import SnapBoxIndex
+from board_render import render_board
+from board_registry import BoardRegistry
+from board_listview import VirtualListbox
+from board_query import compile_query
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
-from constants import ROLE_COLORS, DEFAULT_EMPLOYEE_X, DEFAULT_EMPLOYEE_Y, GRID_SIZE, JOB_HUB_WIDTH, JOB_HUB_HEIGHT, \
-    VERTICAL_SPACING, MAX_COLUMNS, DEFAULT_ZOOM_SCALE
+from constants import ROLE_COLORS, DEFAULT_EMPLOYEE_X, DEFAULT_EMPLOYEE_Y, GRID_SIZE, STATUS_TEXT_COLORS, \
+    BOARD_BACKGROUND, JOURNAL_MODE, JOURNAL_COMPACT_RECORDS, JOURNAL_COMPACT_BYTES, \
+    JOURNAL_COMPACT_INTERVAL, BINARY_SNAPSHOT, HISTORY_MODE, VIEWPORT_MARGIN, SUMMARY_ZOOM_SCALE, \
+    SEARCH_HIGHLIGHT_COLOR, SEARCH_HIGHLIGHT_LIMIT
 
 
 def select_file():
@@ -31,40 +49,73 @@ def select_file():
 
 
 class JSONFileHandler(FileSystemEventHandler):
-    last_event_time = 0
-
     def __init__(self, app, shared_file_path):
         self.app = app
         self.shared_file_path = shared_file_path  # Store the file path as an instance variable
         print(f"JSONFileHandler initialized with path: {self.shared_file_path}")  # Debug statement
 
-    def on_modified(self, event):
-        current_time = time.time()
+    def is_board_file(self, path):
+        return path in self.app.board_cache.paths
 
-        # If less than 1 second has passed since the last event, ignore this one
-        if current_time - self.last_event_time < 1:
-            #self.app.reload_board()
-            print("Ignoring event to prevent rapid processing.")
-            return
+    def board_changed(self):
+        # Re-read and diff off the Tk thread; only the differences are applied (see board_sync.py)
+        self.app.board_cache.invalidate()
+        self.app.syncer.request()
 
-        # Update the last event time
-        self.last_event_time = current_time
+    def on_created(self, event):
+        if self.is_board_file(event.src_path):
+            self.board_changed()
 
-        # Process the event
-        print(f"Detected modification event: {event.src_path}")  # Debug statement
+    def on_moved(self, event):
+        # Atomic saves (ours and other clients') arrive as a rename onto the board file
+        if self.is_board_file(event.dest_path):
+            self.board_changed()
 
-        if event.src_path == self.shared_file_path:
-            print(f"{event.src_path} has been modified")  # Debug statement
-            # Schedule the reload_board to run in the main thread
-            #self.app.root.after(100, self.app.reload_board)
+    def on_modified(self, event):
+        if self.is_board_file(event.src_path):
+            print(f"Detected modification event: {event.src_path}")  # Debug statement
+            self.board_changed()
 
 
 class WhiteboardApp:
+    DETAIL_TAGS = ("draggable", "employee_circle", "snap_box")  # Hidden while hubs are drawn as summaries
+
     def __init__(self, root, shared_file_path):
         self.shared_file_path = shared_file_path  # Store the file path as an instance variable
         self.is_loading = True  # Add this line
+        self.is_filling = False  # The progressive loader is creating hubs/employees (see board_loader.py)
         self.root = root
         self.root.title("Fboards")
+        self.fonts = FontRegistry(root)  # Shared canvas fonts, resized once per zoom (see board_fonts.py)
+
+        # Saves are serialized and written by a background thread (see board_writer.py)
+        self.writer = BoardWriter(on_written=self.on_board_written)
+        self.save_pending = False  # A full snapshot is scheduled for the next idle moment
+        self.undo_pending = False  # A journaled change still has to be pushed onto the undo stack
+        self.serializer = get_serializer()  # BOARD_FORMAT from constants.py (see board_serializer.py)
+
+        # A .db board lives in SQLite and is updated row by row (see board_sqlite.py)
+        self.store = SQLiteBoardStore(shared_file_path) if is_sqlite_path(shared_file_path) else None
+
+        # Append-only change journal next to the shared file (see board_journal.py)
+        self.journal = BoardJournal(shared_file_path, self.writer) if JOURNAL_MODE and not self.store else None
+        self.journaled_hubs = {}  # Employee canvas id -> hub name last written to the journal
+
+        # Optional compact binary copy of the board (see board_snapshot.py)
+        self.binary_snapshot_path = snapshot_path_for(shared_file_path) \
+            if BINARY_SNAPSHOT and not self.store else None
+
+        # Parsed copy of the shared file used by tooltips, sticky notes and reloads (see board_cache.py)
+        extra_paths = [path for path in (self.journal and self.journal.path, self.binary_snapshot_path) if path]
+        if self.store:
+            extra_paths.append(f"{shared_file_path}-wal")  # Committed changes land in the WAL first
+        self.board_cache = BoardStateCache(shared_file_path, self.read_board_file, extra_paths)
+
+        # Deduplicated history of saved boards, queried with board_history.py
+        self.history = BoardHistory(history_path_for(shared_file_path)) if HISTORY_MODE else None
+
+        # Teammates' changes picked up by the file watcher are diffed off the Tk thread (see board_sync.py)
+        self.syncer = BoardSyncer(self.board_cache, lambda diff: self.root.after(0, self.apply_board_diff, diff))
 
         self.start_file_watcher()
 
@@ -86,24 +137,50 @@ class WhiteboardApp:
         self.side_frame = ttk.Frame(self.main_frame, width=200, padding="10 10 10 10", relief='solid', borderwidth=1)
         self.side_frame.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.canvas = tk.Canvas(self.canvas_frame, scrollregion=(0, 0, 2000, 2000), background='#D3D3D3')
+        self.canvas = tk.Canvas(self.canvas_frame, scrollregion=(0, 0, 2000, 2000), background=BOARD_BACKGROUND)
         self.canvas.hub_list = []
         self.scrollbar_y = ttk.Scrollbar(self.canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
         self.scrollbar_x = ttk.Scrollbar(self.canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
-        self.canvas.configure(yscrollcommand=self.scrollbar_y.set, xscrollcommand=self.scrollbar_x.set)
+        self.canvas.configure(yscrollcommand=self.on_yview_changed, xscrollcommand=self.on_xview_changed)
 
         self.scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
         self.scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         self.employee_boxes = []
-
-        self.unassigned_listbox = tk.Listbox(self.side_frame)
+        # Lookups by canvas id and by name; kept in step with employee_boxes and hub_list (see board_registry.py)
+        self.registry = BoardRegistry()
+
+        # Only hubs and employees in view are laid out, rescaled and raised; the rest catch up when scrolled to
+        self.stale_hubs = set()
+        self.stale_boxes = set()
+        self.view_refresh_pending = False
+        # Bumped whenever the whole canvas is transformed; hubs and employees laid out before that are dirty
+        self.layout_generation = 0
+        # Redraw, rescale and scroll-region requests made before the next idle moment run as one pass
+        self.redraw_requests = set()
+        self.redraw_request_count = 0
+        self.redraw_after_id = None
+        # Below SUMMARY_ZOOM_SCALE each hub is one summary text and employee items are hidden
+        self.summary_mode = False
+        self.hub_summaries = {}  # Hub -> (canvas text id, text shown)
+        # Snap boxes under the pointer while dragging (see board_spatial.py), rebuilt after hub layout changes
+        self.layout_version = 0
+        self.snap_index = SnapBoxIndex()
+        self.highlighted_snap_box = None
+
+        # Only the rows in view are handed to Tk; updates keep the selection and scroll position
+        self.unassigned_listbox = VirtualListbox(self.side_frame, label=lambda box: box.text)
         self.unassigned_listbox.pack(fill=tk.BOTH, expand=True)
         self.unassigned_listbox.bind('<<ListboxSelect>>', self.on_listbox_select)
-
-        # Search box
-        tk.Label(self.side_frame, text="Search by Name:").pack()
+        self.listbox_refresh_pending = False
+        self.search_highlights = []  # Boxes drawn in SEARCH_HIGHLIGHT_COLOR for the current search text
+
+        # Search box (names, phone numbers, certifications and skills; typos are forgiven, see board_search.py)
+        # Terms such as skill:Mechanic status:!Sick site:"Job Site 4" narrow it down (see board_query.py)
+        tk.Label(self.side_frame, text="Search by Name, Phone or Certificate:").pack()
+        tk.Label(self.side_frame, text='Filters: role: cert: skill: status: site: e.g. status:!Sick',
+                 font=("Helvetica", 8), fg="gray30").pack()
         self.search_entry = tk.Entry(self.side_frame)
         self.search_entry.pack(fill=tk.X, padx=5, pady=5)
         self.search_entry.bind("<KeyRelease>", self.update_employee_listbox)
@@ -111,7 +188,7 @@ class WhiteboardApp:
         # Role filter
         tk.Label(self.side_frame, text="Filter by Certificate:").pack()
         self.role_var = tk.StringVar(value="All")
-        roles = ["PM", "GM", "Foreman", "Super", "Electrician", "Fire Alarm Electrician", "Roughing Electrician"]
+        roles = ["PM", "GM", "Foreman", "Super", *ELECTRICIAN_ROLES]
         certs = ["All", "SST", "Journeyman", "Contractor", "OSHA", "NJ Certified", "NY Certified", "Both"]
         self.role_filter = ttk.OptionMenu(self.side_frame, self.role_var, "All", *certs)
         self.role_filter.pack(fill=tk.X, padx=5, pady=5)
@@ -150,8 +227,7 @@ class WhiteboardApp:
         self.MAX_HISTORY = 20  # Maximum number of states to keep
 
 
-        self.scale = 1.0  # Initial scale
-        self.canvas_transform = (0, 0)  # Initial canvas transformation (x, y)
+        self.view = BoardView()  # Board -> canvas coordinates; the zoom lives here (see board_view.py)
         self.scroll_x = 0  # Initial scroll position x
         self.scroll_y = 0  # Initial scroll position y
         self.saved_scroll_region = None  # To store the scroll region
@@ -160,7 +236,7 @@ class WhiteboardApp:
         self.root.bind('<FocusIn>', self.on_focus_in)
         self.root.bind('<FocusOut>', self.on_focus_out)  # Bind focus out event
 
-        self.canvas.bind("<Configure>", self.update_scroll_region)
+        self.canvas.bind("<Configure>", lambda event: self.request_redraw("scroll_region"))
         self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)
         self.canvas.bind("<Shift-MouseWheel>", self.on_shift_mouse_wheel)
         self.canvas.bind("<Control-MouseWheel>", self.on_zoom)
@@ -171,6 +247,7 @@ class WhiteboardApp:
 
         # Placeholder for the loading screen
         self.loading_screen = None
+        self.loader = None  # Fills in the rest of the board while it loads (see board_loader.py)
 
         self.create_controls()
         self.load_state()
@@ -179,9 +256,8 @@ class WhiteboardApp:
         self.apply_status_colors()
         #self.create_sticky_notes() #already generated in load_state()
 
-        # Apply the default zoom scale
-        self.scale = DEFAULT_ZOOM_SCALE
-        self.apply_zoom()
+        if self.journal:
+            self.root.after(JOURNAL_COMPACT_INTERVAL, self.scheduled_journal_compaction)
 
     def rename_hub(self, hub):
         """Rename the given JobSiteHub instance."""
@@ -207,15 +283,20 @@ class WhiteboardApp:
         """Save the new name and address for the given JobSiteHub instance."""
         new_name = self.new_name_entry.get().strip()
         new_address = self.new_address_entry.get().strip()
+        old_name = hub.text
 
         if new_name:
             hub.text = new_name
+            self.registry.rename_hub(hub, old_name)
             self.canvas.itemconfig(hub.text_id, text=new_name)  # Update the hub's displayed name
         if new_address:
             hub.address = new_address
 
         self.rename_popup.destroy()
-        self.save_state()  # Assuming you want to save the new state immediately
+        for employee_id, hub_name in self.journaled_hubs.items():
+            if hub_name == old_name:
+                self.journaled_hubs[employee_id] = hub.text
+        self.save_state("hub_rename", hubs=[hub], old=old_name, new=hub.text)
 
     def set_dialog_position(self, dialog, x_offset=100, y_offset=100):
         """
@@ -234,12 +315,11 @@ class WhiteboardApp:
         # Read the note from the JSON data
         note_text = None
         try:
-            with open(self.shared_file_path, 'r') as f:
-                data = json.load(f)
-                for job in data['job_sites']:
-                    if job['name'] == job_name:
-                        note_text = job.get('note')
-                        break
+            data = self.board_cache.get()
+            for job in data['job_sites']:
+                if job['name'] == job_name:
+                    note_text = job.get('note')
+                    break
         except Exception as e:
             print(f"Error reading JSON file for tooltip: {e}")
 
@@ -279,7 +359,6 @@ class WhiteboardApp:
         self.note_text_entry.pack()
 
         tk.Button(self.note_popup, text="Save", command=lambda: self.save_new_note_from_popup(job_name)).pack()
-        self.save_state()
 
 
     def edit_or_delete_note_popup(self, job_name):
@@ -298,7 +377,6 @@ class WhiteboardApp:
 
         tk.Button(self.note_popup, text="Save", command=lambda: self.save_new_note_from_popup(job_name)).pack()
         tk.Button(self.note_popup, text="Delete", command=lambda: self.delete_note_from_popup(job_name)).pack()
-        self.save_state()
 
     def save_new_note_from_popup(self, job_name):
         note_text = self.note_text_entry.get("1.0", tk.END).strip()
@@ -308,7 +386,7 @@ class WhiteboardApp:
             # Update the note icon to yellow
             self.canvas.itemconfig(self.job_notes[job_name]["id"], fill="yellow")
         self.note_popup.destroy()
-        self.save_state()
+        self.save_state("note", name=job_name, note=self.job_notes.get(job_name, {}).get("note", ""))
 
     def delete_note_from_popup(self, job_name):
         if job_name in self.job_notes:
@@ -320,70 +398,68 @@ class WhiteboardApp:
             # Remove the note from the job_notes dictionary
             del self.job_notes[job_name]
 
-            self.save_state()
+            self.save_state("note", name=job_name, note="")
             self.reload_board()
         else:
             print(f"Job name '{job_name}' not found in job_notes.")
         self.note_popup.destroy()
 
     def create_sticky_notes(self):
-        square_size = 30  # Define the size of the square in pixels
-
-        # Load the JSON data
-        with open(self.shared_file_path, 'r') as f:
-            state = json.load(f)
+        # Parsed board data (already cached by load_state)
+        state = self.board_cache.get()
 
+        # Note for each job site from the JSON data (the first entry wins if a name repeats)
+        notes = {}
+        for site in state["job_sites"]:
+            notes.setdefault(site["name"], site.get("note", ""))
         for hub in self.canvas.hub_list:
-            job_name = hub.text
-            job_coords = self.canvas.coords(hub.id)
-            if job_coords:
-                x, y = job_coords[0], job_coords[1]
-
-                # Get the note for this job site from the JSON data
-                job_site_data = next((site for site in state["job_sites"] if site["name"] == job_name), None)
-                note_text = job_site_data.get("note", "") if job_site_data else ""
-
-                # Check if the job site has a note
-                if note_text:
-                    # Create a small square sticky note icon with yellow fill
-                    note_icon = self.canvas.create_rectangle(
-                        x + 10, y - square_size / 2,  # Top-left corner
-                        x + 10 + square_size, y + square_size / 2,  # Bottom-right corner
-                        fill="yellow"
-                    )
-                else:
-                    # Create the same square without yellow fill
-                    note_icon = self.canvas.create_rectangle(
-                        x + 10, y - square_size / 2,  # Top-left corner
-                        x + 10 + square_size, y + square_size / 2,  # Bottom-right corner
-                        outline="black",  # Set outline color if needed
-                        fill=""  # No fill color
-                    )
+            self.create_sticky_note(hub, notes.get(hub.text, ""))
+
+    def create_sticky_note(self, hub, note_text):
+        square_size = 30  # Define the size of the square in pixels
+
+        job_name = hub.text
+        job_coords = self.canvas.coords(hub.id)
+        if job_coords:
+            x, y = job_coords[0], job_coords[1]
+
+            # Check if the job site has a note
+            if note_text:
+                # Create a small square sticky note icon with yellow fill
+                note_icon = self.canvas.create_rectangle(
+                    x + 10, y - square_size / 2,  # Top-left corner
+                    x + 10 + square_size, y + square_size / 2,  # Bottom-right corner
+                    fill="yellow", tags=hub.tag
+                )
+            else:
+                # Create the same square without yellow fill
+                note_icon = self.canvas.create_rectangle(
+                    x + 10, y - square_size / 2,  # Top-left corner
+                    x + 10 + square_size, y + square_size / 2,  # Bottom-right corner
+                    outline="black",  # Set outline color if needed
+                    fill="", tags=hub.tag  # No fill color
+                )
 
-                # Bind click event to handle note editing
-                self.canvas.tag_bind(note_icon, "<Button-1>", lambda event, name=job_name: self.handle_note_click(name))
+            # Bind click event to handle note editing
+            self.canvas.tag_bind(note_icon, "<Button-1>", lambda event, name=job_name: self.handle_note_click(name))
 
-                # Bind hover event to show tooltip
-                if note_text:
-                    self.canvas.tag_bind(note_icon, "<Enter>",
-                                         lambda event, name=job_name: self.show_tooltip(event, name))
+            # Bind hover event to show tooltip
+            if note_text:
+                self.canvas.tag_bind(note_icon, "<Enter>",
+                                     lambda event, name=job_name: self.show_tooltip(event, name))
 
-                    self.canvas.tag_bind(note_icon, "<Leave>", self.hide_tooltip)
+                self.canvas.tag_bind(note_icon, "<Leave>", self.hide_tooltip)
 
-                # Store the note's ID
-                self.job_notes[job_name] = {"id": note_icon, "note": note_text}
+            # Store the note's ID
+            self.job_notes[job_name] = {"id": note_icon, "note": note_text}
 
     def apply_status_colors(self):
         for box in self.employee_boxes:
             self.update_box_color_based_on_status(box)
 
     def update_box_color_based_on_status(self, box):
-        if box.current_status == "Sick":
-            self.canvas.itemconfig(box.id, fill="#006400")  # Set text color to yellow for Sick status
-        elif box.current_status == "Vacation":
-            self.canvas.itemconfig(box.id, fill="blue")  # Set text color to blue for Vacation status
-        else:  # On-site or any other status
-            self.canvas.itemconfig(box.id, fill="black")  # Reset text color to black (default)
+        # Dark green for Sick, blue for Vacation, black for On-site or any other status
+        self.canvas.itemconfig(box.id, fill=STATUS_TEXT_COLORS.get(box.current_status, "black"))
 
     def reset_box_color(self, box, color):
         self.canvas.itemconfig(box.id, fill=color)
@@ -393,8 +469,7 @@ class WhiteboardApp:
         """Force employees back to their correct positions based on the job site hub coordinates and their associations in the JSON file."""
         # Load the JSON data
         try:
-            with open(self.shared_file_path, 'r') as f:
-                data = json.load(f)
+            data = self.board_cache.get()
         except Exception as e:
             print(f"Error reading JSON file: {e}")
             return
@@ -442,15 +517,16 @@ class WhiteboardApp:
 
     def find_job_site_hub_by_name(self, name):
         """Find and return the JobSiteHub object based on the job site name."""
-        for hub in self.canvas.hub_list:
-            if hub.text == name:
-                return hub
-        return None
+        return self.registry.hub_named(name)
 
-    def apply_zoom(self):
-        """Apply the current zoom scale to all canvas elements."""
-        self.canvas.scale("all", 0, 0, self.scale, self.scale)
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    @property
+    def scale(self):
+        """Current zoom, the canvas size of one board unit."""
+        return self.view.scale
+
+    def employee_canvas_position(self, emp):
+        """Canvas position for a saved employee record (saved x/y are board coordinates)."""
+        return self.view.to_canvas(emp.get("x", self.default_x), emp.get("y", self.default_y))
 
     def update_text_positions(self, hub, x1, y1, x2, y2):
         self.canvas.coords(hub.text_id, (x1 + x2) / 2, y1 - 10)
@@ -458,60 +534,36 @@ class WhiteboardApp:
         self.canvas.coords(hub.collapse_button_id, x1 + 15, y2 - 15)
 
     def update_employee_listbox(self, event=None):
-        self.unassigned_listbox.delete(0, tk.END)
-        search_text = self.search_entry.get().lower()
-        cert_filter = self.role_var.get()  # Used for filtering by certificate
-        skills_filter = self.skills_filter_var.get()
-        show_all = self.show_all_var.get()
-
-        for box in self.employee_boxes:
-            print(
-                f"Checking box: {box.text}, Role: {box.role}, Skills: {box.skills}, Certifications: {box.certifications}, SST Card: {box.sst_card}, Worker Status: {box.worker_status}, NJ/NY Certified: {box.nj_ny_certified}"
-            )  # Debug output
-
-            # Start with the assumption that the employee should be shown
-            should_show = show_all or not box.current_snap_box
-
-            # Apply search text filtering
-            if search_text and search_text not in box.text.lower():
-                should_show = False
-
-            # Apply certificate filtering
-            if cert_filter != "All":
-                if cert_filter == "SST":
-                    if box.sst_card != "Yes":
-                        should_show = False
-                elif cert_filter == "Journeyman":
-                    if box.worker_status != "Journeyman":
-                        should_show = False
-                elif cert_filter == "Contractor":
-                    if box.worker_status != "Contractor":
-                        should_show = False
-                elif cert_filter == "OSHA":
-                    if "OSHA Card" not in box.certifications:
-                        should_show = False
-                elif cert_filter == "NJ Certified":
-                    if box.nj_ny_certified != "NJ":
-                        should_show = False
-                elif cert_filter == "NY Certified":
-                    if box.nj_ny_certified != "NY":
-                        should_show = False
-                elif cert_filter == "Both":
-                    if box.nj_ny_certified not in ["NY", "NJ"]:
-                        should_show = False
-                else:
-                    # For other certifications, check if cert_filter is in box.certifications
-                    if cert_filter not in box.certifications:
-                        should_show = False
-
-            # Apply skills filtering
-            if skills_filter != "All":
-                if skills_filter not in box.skills:
-                    should_show = False
-
-            # If all conditions are met, add to the listbox
-            if should_show:
-                self.unassigned_listbox.insert(tk.END, box.text)
+        try:
+            query = compile_query(self.search_entry.get())  # Parsed once per distinct text
+        except ValueError as e:
+            print(f"Search query not applied: {e}")
+            query = None
+        search_text = query.text if query else self.search_entry.get().strip()
+        # site: and assigned: terms are about assigned employees, so they look past "Show All Employees"
+        board_wide = query and any(field in ("site", "assigned") for field, _, _ in query.clauses)
+
+        # Set lookups in the search index (see board_search.py) rather than testing every box
+        matches = self.registry.search.search(
+            search_text,
+            cert=self.role_var.get(),  # Used for filtering by certificate
+            skill=self.skills_filter_var.get(),
+            unassigned_only=not (self.show_all_var.get() or board_wide),
+        )
+        if query and query.clauses:
+            matches = query.filter(matches, text=False)  # The search text was already matched above
+        self.unassigned_listbox.set_items(matches)  # Best match first while there is search text
+        searching = search_text or (query and query.clauses)
+        self.highlight_search_matches(matches[:SEARCH_HIGHLIGHT_LIMIT] if searching else [])
+
+    def highlight_search_matches(self, boxes):
+        """Draw the names of `boxes` in SEARCH_HIGHLIGHT_COLOR, putting the previous matches back to their status color."""
+        for box in self.search_highlights:
+            if self.registry.box(box.id) is box:  # Skip boxes deleted since
+                self.update_box_color_based_on_status(box)
+        self.search_highlights = list(boxes)
+        for box in self.search_highlights:
+            self.canvas.itemconfig(box.id, fill=SEARCH_HIGHLIGHT_COLOR)
 
     def start_file_watcher(self):
         event_handler = JSONFileHandler(self, self.shared_file_path)  # Pass the file path here
@@ -523,6 +575,21 @@ class WhiteboardApp:
         print(f"Watching file: {self.shared_file_path}")
 
     def on_closing(self):
+        self.syncer.stop()
+
+        # Fold any pending journal records into the shared file before leaving
+        if self.journal and self.journal.record_count:
+            self.compact_journal()
+
+        # Write the last snapshot and wait for the background writer to finish
+        self.write_snapshot()
+        if not self.writer.close():
+            print("Timed out waiting for the board to be written.")
+        if self.store:
+            self.store.close()
+        if self.history:
+            self.history.close()
+
         # Ensure the observer is stopped when the application is closed
         if hasattr(self, 'observer') and self.observer:
             self.observer.stop()
@@ -540,56 +607,290 @@ class WhiteboardApp:
         print("Canvas is being redrawn")
         self.canvas.update_idletasks()
 
-        max_columns = MAX_COLUMNS
-        for i, hub in enumerate(self.canvas.hub_list):
-            x = 50 + (JOB_HUB_WIDTH + 40) * (i % max_columns) * self.scale
-            y = 50 + (JOB_HUB_HEIGHT + VERTICAL_SPACING) * (i // max_columns) * self.scale
-            self.canvas.coords(hub.id, x, y, x + JOB_HUB_WIDTH * self.scale, y + JOB_HUB_HEIGHT * self.scale)
-            hub.update_positions(self.scale)
-            self.update_text_positions(hub, x, y, x + JOB_HUB_WIDTH * self.scale, y + JOB_HUB_HEIGHT * self.scale)
-
-        for box in self.employee_boxes:
-            if box.current_snap_box:
-                box.snap_to_box()  # Ensure boxes snap to their correct locations
-        self.bring_employee_names_to_front()
+        # While the board is still loading, hubs go to their slot from the file rather than their list position
+        slots = self.loader.hub_order if self.loader else range(len(self.canvas.hub_list))
+        # Every hub gets its rectangle (that is what the scroll region and hit tests use), but only
+        # hubs in view get their role boxes, labels and employees moved along with it
+        view = self.visible_region()
+        visible = []
+        unchanged = shifted = 0
+        for i, hub in zip(slots, self.canvas.hub_list):
+            rect = self.hub_layout_rect(i)
+            if hub.layout_rect == rect and not self.hub_is_dirty(hub):
+                unchanged += 1  # Same slot, same scale, nothing to do
+                continue
+            if hub.layout_rect and not self.hub_is_dirty(hub):
+                # Same scale, new slot (a hub before it was added or removed): move the whole group at once
+                self.canvas.move(hub.tag, rect[0] - hub.layout_rect[0], rect[1] - hub.layout_rect[1])
+                hub.layout_rect = rect
+                self.layout_changed()
+                shifted += 1
+                continue
+            self.canvas.coords(hub.id, *rect)
+            hub.layout_rect = rect
+            if self.rect_is_visible(rect, view) and not self.summary_mode:
+                visible.append(hub)
+            else:
+                hub.laid_out_at = None
+                self.stale_hubs.add(hub)
+
+        for hub in visible:
+            self.refresh_hub(hub)
+        moved = len(self.canvas.hub_list) - unchanged - shifted
+        print(f"Redraw: {len(visible)} hubs laid out, {shifted} moved as a group, "
+              f"{moved - len(visible)} deferred off-screen, {unchanged} unchanged")
+        if moved:
+            self.bring_employee_names_to_front()
         self.update_scroll_region()
         self.apply_scale()
 
+    def hub_layout_rect(self, i):
+        """Canvas rectangle of the i-th job site hub in the grid layout."""
+        return self.view.rect_to_canvas(*hub_grid_rect(i))
+
+    def layout_hub(self, hub, i):
+        x1, y1, x2, y2 = self.hub_layout_rect(i)
+        self.canvas.coords(hub.id, x1, y1, x2, y2)
+        hub.layout_rect = (x1, y1, x2, y2)
+        hub.update_positions(self.scale)
+        self.update_text_positions(hub, x1, y1, x2, y2)
+
+    def scale_employee_box(self, box):
+        # The label font is the shared "employee" font, resized by apply_scale for all boxes at once
+        circle_radius = box.circle_radius * self.scale
+        x1, y1, x2, y2 = self.canvas.coords(box.circle_id)
+        new_x2 = x1 + circle_radius
+        new_y2 = y1 + circle_radius
+        self.canvas.coords(box.circle_id, x1, y1, new_x2, new_y2)
+        box.scaled_at = self.box_scale_key()
+
     def apply_scale(self):
+        """Rescale employees and lay out hubs whose scale or geometry changed since the last pass."""
+        fonts = self.fonts.set_scale(self.scale)
+        boxes = [box for box in self.employee_boxes if self.box_is_dirty(box)]
+        hubs = [hub for hub in self.canvas.hub_list if self.hub_is_dirty(hub)]
+        if not boxes and not hubs:
+            print(f"Scale pass: nothing changed ({fonts} fonts resized)")
+            return
+        if self.summary_mode:
+            # Employees are hidden; they are rescaled once the board is zoomed back in
+            self.stale_boxes.update(boxes)
+            self.stale_hubs.update(hubs)
+            print(f"Scale pass: summary view, {len(boxes)} employees and {len(hubs)} hubs left for later")
+            return
+        on_screen = self.visible_items()
 
-        for box in self.employee_boxes:
-            current_font_size = box.font[1]
-            new_font_size = int(current_font_size * self.scale)
-            new_font_size = max(8, new_font_size)
-            box.font = (box.font[0], new_font_size, box.font[2])
-            self.canvas.itemconfig(box.id, font=box.font)
+        scaled = 0
+        for box in boxes:
+            if box.id in on_screen:
+                self.scale_employee_box(box)
+                scaled += 1
+            else:
+                self.stale_boxes.add(box)
+
+        laid_out = 0
+        for hub in hubs:
+            if hub.id in on_screen:
+                hub.update_positions(self.scale)
+                hub.laid_out_at = self.hub_layout_key(hub)
+                self.place_sticky_note(hub)
+                laid_out += 1
+            else:
+                self.stale_hubs.add(hub)
 
-            circle_radius = box.circle_radius * self.scale
-            x1, y1, x2, y2 = self.canvas.coords(box.circle_id)
-            new_x2 = x1 + circle_radius
-            new_y2 = y1 + circle_radius
-            self.canvas.coords(box.circle_id, x1, y1, new_x2, new_y2)
+        print(f"Scale pass: {fonts} fonts resized, {scaled}/{len(self.employee_boxes)} employees rescaled, "
+              f"{laid_out}/{len(self.canvas.hub_list)} hubs laid out, "
+              f"{len(boxes) - scaled + len(hubs) - laid_out} deferred off-screen")
 
-        for hub in self.canvas.hub_list:
-            hub.update_positions(self.scale)
+    def box_scale_key(self):
+        return self.layout_generation, self.scale
+
+    def hub_layout_key(self, hub):
+        return self.layout_generation, self.scale, hub.collapsed
+
+    def box_is_dirty(self, box):
+        return box.scaled_at != self.box_scale_key()
+
+    def hub_is_dirty(self, hub):
+        return hub.laid_out_at != self.hub_layout_key(hub)
 
+    def invalidate_layout(self):
+        """Mark every hub and employee dirty, e.g. after the whole canvas was scaled."""
+        self.layout_generation += 1
+        self.layout_changed()
+        for hub in self.canvas.hub_list:
+            hub.layout_rect = None  # Its grid rectangle was scaled along with everything else
 
+    def place_sticky_note(self, hub):
         # Apply fixed-size positioning to sticky notes
         square_size = 10  # Fixed size for the square
         offset_x = -20  # Horizontal offset to the right
         offset_y = -20  # Vertical offset (optional)
 
-        for job_name, note_data in self.job_notes.items():
-            hub = next((h for h in self.canvas.hub_list if h.text == job_name), None)
-            if hub and note_data["id"]:
-                job_coords = self.canvas.coords(hub.id)
-                if job_coords:
-                    x1, y1, x2, y2 = job_coords  # Right edge of the hub
-                    self.canvas.coords(
-                        note_data["id"],
-                        x2 + offset_x, y1 + offset_y - square_size / 2,  # Right edge + offset
-                        x2 + offset_x + square_size, y1 + offset_y + square_size / 2  # Bottom-right corner
-                    )
+        note_data = self.job_notes.get(hub.text)
+        if note_data and note_data["id"]:
+            job_coords = self.canvas.coords(hub.id)
+            if job_coords:
+                x1, y1, x2, y2 = job_coords  # Right edge of the hub
+                self.canvas.coords(
+                    note_data["id"],
+                    x2 + offset_x, y1 + offset_y - square_size / 2,  # Right edge + offset
+                    x2 + offset_x + square_size, y1 + offset_y + square_size / 2  # Bottom-right corner
+                )
+
+    # -----------------------------------------------------------
+    # Viewport culling
+    # -----------------------------------------------------------
+    def visible_region(self):
+        """Canvas coordinates of the part of the board in the window, plus VIEWPORT_MARGIN on each side."""
+        x, y = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        return (x - VIEWPORT_MARGIN, y - VIEWPORT_MARGIN,
+                x + self.canvas.winfo_width() + VIEWPORT_MARGIN, y + self.canvas.winfo_height() + VIEWPORT_MARGIN)
+
+    def rect_is_visible(self, rect, view):
+        x1, y1, x2, y2 = rect
+        vx1, vy1, vx2, vy2 = view
+        return x1 < vx2 and x2 > vx1 and y1 < vy2 and y2 > vy1
+
+    def visible_items(self):
+        # One query to Tk's own spatial lookup instead of a coords() call per hub or employee
+        return set(self.canvas.find_overlapping(*self.visible_region()))
+
+    def refresh_hub(self, hub):
+        """Lay out a hub's role boxes, labels, note and employees around its current rectangle."""
+        self.stale_hubs.discard(hub)
+        x1, y1, x2, y2 = self.canvas.coords(hub.id)
+        hub.update_positions(self.scale)
+        self.update_text_positions(hub, x1, y1, x2, y2)
+        self.place_sticky_note(hub)
+        for box in hub.occupant_boxes():
+            box.snap_to_box()  # Ensure boxes snap to their correct locations
+        hub.update_all_positions()
+        hub.laid_out_at = self.hub_layout_key(hub)
+
+    def refresh_box(self, box):
+        self.stale_boxes.discard(box)
+        if self.box_is_dirty(box):
+            self.scale_employee_box(box)
+        self.canvas.tag_raise(box.id)
+        self.canvas.tag_raise(box.circle_id)
+
+    def on_yview_changed(self, first, last):
+        self.scrollbar_y.set(first, last)
+        self.schedule_view_refresh()
+
+    def on_xview_changed(self, first, last):
+        self.scrollbar_x.set(first, last)
+        self.schedule_view_refresh()
+
+    def schedule_view_refresh(self):
+        # Scroll commands fire for every scroll step; catch up once the view has settled
+        if (self.stale_hubs or self.stale_boxes) and not self.view_refresh_pending:
+            self.view_refresh_pending = True
+            self.root.after_idle(self.refresh_view)
+
+    def refresh_view(self):
+        """Bring hubs and employees that scrolled into view up to date."""
+        self.view_refresh_pending = False
+        if self.summary_mode:
+            return
+        on_screen = self.visible_items()
+        hubs = [hub for hub in self.stale_hubs if hub.id in on_screen]
+        for hub in hubs:
+            self.refresh_hub(hub)
+        if hubs:
+            # Employees follow their hub, so look again for the ones that just arrived
+            on_screen = self.visible_items()
+        boxes = [box for box in self.stale_boxes if box.id in on_screen]
+        for box in boxes:
+            self.refresh_box(box)
+        if hubs or boxes:
+            print(f"Caught up {len(hubs)} hubs and {len(boxes)} employees scrolled into view")
+
+    # -----------------------------------------------------------
+    # Drag hit-testing
+    # -----------------------------------------------------------
+    def layout_changed(self):
+        """Some hub's snap boxes moved; the snap index is rebuilt on the next query."""
+        self.layout_version += 1
+
+    def snap_boxes_at(self, x, y):
+        """(hub, box type, coords, canvas item) for every snap box containing canvas point (x, y)."""
+        if self.snap_index.version != self.layout_version:
+            start = time.perf_counter()
+            self.snap_index.rebuild(self.canvas, self.canvas.hub_list, self.layout_version)
+            print(f"Snap index rebuilt: {self.snap_index.box_count} boxes in "
+                  f"{(time.perf_counter() - start) * 1000:.1f} ms")
+        return self.snap_index.find_all(x, y)
+
+    def highlight_snap_box(self, item):
+        """Highlight snap box `item` (or none) while dragging, recoloring only what changed."""
+        if item == self.highlighted_snap_box:
+            return
+        if self.highlighted_snap_box:
+            self.canvas.itemconfig(self.highlighted_snap_box, fill="white")
+        if item:
+            self.canvas.itemconfig(item, fill="lightgreen")
+        self.highlighted_snap_box = item
+
+    # -----------------------------------------------------------
+    # Level of detail
+    # -----------------------------------------------------------
+    def update_detail_level(self):
+        """Switch between full detail and hub summaries when the zoom crosses SUMMARY_ZOOM_SCALE."""
+        summary = self.scale < SUMMARY_ZOOM_SCALE
+        if summary != self.summary_mode:
+            self.summary_mode = summary
+            print(f"Zoom {self.scale:.3f}: showing {'hub summaries' if summary else 'full detail'}")
+            if not summary:
+                self.show_details()
+        if self.summary_mode:
+            # Cheap to repeat: items created or shown since the last pass are hidden again
+            for tag in self.DETAIL_TAGS:
+                self.canvas.itemconfig(tag, state="hidden")
+
+    def show_details(self):
+        self.canvas.delete("hub_summary")
+        self.hub_summaries.clear()
+        for tag in self.DETAIL_TAGS:
+            self.canvas.itemconfig(tag, state="normal")
+        # Nothing was laid out while summarized; hubs in view catch up now, the rest when scrolled to
+        self.stale_hubs.update(self.canvas.hub_list)
+        self.stale_boxes.update(self.employee_boxes)
+        self.refresh_view()
+
+    def update_hub_summaries(self, relayout=False):
+        """Create or update one summary text per hub; only hubs whose headcounts changed are touched."""
+        hubs = set(self.canvas.hub_list)
+        for hub in [hub for hub in self.hub_summaries if hub not in hubs]:
+            self.canvas.delete(self.hub_summaries.pop(hub)[0])
+
+        for hub in self.canvas.hub_list:
+            text = self.hub_summary_text(hub.occupant_boxes())
+            item, shown = self.hub_summaries.get(hub, (None, None))
+            if item is None or relayout:
+                x1, y1, x2, y2 = self.canvas.coords(hub.id)
+                if item is None:
+                    item = self.canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=text, width=x2 - x1,
+                                                   font=self.fonts.get("hub_summary"), justify=tk.CENTER,
+                                                   tags=("hub_summary", hub.tag))
+                    shown = text
+                else:
+                    self.canvas.coords(item, (x1 + x2) / 2, (y1 + y2) / 2)
+            if text != shown:
+                self.canvas.itemconfig(item, text=text)
+            self.hub_summaries[hub] = (item, text)
+
+    def hub_summary_text(self, occupants):
+        roles = Counter(box.current_snap_box["box"] for box in occupants)
+        skills = Counter(skill for box in occupants if isinstance(box.skills, list) for skill in box.skills)
+        lines = [
+            f"PM {roles['PM']}  GM {roles['GM']}",
+            f"Foreman {roles['Foreman']}  Super {roles['Super']}",
+            f"Electricians {roles['Electrician'] + roles['Fire Alarm']}",
+        ]
+        lines += [f"{skill} {count}" for skill, count in skills.most_common(3)]
+        return "\n".join(lines)
 
     def on_focus_in(self, event):
         # Debug print statements
@@ -597,10 +898,7 @@ class WhiteboardApp:
         print(f"Scroll region before focus in: {self.canvas.cget('scrollregion')}")
 
         # Apply the current scale to all elements
-        self.apply_scale()
-
-        # Debug print statements
-        print(f"Scroll region after focus in: {self.canvas.cget('scrollregion')}")
+        self.request_redraw("scale")
 
     def on_focus_out(self, event):
         # Save the current scroll positions
@@ -613,30 +911,28 @@ class WhiteboardApp:
             f"Focus out event: scroll_x={self.scroll_x}, scroll_y={self.scroll_y}, scrollregion={self.saved_scroll_region}")
 
     def on_zoom(self, event):
-        scale_factor = 1.1 if event.delta > 0 else 0.9
-        self.scale *= scale_factor
-
         # Get the current mouse position
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
 
-        # Scale all objects on the canvas
+        # One ZOOM_STEP in or out about the mouse; the board point under it stays put
+        old_scale = self.scale
+        self.view = self.view.zoomed(1 if event.delta > 0 else -1, x, y)
+        scale_factor = self.scale / old_scale
+
+        # Scale all objects on the canvas (one call, done inside Tk); positions are then re-derived
+        # from board coordinates for whatever is in view by the redraw pass
         self.canvas.scale("all", x, y, scale_factor, scale_factor)
+        self.invalidate_layout()
 
-        # Save the current canvas transformation
-        self.canvas_transform = self.canvas.canvasx(0), self.canvas.canvasy(0)
         self.scroll_x = self.canvas.xview()[0]
         self.scroll_y = self.canvas.yview()[0]
 
-        # Apply the current scale to all elements
-        self.apply_scale()
-
-        # Update the scroll region to accommodate the new scale
-        self.update_scroll_region()
+        # Apply the current scale to all elements and update the scroll region to accommodate it
+        self.request_redraw("scale", "scroll_region")
 
         # Debug print statements
         print(f"Zoom event: scale={self.scale}, scroll_x={self.scroll_x}, scroll_y={self.scroll_y}")
-        print(f"Scroll region after zoom: {self.canvas.cget('scrollregion')}")
 
     def create_controls(self):
         control_frame = ttk.Frame(self.root, padding="10 10 10 10", relief='solid', borderwidth=1)
@@ -661,17 +957,9 @@ class WhiteboardApp:
         reload_button.pack(side=tk.LEFT, padx=5, pady=5)
 
     def take_screenshot(self):
-        # Get the canvas bounding box (scrollregion)
-        x = self.canvas.winfo_rootx() + self.canvas.winfo_x()
-        y = self.canvas.winfo_rooty() + self.canvas.winfo_y()
-        width = x + self.canvas.winfo_width()
-        height = y + self.canvas.winfo_height()
-
-        # Grab the image from the screen
-        image = ImageGrab.grab(bbox=(x, y, width, height))
-
-        # Save the image to a file
-        image.save("screenshot.png")
+        # Drawn from the board state rather than grabbed from the screen (see board_render.py), so the
+        # whole board is captured at the current zoom even if the window is hidden or scrolled
+        render_board(self.get_current_state(), "screenshot.png", self.scale)
         print("Screenshot taken and saved as screenshot.png")
 
     def show_loading_screen(self):
@@ -696,129 +984,119 @@ class WhiteboardApp:
         """Reload the board by clearing and re-reading from the JSON file."""
         print("Reloading board...")
 
+        # Make sure our own pending changes are in the file before re-reading it
+        self.flush_saves()
+        self.board_cache.invalidate()
+
         # Clear all current elements from the canvas
         self.canvas.delete("all")
 
         # Clear any data structures storing the current state
         self.employee_boxes.clear()
         self.canvas.hub_list.clear()
+        self.registry.clear()
+        self.stale_hubs.clear()
+        self.stale_boxes.clear()
+        self.hub_summaries.clear()
 
         # Reload the state from the JSON file
-        self.redraw_canvas()
         self.load_state()
 
         # Force employees to their correct positions after reloading the state
         #self.force_employees_to_correct_positions()
-        self.apply_scale()
+        self.request_redraw("scale", "scroll_region")
         self.apply_status_colors()
 
     def reload_board_spec(self, entities_to_reload=None):
-        """Reload only specific entities from the JSON file."""
+        """Reload only specific entities (hub or employee names) from the JSON file, or every change if none."""
         print("Reloading specific entities...")
 
-        if entities_to_reload is None:
-            entities_to_reload = []
-
         try:
             # Load the JSON data
-            with open(self.shared_file_path, 'r') as f:
-                data = json.load(f)
+            data = self.board_cache.get()
         except Exception as e:
             print(f"Error reading JSON file: {e}")
             return
 
-        # Reload job site hubs
-        for job_site in data["job_sites"]:
-            job_site_name = job_site["name"]
-
-            if job_site_name in entities_to_reload or not entities_to_reload:
-                print(f"Reloading job site hub: {job_site_name}")
-                hub = self.find_job_site_hub_by_name(job_site_name)
-
-                if hub:
-                    # Update the hub's position and occupation status
-                    hub.set_position(job_site["x"], job_site["y"])
-                    hub.set_occupation_status(job_site["status"])
-
-        # Reload employees
-        for emp in data["employees"]:
-            employee_name = emp["text"]
-
-            if employee_name in entities_to_reload or not entities_to_reload:
-                print(f"Reloading employee: {employee_name}")
-                employee_box = self.find_employee_box_by_name(employee_name)
+        diff = diff_boards(self.get_current_state(), data)
+        if diff is None:
+            return
 
-                if employee_box:
-                    # Update the employee's position and any other relevant attributes
-                    self.canvas.coords(employee_box.id, emp["x"], emp["y"])
-                    employee_box.update_attributes(emp)
-                    employee_box.snap_to_box()
+        if entities_to_reload:
+            names = set(entities_to_reload)
+            diff = {
+                "hub_renames": [r for r in diff["hub_renames"] if names & set(r)],
+                "employees_removed": [key for key in diff["employees_removed"] if key[0] in names],
+                "hubs_removed": [name for name in diff["hubs_removed"] if name in names],
+                "hubs_added": [(i, job) for i, job in diff["hubs_added"] if job["name"] in names],
+                "employees_changed": [(key, emp) for key, emp in diff["employees_changed"] if key[0] in names],
+                "employees_added": [(i, emp) for i, emp in diff["employees_added"] if emp["text"] in names],
+                "notes": [n for n in diff["notes"] if n[0] in names],
+                "collapsed": [c for c in diff["collapsed"] if c[0] in names],
+            }
+        self.apply_board_diff(diff)
 
         # Adjust the canvas view if necessary
-        self.update_scroll_region()
+        self.request_redraw("scroll_region")
 
     def find_employee_box_by_name(self, name):
         """Find an employee box by name."""
-        for box in self.employee_boxes:
-            if box.text == name:
-                return box
-        return None
-
-    def reload_board_twice(self):
-        """Reload the board by executing the reload process twice."""
-        print("Reloading board twice...")
-        self.reload_board()  # First reload
-        self.reload_board()  # Second reload
-
-        # After reloading, delay for 2 seconds before taking the screenshot
-        if not self.is_loading:
-            self.root.after(2000, self.take_screenshot)  # 2000 milliseconds = 2 seconds
+        boxes = self.registry.boxes_named(name)
+        return boxes[0] if boxes else None
 
     def on_listbox_select(self, event):
-        selected_indices = self.unassigned_listbox.curselection()
-        if selected_indices:
-            selected_index = selected_indices[0]
-            employee_name = self.unassigned_listbox.get(selected_index)
-            self.scroll_to_employee(employee_name)
+        selected = self.unassigned_listbox.selection()
+        if selected:
+            employee_name = selected.text
+            self.scroll_to_employee(employee_name, selected)
 
             # Find all corresponding boxes with the same name and change their colors
-            for box in self.employee_boxes:
-                if box.text == employee_name:
-                    original_color = self.canvas.itemcget(box.id, "fill")  # Get the original color
-                    self.canvas.itemconfig(box.id, fill="red")  # Change the color to red
-                    self.canvas.itemconfig(box.circle_id, outline="black")  # Update the circle outline
+            for box in self.registry.boxes_named(employee_name):
+                original_color = self.canvas.itemcget(box.id, "fill")  # Get the original color
+                self.canvas.itemconfig(box.id, fill="red")  # Change the color to red
+                self.canvas.itemconfig(box.circle_id, outline="black")  # Update the circle outline
 
-                    # Optionally, reset the color after a short delay for each box
-                    self.root.after(2000, lambda b=box, c=original_color: self.reset_box_color(b, c))
+                # Optionally, reset the color after a short delay for each box
+                self.root.after(2000, lambda b=box, c=original_color: self.reset_box_color(b, c))
 
     def reset_box_color(self, box, original_color):
         """Reset the box color to its original color."""
         self.canvas.itemconfig(box.id, fill=original_color)
         self.canvas.itemconfig(box.circle_id, outline=original_color)
 
-    def scroll_to_employee(self, employee_name):
-        # Ensure the scrollregion is set
-        self.canvas.config(scrollregion=self.canvas.bbox("all"))
+    def scroll_to_employee(self, employee_name, box=None):
+        """Center the window on `box`, or on the first employee called `employee_name` (unassigned ones first)."""
+        if box is None:
+            boxes = self.registry.boxes_named(employee_name)
+            box = next((b for b in boxes if not b.current_snap_box), boxes[0] if boxes else None)
+        if box is None:
+            return
 
-        # Access the scrollregion correctly
-        scrollregion = self.canvas.cget("scrollregion").split()
-        if len(scrollregion) == 4:
-            scrollregion_bottom = int(scrollregion[3])
+        hub = box.current_snap_box["hub"] if box.current_snap_box else None
+        if hub and self.summary_mode:
+            x, y = self.canvas.coords(hub.id)[:2]  # Employees are hidden; go to their hub
         else:
-            scrollregion_bottom = 1  # Default to avoid division by zero
+            if hub in self.stale_hubs:
+                # Off-screen hubs aren't laid out (see refresh_view); put the employee where it belongs first
+                self.refresh_hub(hub)
+            x, y = self.canvas.coords(box.id)
 
-        # Perform the scrolling
-        for box in self.employee_boxes:
-            if box.text == employee_name and not box.current_snap_box:
-                self.canvas.yview_moveto(box.canvas.coords(box.id)[1] / scrollregion_bottom)
-                break
+        # Ensure the scrollregion is set
+        self.canvas.config(scrollregion=self.canvas.bbox("all"))
+        x1, y1, x2, y2 = self.canvas.bbox("all")
+        width, height = max(1, x2 - x1), max(1, y2 - y1)
+        self.canvas.xview_moveto((x - x1 - self.canvas.winfo_width() / 2) / width)
+        self.canvas.yview_moveto((y - y1 - self.canvas.winfo_height() / 2) / height)
 
     def update_unassigned_employees(self):
-        self.unassigned_listbox.delete(0, tk.END)
-        for box in self.employee_boxes:
-            if not box.current_snap_box:
-                self.unassigned_listbox.insert(tk.END, box.text)
-        self.unassigned_listbox.bind('<<ListboxSelect>>', self.on_listbox_select)
+        # Callers often change several employees in a row; the list is brought up to date once, when Tk is idle
+        if not self.listbox_refresh_pending:
+            self.listbox_refresh_pending = True
+            self.root.after_idle(self.refresh_unassigned_employees)
+
+    def refresh_unassigned_employees(self):
+        self.listbox_refresh_pending = False
+        self.update_employee_listbox()  # Same search and filters as typing in the search box
 
     def open_add_employee_dialog(self, prefill_data=None):
         add_employee_popup = tk.Toplevel(self.canvas)
@@ -847,7 +1125,7 @@ class WhiteboardApp:
         tk.Label(role_frame, text="Role:").pack(side=tk.LEFT)
         role_var = tk.StringVar()
         role_var.set("PM")
-        roles = ["PM", "GM", "Foreman", "Super", "Electrician", "Fire Alarm Electrician", "Roughing Electrician"]
+        roles = ["PM", "GM", "Foreman", "Super", *ELECTRICIAN_ROLES]
         role_dropdown = tk.OptionMenu(role_frame, role_var, *roles,
                                       command=lambda value: self.update_skill_dropdown(value, skills_var,
                                                                                        skills_dropdown))
@@ -1033,7 +1311,9 @@ class WhiteboardApp:
                              nj_ny_certified, current_status, electrician_rank, add_employee_popup):
         if name and role:
             box = self.employee_boxes[index]
+            old_name = box.text
             box.text = name
+            self.registry.rename_box(box, old_name)
             box.role = role
             box.phone = phone
             box.skills = [skill]
@@ -1044,15 +1324,16 @@ class WhiteboardApp:
             box.current_status = current_status
             box.electrician_rank = electrician_rank
             box.color = ROLE_COLORS.get(role, "black")
+            self.registry.box_edited(box)
 
-            if role in ("Electrician", "Fire Alarm Electrician", "Roughing Electrician"):
+            if role in ELECTRICIAN_ROLES:
                 self.canvas.itemconfig(box.id, text=box.get_display_text())
             elif role in ("PM", "GM", "Foreman"):
                 self.canvas.itemconfig(box.id, text=box.get_display_text_supers())
 
             self.canvas.itemconfig(box.circle_id, fill=box.color, outline=box.color)
             self.update_unassigned_employees()
-            self.save_state()
+            self.save_state("edit", box=box)
         add_employee_popup.destroy()
         self.apply_status_colors()
 
@@ -1060,43 +1341,45 @@ class WhiteboardApp:
                      sst_card="No", nj_ny_certified="NJ", electrician_rank="1", certifications=None,
                      worker_status="Journeyman", current_status = None):
         if name and role:
-            # Use default position if x or y is not provided
+            # Use default position if x or y is not provided (x and y are board coordinates)
             if x is None:
                 x = self.default_x
             if y is None:
                 y = self.default_y + len(self.employee_boxes) * 30
+            x, y = self.view.to_canvas(x, y)
             # Create a new DraggableBox with the provided attributes
             draggable_box = DraggableBox(
                 self, self.canvas, name, role, x, y, phone, job_site, box, skills, sst_card,
                 nj_ny_certified, electrician_rank, certifications, worker_status, current_status
             )
             # Update the display text based on role
-            if role in ("Electrician", "Fire Alarm Electrician", "Roughing Electrician"):
+            if role in ELECTRICIAN_ROLES:
                 self.canvas.itemconfig(draggable_box.id, text=draggable_box.get_display_text())
             else:
                 self.canvas.itemconfig(draggable_box.id, text=draggable_box.get_display_text_supers())
 
             self.employee_boxes.append(draggable_box)
-            self.update_scroll_region()
-            self.update_employee_position(name, job_site, box, draggable_box.id)
+            self.registry.add_box(draggable_box)
+            self.request_redraw("scroll_region")
+            self.update_employee_position(name, job_site, box, draggable_box.id)  # Saves the new employee
             self.update_unassigned_employees()
-            self.save_state()
             self.apply_status_colors()
 
     def delete_employee(self):
-        selected_indices = self.unassigned_listbox.curselection()
-        if selected_indices:
-            selected_index = selected_indices[0]
-            employee_name = self.unassigned_listbox.get(selected_index)
-            for box in self.employee_boxes:
-                if box.text == employee_name and not box.current_snap_box:
+        selected = self.unassigned_listbox.selection()
+        if selected:
+            employee_name = selected.text
+            for box in self.registry.boxes_named(employee_name):
+                if not box.current_snap_box:
                     # Save coordinates before deleting the box
-                    box_coords = self.canvas.coords(box.id)
+                    box_coords = self.view.to_board(*self.canvas.coords(box.id)[:2])
                     self.canvas.delete(box.id)
                     self.canvas.delete(box.circle_id)
                     self.employee_boxes.remove(box)
+                    self.registry.remove_box(box)
+                    self.journaled_hubs.pop(box.id, None)
                     self.update_unassigned_employees()
-                    self.save_state()
+                    self.save_state("delete_employee", key=box.key)
                     self.last_deleted_employee = {
                         "name": box.text, "role": box.role, "phone": box.phone,
                         "x": box_coords[0],
@@ -1112,19 +1395,19 @@ class WhiteboardApp:
             self.last_deleted_employee = None
 
     def copy_employee(self):
-        selected_indices = self.unassigned_listbox.curselection()
-        if selected_indices:
-            selected_index = selected_indices[0]
-            employee_name = self.unassigned_listbox.get(selected_index)
-            for box in self.employee_boxes:
-                if box.text == employee_name and not box.current_snap_box:
+        selected = self.unassigned_listbox.selection()
+        if selected:
+            employee_name = selected.text
+            for box in self.registry.boxes_named(employee_name):
+                if not box.current_snap_box:
                     # Create a copy of the employee with all attributes
+                    x, y = self.view.to_board(*self.canvas.coords(box.id)[:2])
                     self.add_employee(
                         name=f"{box.text}",
                         role=box.role,
                         phone=box.phone,
-                        x=self.canvas.coords(box.id)[0],
-                        y=self.canvas.coords(box.id)[1] + GRID_SIZE,
+                        x=x,
+                        y=y + GRID_SIZE,
                         job_site=None,  # No job site assignment for the new copy
                         box=None,  # No snap box for the new copy
                         skills=box.skills,
@@ -1135,7 +1418,7 @@ class WhiteboardApp:
                         worker_status=box.worker_status,
                         current_status=box.current_status
                     )
-                    self.apply_scale()
+                    self.request_redraw("scale")
                     break
 
     def set_default_coordinates(self, x, y):
@@ -1156,15 +1439,17 @@ class WhiteboardApp:
         if status:
             hub.set_occupation_status(status)
         self.canvas.hub_list.append(hub)
+        self.registry.add_hub(hub)
         self.canvas.tag_raise(hub.text_id)
-        self.bring_employee_names_to_front()
-        self.update_scroll_region()
-        self.save_state()
-        self.redraw_canvas()  # Redraw the canvas
-        self.apply_scale()
+        self.save_state("hub_add", hubs=[hub])
+        self.request_redraw("layout")  # Redraw the canvas
 
     def bring_employee_names_to_front(self):
+        on_screen = self.visible_items()
         for box in self.employee_boxes:
+            if box.id not in on_screen:
+                self.stale_boxes.add(box)
+                continue
             self.canvas.tag_raise(box.id)
             self.canvas.tag_raise(box.circle_id)
             # Adjust circle size for draggable boxes
@@ -1185,15 +1470,44 @@ class WhiteboardApp:
         print(f"Update scroll region: scrollregion={self.canvas.cget('scrollregion')}")
 
     def on_resize(self, event):
+        # The binding on root also sees every child widget's <Configure>; only the window and canvas matter
+        if event.widget not in (self.root, self.canvas):
+            return
         # Save the current scroll region
         self.saved_scroll_region = self.canvas.cget('scrollregion')
 
-        self.redraw_canvas()
-        self.apply_scale()  # Apply the current scale whenever the window is resized
+        self.request_redraw("layout")  # Apply the current scale whenever the window is resized
+
+    def request_redraw(self, *kinds):
+        """Ask for "layout" (redraw_canvas), "scale" (apply_scale), "scroll_region" and/or "summary" work.
+
+        Nothing is drawn right away: every request made before Tk next goes
+        idle is merged into a single pass, so a burst of resize, focus and
+        zoom events costs one redraw.
+        """
+        self.redraw_requests.update(kinds)
+        self.redraw_request_count += 1
+        if self.redraw_after_id is None:
+            self.redraw_after_id = self.root.after_idle(self.run_redraw)
+
+    def run_redraw(self):
+        kinds, count = self.redraw_requests, self.redraw_request_count
+        self.redraw_requests, self.redraw_request_count, self.redraw_after_id = set(), 0, None
+
+        self.update_detail_level()
+        if "layout" in kinds:
+            self.redraw_canvas()  # Also rescales and updates the scroll region
+        else:
+            if "scale" in kinds:
+                self.apply_scale()
+            if "scroll_region" in kinds:
+                self.update_scroll_region()
+        if self.summary_mode:
+            self.update_hub_summaries(relayout="layout" in kinds)
 
         # Debug print statements
-        print(f"Resize event: canvas width={self.canvas.winfo_width()}, canvas height={self.canvas.winfo_height()}")
-        print(f"Scroll region after resize: {self.canvas.cget('scrollregion')}")
+        print(f"Redraw pass: {count} requests merged ({', '.join(sorted(kinds))}), "
+              f"canvas width={self.canvas.winfo_width()}, canvas height={self.canvas.winfo_height()}")
 
     def on_mouse_wheel(self, event):
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
@@ -1202,10 +1516,8 @@ class WhiteboardApp:
         self.canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
 
     def find_circle(self, employee_id):
-        for box in self.employee_boxes:
-            if box.id == employee_id:
-                return box.circle_id
-        return None
+        box = self.registry.box(employee_id)
+        return box.circle_id if box else None
 
     def reposition_unassigned_employees(self):
         for index, box in enumerate(self.employee_boxes):
@@ -1214,18 +1526,14 @@ class WhiteboardApp:
                 y = DEFAULT_EMPLOYEE_Y + (index * GRID_SIZE)
                 x = (x // GRID_SIZE) * GRID_SIZE
                 y = (y // GRID_SIZE) * GRID_SIZE
+                x, y = self.view.to_canvas(x, y)
                 self.canvas.coords(box.id, x, y)
                 self.canvas.coords(box.circle_id, x - 15, y, x - 5, y + 10)
 
     def restore_boxes(self):
         for hub in self.canvas.hub_list:
-            hub.pm_occupied = False
-            hub.gm_occupied = False
-            hub.foreman_occupied = False
-            hub.electrician_occupied = []
-            for box in self.employee_boxes:
-                if box.current_snap_box and box.current_snap_box["hub"] == hub:
-                    box.current_snap_box = None
+            for box in hub.clear_occupants():
+                box.current_snap_box = None
         self.update_unassigned_employees()
 
     # In WhiteboardApp class
@@ -1233,75 +1541,193 @@ class WhiteboardApp:
     def find_job_site_hub_at_position(self, x, y):
         overlapping = self.canvas.find_overlapping(x, y, x, y)
         for item in overlapping:
-            for hub in self.canvas.hub_list:
-                if hub.id == item:
-                    return hub
+            hub = self.registry.hub(item)
+            if hub:
+                return hub
         return None
 
-    def save_state(self):
+    def sync_supervisor_role(self, box):
+        """If someone is physically in a supervisory box, their role follows the box."""
+        if box.current_snap_box and box.current_snap_box["box"] in ("PM", "GM", "Foreman", "Super"):
+            box.role = box.current_snap_box["box"]
+
+    def employee_record(self, box):
+        """Build the saved JSON record for a single employee."""
+        coords = self.view.to_board(*self.canvas.coords(box.id)[:2])
+        return {
+            "key": box.key,
+            "text": box.text,
+            "role": box.role,
+            "phone": box.phone,
+            "skills": box.skills,
+            "sst_card": box.sst_card,
+            "nj_ny_certified": box.nj_ny_certified,
+            "electrician_rank": box.electrician_rank,
+            "certifications": box.certifications,
+            "worker_status": box.worker_status,
+            "current_status": box.current_status,
+            "job_site": box.current_snap_box["hub"].text if box.current_snap_box else None,
+            "box": box.current_snap_box["box"] if box.current_snap_box else None,
+            "x": coords[0],
+            "y": coords[1]
+        }
+
+    def hub_record(self, hub):
+        """Build the saved JSON record for a single job site hub."""
+        coords = self.view.to_board(*self.canvas.coords(hub.id)[:2])
+        return {
+            "name": hub.text,
+            "x": coords[0],
+            "y": coords[1],
+            "status": hub.get_occupation_status(),
+            "note": self.job_notes.get(hub.text, {}).get("note", ""),
+        }
+
+    def save_state(self, op=None, box=None, hubs=(), **fields):
         """
         Save the current state of the application, ensuring that if someone
         is physically in the 'Super' box, their role is also set to 'Super'.
+
+        In journal mode a change described by `op` (move, assign, edit, note,
+        hub_add, hub_rename, hub_erase, delete_employee) is appended to the
+        journal instead of rewriting the whole file; with a SQLite board it
+        updates just the affected rows. Without `op`, or when neither is in
+        use, the full board is written as a snapshot. Snapshots
+        are deferred to the next idle moment, so a burst of saves from one user
+        action produces a single write. If the change cannot be journaled, a
+        snapshot is written instead so it is not lost.
+
+        While the rest of the board fills in after loading, changes are
+        journaled as usual; a snapshot (or undo state) of the half-built board
+        would drop what is not drawn yet, so those wait until it has filled in.
         """
+        if self.is_loading or self.is_filling:
+            return
+
+        if (self.journal or self.store) and op:
+            try:
+                self.record_change(op, box, hubs, **fields)
+            except Exception as e:
+                print(f"Error journaling change, saving a snapshot instead: {e}")
+            else:
+                if not self.undo_pending:
+                    self.undo_pending = True
+                    self.root.after_idle(self.push_undo_state)
+                return
+
+        if not self.save_pending:
+            self.save_pending = True
+            self.root.after_idle(self.write_snapshot)
+
+    def write_snapshot(self):
+        """Build the full board state and hand it to the background writer."""
+        if not self.save_pending or self.loader:
+            return  # Nothing to write, or the loader writes it once the board has filled in
+        self.save_pending = False
         if self.is_loading:
+            # The board is being rebuilt from the file; there is nothing to save yet
             return
 
         try:
             # 1. Sync role & box for supervisory roles (PM, GM, Foreman, Super)
-            for box in self.employee_boxes:
-                if box.current_snap_box and box.current_snap_box["box"] in ("PM", "GM", "Foreman", "Super"):
-                    box.role = box.current_snap_box["box"]
+            for employee in self.employee_boxes:
+                self.sync_supervisor_role(employee)
 
             # 2. Now build your JSON as usual
             current_state = self.get_current_state()
-            if len(self.undo_stack) >= self.MAX_HISTORY:
-                self.undo_stack.pop(0)
-            self.undo_stack.append(current_state)
-            self.redo_stack.clear()
-
-            state = {
-                "employees": [
-                    {
-                        "text": box.text,
-                        "role": box.role,
-                        "phone": box.phone,
-                        "skills": box.skills,
-                        "sst_card": box.sst_card,
-                        "nj_ny_certified": box.nj_ny_certified,
-                        "electrician_rank": box.electrician_rank,
-                        "certifications": box.certifications,
-                        "worker_status": box.worker_status,
-                        "current_status": box.current_status,
-                        "job_site": box.current_snap_box["hub"].text if box.current_snap_box else None,
-                        "box": box.current_snap_box["box"] if box.current_snap_box else None,
-                        "x": self.canvas.coords(box.id)[0],
-                        "y": self.canvas.coords(box.id)[1]
-                    }
-                    for box in self.employee_boxes
-                ],
-                "job_sites": [
-                    {
-                        "name": hub.text,
-                        "x": self.canvas.coords(hub.id)[0],
-                        "y": self.canvas.coords(hub.id)[1],
-                        "status": hub.get_occupation_status(),
-                        "note": self.job_notes.get(hub.text, {}).get("note", ""),
-                    }
-                    for hub in self.canvas.hub_list
-                ],
-                "scale": self.scale,
-                "canvas_transform": self.canvas_transform,
-                "scroll_x": self.scroll_x,
-                "scroll_y": self.scroll_y
-            }
+            self.push_undo_state(current_state)
 
-            with open(self.shared_file_path, 'w') as f:
-                json.dump(state, f, indent=4)
-            print(f"State saved: {state}")
+            state = dict(current_state)
+            if self.journal:
+                state["journal_seq"] = self.journal.seq
+
+            # Serialization happens on the writer thread
+            self.board_cache.store(state)
+            if self.store:
+                # Only the rows that changed since the last write (save() rewrites everything, for imports)
+                self.writer.call(lambda: self.store.update(state), key=self.shared_file_path)
+            else:
+                # Teammates on builds from before BoardView read "scale" and canvas x/y from the same file
+                self.writer.replace(self.shared_file_path,
+                                    lambda: self.serializer.iter_chunks(with_legacy_coordinates(state)))
+            if self.binary_snapshot_path:
+                self.writer.replace(self.binary_snapshot_path, lambda: encode_snapshot(state))
+            if self.history:
+                self.writer.call(lambda: self.record_history(state), key="history")
+            print(f"State saved: {len(state['employees'])} employees, {len(state['job_sites'])} job sites")
+
+            # Everything journaled so far is now part of the snapshot
+            if self.journal:
+                self.journal.truncate()
 
         except Exception as e:
             print(f"Error saving state: {e}")
 
+    def push_undo_state(self, state=None):
+        """Put the board as it is now on the undo stack (a new change also ends any redo)."""
+        if state is None and self.loader:
+            return  # The board is still filling in; the loader pushes it when done
+        pending, self.undo_pending = self.undo_pending, False
+        if state is None:
+            if not pending or self.is_loading:
+                return  # Already pushed by a snapshot, or the board is being rebuilt
+            state = self.get_current_state()
+        if len(self.undo_stack) >= self.MAX_HISTORY:
+            self.undo_stack.pop(0)
+        self.undo_stack.append(state)
+        self.redo_stack.clear()
+
+    def record_history(self, state):
+        """Add a saved board to the history. Runs on the writer thread."""
+        if HISTORY_MODE == "daily" and self.history.has_version_on(date.today()):
+            return
+        version = self.history.record(state, kind="checkpoint" if HISTORY_MODE == "daily" else "save")
+        if version:
+            print(f"Board history: saved version {version}")
+
+    def flush_saves(self, timeout=None):
+        """Write any deferred snapshot now and wait until it is on disk."""
+        self.write_snapshot()
+        return self.writer.flush(timeout)
+
+    def record_change(self, op, box=None, hubs=(), **fields):
+        """Append one change to the journal (or the database), compacting the journal once it grows too large."""
+        if box is not None:
+            self.sync_supervisor_role(box)
+            fields["key"] = box.key
+            fields["employee"] = self.employee_record(box)
+
+        touched = []
+        for hub in hubs:
+            if hub in self.canvas.hub_list and hub not in touched:
+                touched.append(hub)
+        if touched:
+            fields["hubs"] = [self.hub_record(hub) for hub in touched]
+
+        if self.store:
+            record = dict(fields, op=op)
+            self.writer.call(lambda: self.store.apply(record))
+            self.board_cache.apply(record)
+            print(f"Stored change: {op}")
+            return
+
+        record = self.journal.append(op, **fields)
+        self.board_cache.apply(record)
+        print(f"Journaled change: {op} (seq {record['seq']}, {self.journal.record_count} pending)")
+
+        if self.journal.needs_compaction(JOURNAL_COMPACT_RECORDS, JOURNAL_COMPACT_BYTES):
+            self.compact_journal()
+
+    def compact_journal(self):
+        """Fold the journal back into a full snapshot of the board."""
+        print(f"Compacting journal ({self.journal.record_count} records)")
+        self.save_state()
+
+    def scheduled_journal_compaction(self):
+        if self.journal.record_count and not self.is_loading:
+            self.compact_journal()
+        self.root.after(JOURNAL_COMPACT_INTERVAL, self.scheduled_journal_compaction)
+
     def undo(self):
         if not self.undo_stack:
             messagebox.showinfo("Undo", "No actions to undo.")
@@ -1338,6 +1764,8 @@ class WhiteboardApp:
 
     def load_state_from_data(self, state):
         """Load the given state data into the application."""
+        if self.loader:
+            self.loader.cancel()
         self.is_loading = True
         self.show_loading_screen()
         try:
@@ -1345,7 +1773,12 @@ class WhiteboardApp:
             self.canvas.delete("all")
             self.employee_boxes.clear()
             self.canvas.hub_list.clear()
+            self.registry.clear()
+            self.stale_hubs.clear()
+            self.stale_boxes.clear()
+            self.hub_summaries.clear()
             self.job_notes.clear()
+            self.view = BoardView.from_state(state)
 
             job_site_dict = {}
 
@@ -1375,8 +1808,7 @@ class WhiteboardApp:
                 print(f"Loading employee: {emp['text']}")
                 job_site_name = emp.get("job_site")
                 box_type = emp.get("box")
-                x = emp.get("x", self.default_x)
-                y = emp.get("y", self.default_y)
+                x, y = self.employee_canvas_position(emp)
 
                 # Retrieve the job site hub from the dictionary if it exists
                 job_site_hub = job_site_dict.get(job_site_name)
@@ -1398,20 +1830,20 @@ class WhiteboardApp:
                     electrician_rank=emp.get("electrician_rank", "0"),
                     certifications=emp.get("certifications", []),
                     worker_status=emp.get("worker_status", "Journeyman"),
-                    current_status=emp.get("current_status", "On-site")
+                    current_status=emp.get("current_status", "On-site"),
+                    key=emp.get("key")
                 )
                 self.employee_boxes.append(draggable_box)
+                self.registry.add_box(draggable_box)
 
                 if job_site_hub and box_type:
                     print(f"Assigning {emp['text']} to {job_site_name} as {box_type}")
-                    job_site_hub.update_occupation(box_type, True, draggable_box.id)
+                    job_site_hub.update_occupation(box_type, True, draggable_box)
                     draggable_box.snap_to_box()
 
                 print(f"Added employee: {emp['text']} at ({x}, {y})")
 
-            # Load the scale and canvas transformation
-            self.scale = state.get("scale", 1.0)
-            self.canvas_transform = state.get("canvas_transform", (0, 0))
+            # Load the scroll position (the zoom came with the view above)
             self.scroll_x = state.get("scroll_x", 0)
             self.scroll_y = state.get("scroll_y", 0)
 
@@ -1432,35 +1864,9 @@ class WhiteboardApp:
     def get_current_state(self):
         """Capture the current state of the application."""
         state = {
-            "employees": [
-                {
-                    "text": box.text,
-                    "role": box.role,
-                    "phone": box.phone,
-                    "skills": box.skills,
-                    "sst_card": box.sst_card,
-                    "nj_ny_certified": box.nj_ny_certified,
-                    "electrician_rank": box.electrician_rank,
-                    "certifications": box.certifications,
-                    "worker_status": box.worker_status,
-                    "current_status": box.current_status,
-                    "job_site": box.current_snap_box["hub"].text if box.current_snap_box else None,
-                    "box": box.current_snap_box["box"] if box.current_snap_box else None,
-                    "x": self.canvas.coords(box.id)[0],
-                    "y": self.canvas.coords(box.id)[1]
-                } for box in self.employee_boxes
-            ],
-            "job_sites": [
-                {
-                    "name": hub.text,
-                    "x": self.canvas.coords(hub.id)[0],
-                    "y": self.canvas.coords(hub.id)[1],
-                    "status": hub.get_occupation_status(),
-                    "note": self.job_notes.get(hub.text, {}).get("note", ""),
-                } for hub in self.canvas.hub_list
-            ],
-            "scale": self.scale,
-            "canvas_transform": self.canvas_transform,
+            "employees": [self.employee_record(box) for box in self.employee_boxes],
+            "job_sites": [self.hub_record(hub) for hub in self.canvas.hub_list],
+            "view": self.view.to_state(),
             "scroll_x": self.scroll_x,
             "scroll_y": self.scroll_y
         }
@@ -1469,104 +1875,253 @@ class WhiteboardApp:
     def load_state(self):
         """
         Load the state from JSON, including 'Super' role employees, and rebuild the board.
+
+        The hubs in view (and their employees) are drawn before the loading
+        screen is lifted; the rest of the board fills in progressively.
         """
+        self.flush_saves()
+        if self.loader:
+            self.loader.cancel()
         self.is_loading = True  # Start loading
         self.show_loading_screen()  # Show loading screen
         try:
-            with open(self.shared_file_path, 'r') as f:
-                state = json.load(f)
-            print("State loaded from JSON:")
-            print(json.dumps(state, indent=4))
+            state = self.board_cache.get()
+            self.board_cache.mark_synced()  # The board is rebuilt from scratch, nothing left to diff
+            if self.journal:
+                self.journal.resume(state)  # Number new records after the ones the board already contains
+            print(f"State loaded from JSON: {len(state['employees'])} employees, {len(state['job_sites'])} job sites")
 
-            job_site_dict = {}
+            # 1. Restore zoom; everything is drawn straight at the saved view
+            self.view = BoardView.from_state(state)
+            self.invalidate_layout()
 
-            # 1. Re-add job sites
-            for job in state["job_sites"]:
-                print(f"Loading job site: {job['name']}")
-                # Ensure defaults if missing
-                job["status"].setdefault("Electrician", [])
-                job["status"].setdefault("Super", False)  # If you have a dedicated 'Super' field
+            self.fonts.set_scale(self.scale)
 
-                hub = self.add_job_site_hub(
-                    job_site=job["name"],
-                    x=job["x"],
-                    y=job["y"],
-                    status=job.get("status", {
-                        "PM": False,
-                        "GM": False,
-                        "Foreman": False,
-                        "Super": False,
-                        "Electrician": []
-                    })
-                )
-                job_site_dict[job["name"]] = hub
+            # 2. Draw the job sites in view and the employees assigned to them
+            self.journaled_hubs = {}  # Refilled by the loader as employees are placed
+            self.loader = ProgressiveBoardLoader(self, state)
+            self.loader.draw_visible()
 
-                # Load notes
-                if job.get("note"):
-                    self.job_notes[job["name"]] = {"note": job["note"], "id": None}
+            # Restore scroll
+            self.scroll_x = state.get("scroll_x", 0)
+            self.scroll_y = state.get("scroll_y", 0)
+            self.apply_scale()
 
-            # 2. Re-add employees (including 'Super')
-            for emp in state["employees"]:
-                print(f"Loading employee: {emp['text']}")
-                job_site_name = emp.get("job_site")
-                box_type = emp.get("box")
-                x = emp.get("x", self.default_x)
-                y = emp.get("y", self.default_y)
+            # 3. Let the user in, then create everything else in the background
+            self.is_loading = False  # Changes made from here on are saved (see save_state)
+            self.close_loading_screen()
+            self.loader.continue_in_background()
 
-                job_site_hub = job_site_dict.get(job_site_name)
+        except Exception as e:
+            print(f"Error loading state: {e}")
+            self.loader = None
+            self.is_loading = False
+            self.close_loading_screen()
 
-                # Create the DraggableBox with the role from JSON
-                draggable_box = DraggableBox(
-                    app=self,
-                    canvas=self.canvas,
-                    text=emp["text"],
-                    role=emp.get("role", "PM"),  # If 'Super' is in JSON, this sets role='Super'
-                    x=x,
-                    y=y,
-                    phone=emp.get("phone", ""),
-                    job_site=job_site_name,
-                    box=box_type,
-                    skills=emp.get("skills", []),
-                    sst_card=emp.get("sst_card", "No"),
-                    nj_ny_certified=emp.get("nj_ny_certified", "NJ"),
-                    electrician_rank=emp.get("electrician_rank", "0"),
-                    certifications=emp.get("certifications", []),
-                    worker_status=emp.get("worker_status", "Journeyman"),
-                    current_status=emp.get("current_status", "On-site")
-                )
-                self.employee_boxes.append(draggable_box)
+    def read_board_file(self):
+        """Parse the shared file and replay any journaled changes on top of it."""
+        if self.store:
+            return assign_employee_keys(upgrade_board_coordinates(self.store.load()))
+        state = None
+        if self.binary_snapshot_is_current():
+            try:
+                state = read_snapshot(self.binary_snapshot_path)
+            except ValueError as e:
+                print(f"[WARNING] Ignoring binary snapshot: {e}")  # e.g. written by an older version
+        if state is None:
+            state = self.serializer.load(self.shared_file_path)
+        # Journal records are in board coordinates, so the snapshot is converted first
+        upgrade_board_coordinates(state)
+        if self.journal:
+            # Runs on the syncer thread too: replay with a journal of its own, since the Tk thread
+            # is appending to self.journal (see BoardJournal.resume)
+            journal = BoardJournal(self.shared_file_path)
+            journal.replay(state)
+            print(f"Replayed {journal.record_count} journaled changes")
+        return assign_employee_keys(state)
+
+    def binary_snapshot_is_current(self):
+        """The binary snapshot is used only if nobody has saved output.json since it was written."""
+        if not self.binary_snapshot_path or not os.path.isfile(self.binary_snapshot_path):
+            return False
+        return os.path.getmtime(self.binary_snapshot_path) >= os.path.getmtime(self.shared_file_path)
 
-                # If the employee was assigned to a specific box, reassign them
-                if job_site_hub and box_type:
-                    print(f"Assigning {emp['text']} to {job_site_name} as {box_type}")
-                    job_site_hub.update_occupation(box_type, True, draggable_box.id)
-                    draggable_box.snap_to_box()
+    def on_board_written(self):
+        """Called on the writer thread once our saves are on disk."""
+        self.board_cache.stamp()
 
-                print(f"Added employee: {emp['text']} at ({x}, {y})")
+    def apply_board_diff(self, diff):
+        """
+        Apply changes someone else made to the shared file (found by board_sync.py)
+        to the live board, touching only the employees and hubs that changed.
+        """
+        if self.loader:
+            # Diffs are against the fully loaded board; wait until it has filled in
+            self.root.after(100, self.apply_board_diff, diff)
+            return
 
-            # 3. Restore zoom/scroll
-            self.scale = state.get("scale", 1.0)
-            self.canvas_transform = state.get("canvas_transform", (0, 0))
-            self.scroll_x = state.get("scroll_x", 0)
-            self.scroll_y = state.get("scroll_y", 0)
-            self.apply_scale()
+        start = time.perf_counter()
+        self.is_loading = True  # The changes came from the file; don't save them back
+        try:
+            boxes = {box.key: box for box in self.employee_boxes}
 
-            # 4. Create sticky notes, update UI
-            self.create_sticky_notes()
-            self.update_unassigned_employees()
+            for old_name, new_name in diff["hub_renames"]:
+                hub = self.find_job_site_hub_by_name(old_name)
+                if hub:
+                    hub.text = new_name
+                    self.registry.rename_hub(hub, old_name)
+                    self.canvas.itemconfig(hub.text_id, text=hub.get_display_text())
+                if old_name in self.job_notes:
+                    self.job_notes[new_name] = self.job_notes.pop(old_name)
+
+            for key in diff["employees_removed"]:
+                box = boxes.pop(key, None)
+                if box:
+                    self.remove_employee_box(box)
+
+            for name in diff["hubs_removed"]:
+                hub = self.find_job_site_hub_by_name(name)
+                if hub:
+                    self.remove_job_site_hub(hub)
+
+            for index, job in diff["hubs_added"]:
+                self.insert_job_site_hub(index, job)
+
+            if diff["hubs_removed"] or diff["hubs_added"]:
+                self.redraw_canvas()  # Hubs are laid out by their place in the hub list
 
+            for key, emp in diff["employees_changed"]:
+                box = boxes.get(key)
+                if box:
+                    self.update_employee_box(box, emp)
+
+            for index, emp in diff["employees_added"]:
+                self.insert_employee_box(index, emp)
+
+            for name, note in diff["notes"]:
+                hub = self.find_job_site_hub_by_name(name)
+                if hub:
+                    old_icon = self.job_notes.get(name, {}).get("id")
+                    if old_icon:
+                        self.canvas.delete(old_icon)
+                    self.create_sticky_note(hub, note)
+
+            for name, collapsed in diff["collapsed"]:
+                hub = self.find_job_site_hub_by_name(name)
+                if hub:
+                    hub.collapsed = collapsed
+                    hub.update_positions(self.scale)
+
+            self.journaled_hubs = {
+                box.id: box.current_snap_box["hub"].text if box.current_snap_box else None
+                for box in self.employee_boxes
+            }
+            self.update_unassigned_employees()
+            self.apply_status_colors()
+            if self.summary_mode:
+                self.request_redraw("summary")  # Headcounts may have changed
         except Exception as e:
-            print(f"Error loading state: {e}")
+            print(f"Error applying board changes: {e}")
         finally:
             self.is_loading = False
-            self.close_loading_screen()
+        print(f"Applied board changes in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def remove_employee_box(self, box):
+        if box.current_snap_box:
+            box.current_snap_box["hub"].update_occupation(box.current_snap_box["box"], False, box)
+        self.canvas.delete(box.id)
+        self.canvas.delete(box.circle_id)
+        self.employee_boxes.remove(box)
+        self.registry.remove_box(box)
+        self.journaled_hubs.pop(box.id, None)
+
+    def remove_job_site_hub(self, hub):
+        for box in hub.clear_occupants():
+            box.current_snap_box = None
+        note_icon = self.job_notes.pop(hub.text, {}).get("id")
+        if note_icon:
+            self.canvas.delete(note_icon)
+        hub.remove()
+
+    def insert_job_site_hub(self, index, job):
+        hub = JobSiteHub(self, self.canvas, job["name"], job["x"], job["y"])
+        # Electrician slots hold canvas ids from the other client; they are refilled as employees are placed
+        hub.set_occupation_status(dict(job["status"], Electrician=[]))
+        self.canvas.hub_list.insert(index, hub)
+        self.registry.add_hub(hub)
+        self.canvas.tag_raise(hub.text_id)
+        self.create_sticky_note(hub, job.get("note", ""))
+        return hub
+
+    def insert_employee_box(self, index, emp):
+        x, y = self.employee_canvas_position(emp)
+        box = DraggableBox(
+            app=self,
+            canvas=self.canvas,
+            text=emp["text"],
+            role=emp.get("role", "PM"),
+            x=x,
+            y=y,
+            phone=emp.get("phone", ""),
+            job_site=emp.get("job_site"),
+            box=emp.get("box"),
+            skills=emp.get("skills", []),
+            sst_card=emp.get("sst_card", "No"),
+            nj_ny_certified=emp.get("nj_ny_certified", "NJ"),
+            electrician_rank=emp.get("electrician_rank", "0"),
+            certifications=emp.get("certifications", []),
+            worker_status=emp.get("worker_status", "Journeyman"),
+            current_status=emp.get("current_status", "On-site"),
+            key=emp.get("key")
+        )
+        self.employee_boxes.insert(min(index, len(self.employee_boxes)), box)
+        self.registry.add_box(box)
+        return box
+
+    def update_employee_box(self, box, emp):
+        """Bring one employee's box in line with its saved record: fields, hub/box and position."""
+        box.update_attributes(emp)
+
+        current = box.current_snap_box
+        hub = self.find_job_site_hub_by_name(emp.get("job_site"))
+        target = (hub, emp.get("box")) if hub and emp.get("box") else None
+        if current and target and (current["hub"], current["box"]) == target:
+            return
+
+        if current:
+            current["hub"].update_occupation(current["box"], False, box)
+            box.current_snap_box = None
+
+        if target:
+            box.current_snap_box = {"hub": hub, "box": emp["box"], "occupied": True}
+            hub.update_occupation(emp["box"], True, box)
+            box.snap_to_box()
+        else:
+            x1, y1 = self.canvas.coords(box.id)[:2]
+            x, y = self.employee_canvas_position(emp)
+            dx, dy = x - x1, y - y1
+            self.canvas.move(box.id, dx, dy)
+            self.canvas.move(box.circle_id, dx, dy)
+            self.canvas.itemconfig(box.id, state='normal')
+            self.canvas.itemconfig(box.circle_id, state='normal')
 
     def update_employee_position(self, name, job_site, box, employee_id):
+        employee = self.registry.box(employee_id)
         if job_site and box:
-            for hub in self.canvas.hub_list:
-                if hub.text == job_site:
-                    hub.update_occupation(box, True, employee_id)
-        self.save_state()
+            hub = self.find_job_site_hub_by_name(job_site)
+            if hub and employee:
+                hub.update_occupation(box, True, employee)
+
+        if employee is None:
+            self.save_state()
+            return
+
+        # Both the hub the employee left and the one they joined changed occupation
+        new_hub = employee.current_snap_box["hub"] if employee.current_snap_box else None
+        old_hub = self.find_job_site_hub_by_name(self.journaled_hubs.get(employee_id))
+        self.journaled_hubs[employee_id] = new_hub.text if new_hub else None
+        hubs = [hub for hub in (old_hub, new_hub) if hub]
+        self.save_state("assign" if job_site and box else "move", box=employee, hubs=hubs)
 
 
 if __name__ == "__main__":